@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+_LABEL_KEYS = ("show_value", "show_category_name", "show_series_name", "show_percentage")
+_AXIS_KEYS = ("title", "min", "max", "major_unit", "format_code")
+
+
+def _docs(slides: int, points: int) -> list[Any]:
+    from deckdown.ast import SlideDoc
+
+    colors = ("#C00000", "#1F4E79", "#70AD47")
+    docs = []
+    for i in range(1, slides + 1):
+        series = [
+            {
+                "name": f"S{s}",
+                "values": [float((k * 7 + s) % 13) for k in range(points)],
+                "color": {"resolved_rgb": colors[s]},
+                "labels": {"show_value": True, "number_format": "0.0"},
+                "points": [
+                    {"idx": k, "color": {"resolved_rgb": colors[(k + s) % 3]}}
+                    for k in range(points)
+                ],
+            }
+            for s in range(2)
+        ]
+        chart = {
+            "type": "column",
+            "categories": [f"C{k}" for k in range(points)],
+            "series": series,
+            "plot_area": {"has_data_labels": True, "has_legend": True, "legend_pos": "bottom"},
+            "axes": {"category": {"title": "Month"}, "value": {"title": "Units", "min": 0.0}},
+        }
+        bbox = {
+            "x_emu": 457200, "y_emu": 457200, "w_emu": 8229600, "h_emu": 4229100,
+            "x_norm": 0.05, "y_norm": 0.09, "w_norm": 0.9, "h_norm": 0.82,
+        }  # fmt: skip
+        shape = {"id": "c1", "kind": "chart", "bbox": bbox, "z": 0, "chart": chart}
+        payload = {
+            "slide": {
+                "index": i,
+                "size": {"width_emu": 9144000, "height_emu": 5143500},
+                "shapes": [shape],
+            }
+        }
+        docs.append(SlideDoc.model_validate(payload))
+    return docs
+
+
+def _dumped_access(docs: list[Any]) -> list[Any]:
+    """The lookups chart assembly made when every mapping access dumped its model."""
+    seen: list[Any] = []
+    for doc in docs:
+        chart = doc.slide.shapes[0].chart
+        pa = chart.plot_area
+        seen += [
+            pa.model_dump().get(key) for key in ("has_data_labels", "has_legend", "legend_pos")
+        ]
+        for ser in chart.series:
+            lab = ser.labels
+            seen += [lab.model_dump()[key] for key in _LABEL_KEYS if key in lab.model_dump()]
+            seen.append(lab.model_dump().get("number_format"))
+            for meta in ser.points or ():
+                seen.append(meta.model_dump().get("idx"))
+                seen.append((meta.model_dump().get("color") or {}).get("resolved_rgb"))
+        axes = chart.axes
+        if "category" in axes.model_dump():
+            seen.append(axes.model_dump()["category"].get("title"))
+        v = axes.model_dump()["value"]
+        seen += [v.get(key) for key in _AXIS_KEYS]
+    return seen
+
+
+def _field_access(docs: list[Any]) -> list[Any]:
+    """The same lookups through attribute access."""
+    seen: list[Any] = []
+    for doc in docs:
+        chart = doc.slide.shapes[0].chart
+        pa = chart.plot_area
+        seen += [pa.has_data_labels, pa.has_legend, pa.legend_pos]
+        for ser in chart.series:
+            lab = ser.labels
+            seen += [getattr(lab, key) for key in _LABEL_KEYS]
+            seen.append(lab.number_format)
+            for meta in ser.points or ():
+                seen.append(meta.idx)
+                seen.append(meta.color.resolved_rgb if meta.color else None)
+        axes = chart.axes
+        seen.append(axes.category.title)
+        seen += [getattr(axes.value, key) for key in _AXIS_KEYS]
+    return seen
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Assemble a deck of point-colored charts and time the AST lookups it makes"
+    )
+    ap.add_argument("--slides", type=int, default=200)
+    ap.add_argument("--points", type=int, default=24, help="points per series (2 series/chart)")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        from deckdown.assemble import DeckAssembler
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    docs = _docs(args.slides, args.points)
+    if _dumped_access(docs) != _field_access(docs):
+        print("lookup variants disagree", file=sys.stderr)
+        return 1
+    print(f"deck: {args.slides} charts x 2 series x {args.points} colored points")
+    dumped = _best_of(lambda: _dumped_access(docs), args.repeat)
+    native = _best_of(lambda: _field_access(docs), args.repeat)
+    print(
+        f"lookups  dump-per-access {dumped * 1000:8.1f} ms  field access {native * 1000:8.1f} ms"
+        f"  ({dumped / native:.0f}x)"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "charts.pptx"
+        total = _best_of(lambda: DeckAssembler().assemble(docs, out=out), args.repeat)
+    print(f"assemble {total * 1000:8.1f} ms  ({args.slides / total:,.0f} charts/s)")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+
+def _photo_data_url(width: int, height: int) -> str:
+    from PIL import Image
+
+    # Random noise compresses poorly, like a real photograph.
+    img = Image.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=90)
+    return "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def _docs(slides: int, data_urls: Sequence[str]) -> Iterator[Any]:
+    """Slides one at a time, as `MarkdownReader.iter_file` hands them to the assembler."""
+    from deckdown.ast import SlideDoc
+
+    for i in range(1, slides + 1):
+        data_url = data_urls[i % len(data_urls)]
+        payload = {
+            "slide": {
+                "index": i,
+                "size": {"width_emu": 9144000, "height_emu": 5143500},
+                "shapes": [
+                    {
+                        "id": "s1",
+                        "kind": "picture",
+                        "bbox": {
+                            "x_emu": 0,
+                            "y_emu": 0,
+                            "w_emu": 9144000,
+                            "h_emu": 5143500,
+                            "x_norm": 0.0,
+                            "y_norm": 0.0,
+                            "w_norm": 1.0,
+                            "h_norm": 1.0,
+                        },
+                        "z": 0,
+                        # a fresh str per slide, as when each JSON block is parsed from disk
+                        "image": {"media": {"data_url": data_url[:-1] + data_url[-1]}},
+                    }
+                ],
+            }
+        }
+        yield SlideDoc.model_validate(payload)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Assemble a deck whose slides repeat one full-bleed photo, with and "
+        "without the per-assembly image cache"
+    )
+    ap.add_argument("--slides", type=int, default=100)
+    ap.add_argument("--width", type=int, default=1600)
+    ap.add_argument("--height", type=int, default=900)
+    ap.add_argument("--photos", type=int, default=1, help="distinct photos cycled over slides")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        from deckdown.assemble import DeckAssembler
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    class _Uncached(DeckAssembler):
+        def _add_picture(self, slide, sh, images=None) -> None:  # noqa: ANN001
+            super()._add_picture(slide, sh, None)
+
+    data_urls = [_photo_data_url(args.width, args.height) for _ in range(args.photos)]
+    print(
+        f"deck: {args.slides} slides, {args.photos} photo(s) of "
+        f"{len(data_urls[0]) / 1e6:.1f} MB as data URL"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, assembler in (("uncached", _Uncached()), ("cached", DeckAssembler())):
+            out = Path(tmp) / f"{label}.pptx"
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            assembler.assemble(_docs(args.slides, data_urls), out=out)
+            elapsed = time.perf_counter() - t0
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{label:9s}: {elapsed * 1000:8.1f} ms  peak {peak / 1e6:7.1f} MB  "
+                f"output {out.stat().st_size / 1e6:6.1f} MB"
+            )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+
+def _make_chart_deck(path: Path, *, points: Sequence[int], colored: int) -> None:
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData, XyChartData
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+
+    prs = Presentation()
+    blank = prs.slide_layouts[6]
+    box = (Inches(0.5), Inches(0.5), Inches(9), Inches(6))
+    for n in points:
+        xy = XyChartData()
+        ser = xy.add_series("Scatter")
+        for i in range(n):
+            ser.add_data_point(i * 0.5, (i * 37) % 101)
+        prs.slides.add_slide(blank).shapes.add_chart(XL_CHART_TYPE.XY_SCATTER, *box, xy)
+
+        cd = CategoryChartData()
+        cd.categories = [f"C{i}" for i in range(n)]
+        cd.add_series("Column", [float(i % 17) for i in range(n)])
+        chart = (
+            prs.slides.add_slide(blank)
+            .shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, *box, cd)
+            .chart
+        )
+        # A handful of per-point overrides, as in highlighted bars.
+        col_ser = chart.plots[0].series[0]
+        for idx in range(0, n, max(1, n // colored)) if colored > 0 else ():
+            fill = col_ser.points[idx].format.fill
+            fill.solid()
+            fill.fore_color.rgb = RGBColor(0xC0, 0x00, 0x00)
+    prs.save(str(path))
+
+
+def _legacy_build(shape: Any, ctx: Any) -> None:  # noqa: ANN401
+    """Series/point reads of the proxy-based path this handler replaced."""
+    plots = list(shape.chart.plots)
+    if not plots:
+        return
+    [getattr(c, "label", c) for c in plots[0].categories]
+    for ser in plots[0].series:
+        tuple(ser.values or ())
+        for pt in ser.points:
+            # Unfilled points raise on fore_color; the old path swallowed that.
+            with contextlib.suppress(Exception):
+                ctx.theme.color_dict_from_colorformat(pt.format.fill.fore_color)
+
+
+def _best_of(setup: Callable[[], Any], fn: Callable[[Any], Any], repeat: int) -> float:  # noqa: ANN401
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Compare proxy-based and direct chart-XML series extraction"
+    )
+    ap.add_argument("--points", default="10,1000,50000", help="comma-separated points per series")
+    ap.add_argument("--colored", type=int, default=5, help="dPt overrides per column series")
+    ap.add_argument(
+        "--legacy-max",
+        type=int,
+        default=5000,
+        help="skip the proxy path above this many points (it is quadratic in points)",
+    )
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(list(argv) if argv is not None else None)
+    points = [int(p) for p in args.points.split(",") if p.strip()]
+
+    try:
+        from deckdown.extractors.ast import AstExtractor
+        from deckdown.extractors.handlers.chart_handler import ChartShapeHandler
+        from deckdown.loader import Loader
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    handler = ChartShapeHandler()
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "charts.pptx"
+        _make_chart_deck(deck, points=points, colored=args.colored)
+        n_slides = 2 * len(points)
+        for slide_no in range(n_slides):
+            n = points[slide_no // 2]
+            kind = "scatter" if slide_no % 2 == 0 else "column"
+
+            def setup(slide_no: int = slide_no) -> tuple[Any, Any]:  # noqa: ANN401
+                # Fresh load per run: the proxy path adds a c:dPt for every point it visits.
+                prs = Loader(deck).presentation()
+                shape = next(sh for sh in prs.slides[slide_no].shapes if handler.supports(sh))
+                return shape, AstExtractor().context(prs)
+
+            new = _best_of(setup, lambda a: handler.build(a[0], z=0, ctx=a[1]), args.repeat)
+            line = f"{kind:<7} {n:>7,} points: direct {new * 1000:9.1f} ms"
+            if n <= args.legacy_max:
+                old = _best_of(setup, lambda a: _legacy_build(*a), args.repeat)
+                line += f"  proxy {old * 1000:10.1f} ms  speedup {old / new:7.1f}x"
+            else:
+                line += "  proxy   (skipped)"
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+_BBOX = {
+    "x_emu": 914400,
+    "y_emu": 914400,
+    "w_emu": 1828800,
+    "h_emu": 914400,
+    "x_norm": 0.1,
+    "y_norm": 0.1,
+    "w_norm": 0.2,
+    "h_norm": 0.178,
+}
+
+
+def _shape(i: int) -> dict[str, Any]:
+    base = {"id": f"s{i}", "bbox": _BBOX, "z": i}
+    kind = i % 4
+    if kind == 0:
+        runs = [{"text": f"Run {i}", "font": {"size_pt": 12.0, "bold": True}}]
+        return {**base, "kind": "text_box", "text": {"paras": [{"lvl": 0, "runs": runs}]}}
+    if kind == 1:
+        return {**base, "kind": "shape_basic", "geom": "rect"}
+    if kind == 2:
+        return {**base, "kind": "line"}
+    # last member of the union: the worst case for an untagged union
+    return {**base, "kind": "group", "children": []}
+
+
+def _write_deck(path: Path, *, slides: int, shapes: int) -> None:
+    lines = ["# bench", ""]
+    n = 0
+    for s_idx in range(1, slides + 1):
+        doc = {
+            "version": "deckdown-1",
+            "slide": {
+                "index": s_idx,
+                "size": {"width_emu": 9144000, "height_emu": 5143500},
+                "shapes": [_shape(n + k) for k in range(shapes)],
+            },
+        }
+        n += shapes
+        lines += [f"## Slide {s_idx}", "", "```json", json.dumps(doc, indent=2), "```", ""]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _best_of_each(fns: Sequence[Callable[[], Any]], repeat: int) -> list[float]:
+    # Round-robin so heap growth and CPU noise hit every variant alike.
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            gc.collect()
+            t0 = time.perf_counter()
+            fn()
+            best[i] = min(best[i], time.perf_counter() - t0)
+    return best
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Measure AST decode throughput for the reader and validator"
+    )
+    ap.add_argument("--slides", type=int, default=100)
+    ap.add_argument("--shapes", type=int, default=100, help="shapes per slide")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        from pydantic import TypeAdapter
+
+        from deckdown.ast import (
+            BasicShape,
+            ChartShape,
+            GroupShape,
+            LineShape,
+            PictureShape,
+            SlideDoc,
+            TableShape,
+            TextShape,
+        )
+        from deckdown.decode import decode_slide
+        from deckdown.reader import MarkdownReader
+        from deckdown.validate import MarkdownValidator
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    total = args.slides * args.shapes
+    untagged = TypeAdapter(
+        tuple[
+            TextShape
+            | PictureShape
+            | TableShape
+            | ChartShape
+            | BasicShape
+            | LineShape
+            | GroupShape,
+            ...,
+        ]
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "deck.md"
+        _write_deck(deck, slides=args.slides, shapes=args.shapes)
+        reader = MarkdownReader()
+        text = deck.read_text(encoding="utf-8")
+        blocks = list(reader.iter_blocks(text))
+
+        def legacy_read() -> None:
+            # The former reader path: json.loads, then validation from Python dicts.
+            for body in blocks:
+                SlideDoc.model_validate(json.loads(body))
+
+        def decode() -> None:
+            for body in blocks:
+                decode_slide(body)
+
+        def untagged_shapes() -> None:
+            for body in blocks:
+                untagged.validate_python(json.loads(body)["slide"]["shapes"])
+
+        rows = [
+            ("dict path (json.loads + model_validate)", legacy_read),
+            ("untagged shape union, shapes only", untagged_shapes),
+            ("decode_slide (validate_json)", decode),
+            ("reader, incl. file scan", lambda: reader.load_file(deck)),
+            ("validator, incl. file scan", lambda: MarkdownValidator().validate_file(deck)),
+        ]
+        print(f"{args.slides} slides x {args.shapes} shapes = {total:,} shapes")
+        timings = _best_of_each([fn for _, fn in rows], args.repeat)
+        for (label, _), best in zip(rows, timings, strict=True):
+            print(f"  {label:<42} {best * 1000:8.1f} ms  {total / best:>12,.0f} shapes/s")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
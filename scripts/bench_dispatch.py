@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+
+def _make_mixed_deck(path: Path, *, slides: int) -> None:
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+    from pptx.util import Inches
+
+    prs = Presentation()
+    blank = prs.slide_layouts[6]
+    image = path.with_suffix(".png")
+    _write_png(image)
+    data = CategoryChartData()
+    data.categories = ["a", "b", "c"]
+    data.add_series("s", (1, 2, 3))
+
+    for _ in range(slides):
+        shapes = prs.slides.add_slide(blank).shapes
+        for i in range(4):
+            shapes.add_textbox(Inches(0.2), Inches(0.2 + i), Inches(3), Inches(0.5)).text = "t"
+        shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(4), Inches(0.2), Inches(1), Inches(1))
+        shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(4), Inches(2), Inches(6), Inches(2))
+        shapes.add_picture(str(image), Inches(6), Inches(0.2), Inches(1), Inches(1))
+        shapes.add_table(2, 2, Inches(0.2), Inches(5), Inches(3), Inches(1))
+        shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(5), Inches(4), Inches(3), Inches(2), data
+        )
+    prs.save(str(path))
+
+
+def _write_png(path: Path) -> None:
+    import base64
+
+    path.write_bytes(
+        base64.b64decode(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAASUVORK5CYII="
+        )
+    )
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Per-shape handler dispatch cost: linear supports() chain vs HandlerRegistry"
+    )
+    ap.add_argument("--slides", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        from deckdown.extractors.ast import AstExtractor
+        from deckdown.loader import Loader
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "mixed.pptx"
+        _make_mixed_deck(deck, slides=args.slides)
+        prs = Loader(deck).presentation()
+        shapes = [shp for slide in prs.slides for shp in slide.shapes]
+        registry = AstExtractor().walker().registry
+        handlers = registry.handlers
+
+        def linear() -> list[Any]:
+            # The pre-registry chain: every handler's supports() re-reads shape_type.
+            return [next((h for h in handlers if h.supports(s)), None) for s in shapes]
+
+        def table() -> list[Any]:
+            return [registry.handler_for(s, s.shape_type) for s in shapes]
+
+        if linear() != table():
+            print("dispatch mismatch between linear chain and registry", file=sys.stderr)
+            return 1
+        n = len(shapes)
+        before = _best_of(linear, args.repeat)
+        after = _best_of(table, args.repeat)
+        print(f"{n} shapes ({args.slides} slides)")
+        print(f"linear supports() chain: {before / n * 1e6:7.2f} µs/shape")
+        print(f"HandlerRegistry:         {after / n * 1e6:7.2f} µs/shape")
+        print(f"speedup: {before / after:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
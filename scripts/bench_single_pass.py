@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+
+def _make_text_heavy_deck(path: Path, *, slides: int, boxes: int, paras: int) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+
+    prs = Presentation()
+    for s_idx in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Slide {s_idx + 1}"
+        for b in range(boxes):
+            box = slide.shapes.add_textbox(
+                Inches(0.5 + (b % 3) * 3), Inches(1.5 + (b // 3) * 1.2), Inches(2.8), Inches(1)
+            )
+            tf = box.text_frame
+            for p_idx in range(paras):
+                p = tf.paragraphs[0] if p_idx == 0 else tf.add_paragraph()
+                p.level = p_idx % 3
+                run = p.add_run()
+                run.text = f"Paragraph {p_idx} of box {b} on slide {s_idx + 1}"
+                run.font.size = Pt(12)
+                run.font.bold = p_idx % 2 == 0
+    prs.save(str(path))
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Compare two-pass (TextExtractor + AstExtractor) and single-pass extraction"
+    )
+    ap.add_argument("--slides", type=int, default=60)
+    ap.add_argument("--boxes", type=int, default=9, help="text boxes per slide")
+    ap.add_argument("--paras", type=int, default=8, help="paragraphs per text box")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        from deckdown.extractors.ast import AstExtractor
+        from deckdown.extractors.summary import DeckSummarizer
+        from deckdown.extractors.text import TextExtractor
+        from deckdown.loader import Loader
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "text_heavy.pptx"
+        _make_text_heavy_deck(deck, slides=args.slides, boxes=args.boxes, paras=args.paras)
+
+        def two_pass() -> None:
+            prs = Loader(deck).presentation()
+            TextExtractor().extract_deck(prs, source_path=str(deck))
+            AstExtractor().extract(prs)
+
+        def single_pass() -> None:
+            prs = Loader(deck).presentation()
+            docs = AstExtractor().extract(prs)
+            DeckSummarizer().summarize_presentation(prs, docs, source_path=str(deck))
+
+        old = _best_of(two_pass, args.repeat)
+        new = _best_of(single_pass, args.repeat)
+
+    paras_total = args.slides * args.boxes * args.paras
+    print(f"deck: {args.slides} slides x {args.boxes} boxes x {args.paras} paragraphs")
+    print(f"two-pass    : {old * 1000:8.1f} ms  ({paras_total / old:,.0f} paragraphs/s)")
+    print(f"single-pass : {new * 1000:8.1f} ms  ({paras_total / new:,.0f} paragraphs/s)")
+    print(f"speedup     : {old / new:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
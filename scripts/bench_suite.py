@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import Any
+
+RESULTS_FORMAT = "deckdown-bench-2"  # -2: CPU seconds; -1 recorded wall time
+DEFAULT_BASELINE = Path(__file__).with_name("bench_baseline.json")
+PHASES = ("extract", "validate", "preview", "assemble")
+# Big enough that every phase runs for hundreds of milliseconds: on the small
+# deck scheduler noise alone swings phases by more than the slowdown threshold.
+DEFAULT_PROFILE = "medium"
+DEFAULT_REPEAT = 5
+# Short phases get extra timed runs until this much time was spent on them.
+MIN_MEASURE_S = 2.0
+MAX_REPEAT = 50
+# Differences below these floors are noise regardless of their relative size.
+DEFAULT_MIN_SLOWDOWN_MS = 50.0
+DEFAULT_MIN_MEMORY_GROWTH_MB = 1.0
+
+
+@dataclass(frozen=True)
+class DeckParams:
+    """Shape of a synthetic deck; every slide gets the same mix."""
+
+    slides: int = 10
+    shapes: int = 8  # text boxes per slide
+    table_rows: int = 5
+    table_cols: int = 4
+    chart_points: int = 12
+    images: int = 1  # pictures per slide
+    image_px: int = 320  # picture width; height is 9/16 of it
+
+
+PROFILES = {
+    "small": DeckParams(),
+    "medium": DeckParams(
+        slides=50, shapes=20, table_rows=10, table_cols=8, chart_points=50, images=2, image_px=640
+    ),
+    "large": DeckParams(
+        slides=200,
+        shapes=40,
+        table_rows=20,
+        table_cols=10,
+        chart_points=200,
+        images=3,
+        image_px=1280,
+    ),
+}
+
+
+def generate(path: Path, params: DeckParams, *, seed: int = 0) -> None:
+    """Write a synthetic .pptx with text boxes, a table, a chart and pictures on every slide."""
+    import random
+
+    from PIL import Image
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Emu, Inches, Pt
+
+    rng = random.Random(seed)  # noqa: S311 - reproducible decks, not secrets
+    prs = Presentation()
+    blank = prs.slide_layouts[6]
+    img_w, img_h = params.image_px, max(1, params.image_px * 9 // 16)
+    for s in range(1, params.slides + 1):
+        slide = prs.slides.add_slide(blank)
+        for k in range(params.shapes):
+            left = Inches(0.2 + (k % 4) * 1.2)
+            top = Inches(0.2 + (k // 4 % 6) * 0.5)
+            tf = slide.shapes.add_textbox(left, top, Inches(1.1), Inches(0.4)).text_frame
+            tf.text = f"Slide {s} box {k}"
+            run = tf.paragraphs[0].runs[0]
+            run.font.size = Pt(10 + k % 3 * 2)
+            run.font.bold = k % 2 == 0
+        if params.table_rows and params.table_cols:
+            shape = slide.shapes.add_table(
+                params.table_rows, params.table_cols, Inches(5), Inches(0.2), Inches(4.8), Inches(3)
+            )
+            for r in range(params.table_rows):
+                for c in range(params.table_cols):
+                    shape.table.cell(r, c).text = f"{rng.randint(0, 99_999):,}"
+        if params.chart_points:
+            data = CategoryChartData()
+            data.categories = [f"C{i}" for i in range(params.chart_points)]
+            for name in ("A", "B"):
+                data.add_series(name, [rng.uniform(0, 100) for _ in range(params.chart_points)])
+            slide.shapes.add_chart(
+                XL_CHART_TYPE.COLUMN_CLUSTERED,
+                Inches(0.2),
+                Inches(3.4),
+                Inches(4.6),
+                Inches(3.8),
+                data,
+            )
+        for k in range(params.images):
+            # Noise compresses poorly, like a photograph; each picture is distinct.
+            img = Image.frombytes("RGB", (img_w, img_h), rng.randbytes(img_w * img_h * 3))
+            buf = io.BytesIO()
+            img.save(buf, format="JPEG", quality=85)
+            buf.seek(0)
+            slide.shapes.add_picture(
+                buf, Inches(5 + k * 0.3), Inches(3.4 + k * 0.3), width=Emu(Inches(4.5))
+            )
+    prs.save(str(path))
+
+
+def _cli(*args: str) -> Callable[[], None]:
+    from deckdown.cli import main as deckdown_main
+
+    def run() -> None:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            code = deckdown_main(list(args))
+        if code != 0:
+            raise RuntimeError(f"deckdown {' '.join(args)} exited with {code}")
+
+    return run
+
+
+def _measure(fn: Callable[[], None], repeat: int) -> tuple[float, int]:
+    """(best CPU time of this process in seconds, tracemalloc peak in bytes).
+
+    Every phase runs in-process on one thread, so CPU time measures the work
+    without the scheduler noise of shared machines; I/O waits are excluded.
+
+    Runs `fn` at least `repeat` times, and more (up to `MAX_REPEAT`) until
+    `MIN_MEASURE_S` has been spent, so fast phases get a stable best time.
+    The peak comes from one extra traced run so tracing overhead does not
+    skew the timings.
+    """
+    best = float("inf")
+    spent = 0.0
+    runs = 0
+    while runs < repeat or (spent < MIN_MEASURE_S and runs < MAX_REPEAT):
+        t0 = time.process_time()
+        fn()
+        elapsed = time.process_time() - t0
+        best = min(best, elapsed)
+        spent += elapsed
+        runs += 1
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(params: DeckParams, *, repeat: int, phases: Sequence[str] = PHASES) -> dict[str, Any]:
+    """Time every CLI phase on a deck generated from `params`; returns a results record."""
+    from deckdown import __version__
+
+    results: dict[str, Any] = {
+        "format": RESULTS_FORMAT,
+        "deckdown": __version__,
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} cpus)",
+        "params": asdict(params),
+        "phases": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "deck.pptx"
+        md = Path(tmp) / "deck.md"
+        generate(deck, params)
+        results["deck_bytes"] = deck.stat().st_size
+        steps = {
+            "extract": _cli("extract", str(deck), "--md-out", str(md), "--log-level", "error"),
+            "validate": _cli("validate", str(md)),
+            "preview": _cli("preview", str(md), "-o", str(Path(tmp) / "deck.html")),
+            "assemble": _cli(
+                "assemble", str(md), "-o", str(Path(tmp) / "out.pptx"), "--log-level", "error"
+            ),
+        }
+        if "extract" not in phases:
+            steps["extract"]()  # later phases read its Markdown
+        for name in phases:
+            seconds, peak = _measure(steps[name], repeat)
+            results["phases"][name] = {
+                "seconds": round(seconds, 6),
+                "slides_per_s": round(params.slides / seconds, 3),
+                "peak_mb": round(peak / 1e6, 3),
+            }
+    return results
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    max_slowdown: float,
+    max_memory_growth: float,
+    min_slowdown_ms: float = DEFAULT_MIN_SLOWDOWN_MS,
+    min_memory_growth_mb: float = DEFAULT_MIN_MEMORY_GROWTH_MB,
+) -> list[str]:
+    """Regressions of `current` against `baseline`, one message per phase and metric.
+
+    A phase regresses only if it is both relatively (`max_slowdown`,
+    `max_memory_growth`) and absolutely (`min_slowdown_ms`,
+    `min_memory_growth_mb`) worse than the baseline.
+    """
+    if baseline.get("params") != current.get("params"):
+        return ["deck parameters differ from the baseline; rerun with the baseline's profile"]
+    problems: list[str] = []
+    for name, base in baseline.get("phases", {}).items():
+        cur = current.get("phases", {}).get(name)
+        if cur is None:
+            continue
+        drop = 1 - cur["slides_per_s"] / base["slides_per_s"]
+        slower_ms = (cur["seconds"] - base["seconds"]) * 1000
+        if drop > max_slowdown and slower_ms > min_slowdown_ms:
+            problems.append(
+                f"{name}: throughput {cur['slides_per_s']:.1f} slides/s is {drop:.0%} "
+                f"below {base['slides_per_s']:.1f}"
+            )
+        growth = cur["peak_mb"] / base["peak_mb"] - 1 if base["peak_mb"] else 0.0
+        if growth > max_memory_growth and cur["peak_mb"] - base["peak_mb"] > min_memory_growth_mb:
+            problems.append(
+                f"{name}: peak memory {cur['peak_mb']:.1f} MB is {growth:.0%} "
+                f"above {base['peak_mb']:.1f} MB"
+            )
+    return problems
+
+
+def _print_table(current: dict[str, Any], baseline: dict[str, Any] | None = None) -> None:
+    print(f"deck: {current['params']}")
+    for name, cur in current["phases"].items():
+        line = (
+            f"  {name:<9} {cur['seconds'] * 1000:9.1f} ms  {cur['slides_per_s']:9.1f} slides/s"
+            f"  peak {cur['peak_mb']:8.1f} MB"
+        )
+        base = (baseline or {}).get("phases", {}).get(name)
+        if base:
+            line += f"  (baseline {base['slides_per_s']:9.1f} slides/s, {base['peak_mb']:8.1f} MB)"
+        print(line)
+
+
+def _load(path: Path) -> dict[str, Any]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path}: not a {RESULTS_FORMAT} results file")
+    return payload
+
+
+def _add_deck_args(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument(
+        "--profile",
+        choices=sorted(PROFILES),
+        default=DEFAULT_PROFILE,
+        help=f"deck preset (default: {DEFAULT_PROFILE})",
+    )
+    for f in fields(DeckParams):
+        flag = "--" + f.name.replace("_", "-")
+        ap.add_argument(
+            flag, dest=f.name, type=int, default=None, help=f"override the profile's {f.name}"
+        )
+
+
+def _add_threshold_args(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument(
+        "--max-slowdown", type=float, default=0.25, help="allowed throughput drop (default: 0.25)"
+    )
+    ap.add_argument(
+        "--max-memory-growth", type=float, default=0.25, help="allowed peak growth (default: 0.25)"
+    )
+    ap.add_argument(
+        "--min-slowdown-ms",
+        type=float,
+        default=DEFAULT_MIN_SLOWDOWN_MS,
+        help=f"ignore phases slower by less than this (default: {DEFAULT_MIN_SLOWDOWN_MS:g} ms)",
+    )
+    ap.add_argument(
+        "--min-memory-growth-mb",
+        type=float,
+        default=DEFAULT_MIN_MEMORY_GROWTH_MB,
+        help="ignore peaks larger by less than this "
+        f"(default: {DEFAULT_MIN_MEMORY_GROWTH_MB:g} MB)",
+    )
+
+
+def _params(ns: argparse.Namespace) -> DeckParams:
+    overrides = {f.name: getattr(ns, f.name) for f in fields(DeckParams)}
+    return replace(PROFILES[ns.profile], **{k: v for k, v in overrides.items() if v is not None})
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Synthetic-deck benchmarks for every CLI phase, with baseline comparison"
+    )
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p_gen = sub.add_parser("generate", help="Write a synthetic .pptx")
+    p_gen.add_argument("output", type=Path)
+    _add_deck_args(p_gen)
+
+    p_run = sub.add_parser("run", help="Time extract/validate/preview/assemble on a synthetic deck")
+    _add_deck_args(p_run)
+    p_run.add_argument("--phases", nargs="+", choices=PHASES, default=list(PHASES))
+    p_run.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"timed runs per phase; the best is kept (default: {DEFAULT_REPEAT})",
+    )
+    p_run.add_argument("-o", "--output", type=Path, help="Write results JSON here")
+    p_run.add_argument(
+        "--baseline", type=Path, default=None, help="Also compare against this results file"
+    )
+    _add_threshold_args(p_run)
+
+    p_cmp = sub.add_parser("compare", help="Flag regressions of a results file against a baseline")
+    p_cmp.add_argument("current", type=Path)
+    p_cmp.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    _add_threshold_args(p_cmp)
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        import PIL  # noqa: F401
+        import pptx  # noqa: F401
+
+        import deckdown  # noqa: F401
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    if args.command == "generate":
+        generate(args.output, _params(args))
+        print(f"wrote {args.output}")
+        return 0
+
+    if args.command == "run":
+        logging.disable(logging.WARNING)
+        current = run(_params(args), repeat=args.repeat, phases=args.phases)
+        baseline = _load(args.baseline) if args.baseline else None
+        _print_table(current, baseline)
+        if args.output:
+            args.output.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        if baseline is None:
+            return 0
+    else:
+        current, baseline = _load(args.current), _load(args.baseline)
+        _print_table(current, baseline)
+
+    problems = compare(
+        baseline,
+        current,
+        max_slowdown=args.max_slowdown,
+        max_memory_growth=args.max_memory_growth,
+        min_slowdown_ms=args.min_slowdown_ms,
+        min_memory_growth_mb=args.min_memory_growth_mb,
+    )
+    for msg in problems:
+        print(f"REGRESSION {msg}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
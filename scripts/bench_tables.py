@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+
+def _make_table_deck(path: Path, *, sizes: Sequence[tuple[int, int]], merge_every: int) -> None:
+    from pptx import Presentation
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches
+
+    prs = Presentation()
+    blank = prs.slide_layouts[6]
+    for rows, cols in sizes:
+        slide = prs.slides.add_slide(blank)
+        shape = slide.shapes.add_table(rows, cols, Inches(0.2), Inches(0.2), Inches(9), Inches(6))
+        tbl = shape.table
+        for r in range(rows):
+            for c in range(cols):
+                cell = tbl.cell(r, c)
+                cell.text = f"{r * cols + c:,}.00"
+                if r == 0:
+                    cell.fill.solid()
+                    cell.fill.fore_color.rgb = RGBColor(0x1F, 0x4E, 0x79)
+        # Sprinkle 2x2 merges so span/merge handling is on the measured path.
+        if merge_every > 0:
+            for r in range(1, rows - 1, merge_every):
+                for c in range(0, cols - 1, merge_every):
+                    tbl.cell(r, c).merge(tbl.cell(r + 1, c + 1))
+    prs.save(str(path))
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    rows, _, cols = text.lower().partition("x")
+    return int(rows), int(cols)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Measure TableShapeHandler on synthetic tables")
+    ap.add_argument(
+        "--sizes",
+        default="10x10,40x25,60x40,100x100",
+        help="comma-separated ROWSxCOLS tables, one per slide (default tops out at 10k cells)",
+    )
+    ap.add_argument("--merge-every", type=int, default=7, help="2x2 merge stride; 0 disables")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(list(argv) if argv is not None else None)
+    sizes = [_parse_size(s) for s in args.sizes.split(",") if s.strip()]
+
+    try:
+        from deckdown.extractors.ast import AstExtractor
+        from deckdown.extractors.context import ExtractContext
+        from deckdown.extractors.handlers.table_handler import TableShapeHandler
+        from deckdown.loader import Loader
+    except Exception as exc:  # pragma: no cover - exercised manually
+        print(f"Missing dependency: {exc}", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "tables.pptx"
+        _make_table_deck(deck, sizes=sizes, merge_every=args.merge_every)
+        prs = Loader(deck).presentation()
+        handler = TableShapeHandler()
+        ctx = AstExtractor().context(prs)
+        for (rows, cols), slide in zip(sizes, prs.slides, strict=True):
+            shape = next(sh for sh in slide.shapes if handler.supports(sh))
+
+            def run(shape: Any = shape, ctx: ExtractContext = ctx) -> None:  # noqa: ANN401
+                handler.build(shape, z=0, ctx=ctx)
+
+            best = _best_of(run, args.repeat)
+            cells = rows * cols
+            print(
+                f"{rows:>4} x {cols:<4} ({cells:>6,} cells): "
+                f"{best * 1000:8.1f} ms  ({cells / best:,.0f} cells/s)"
+            )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution path
+    raise SystemExit(main())
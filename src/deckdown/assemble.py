@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+import base64
 from dataclasses import dataclass
+from hashlib import sha256
 from io import BytesIO
 from pathlib import Path
 from collections.abc import Iterable
-from contextlib import suppress
+from typing import Any
 
 from pptx import Presentation
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.util import Emu
 
 from deckdown.ast import (
     BasicShape,
     ChartShape,
     LineShape,
+    Media,
     PictureShape,
     SlideDoc,
     TableShape,
@@ -27,11 +31,16 @@ from deckdown.charts.utils import (
     build_chart_data,
     map_chart_type,
 )
+from deckdown.metrics import count, media_bytes, note_suppressed, suppressing, timed
 from deckdown.text.emit import write_text_frame
+from deckdown.trace import phase, span
 
 
 @dataclass(frozen=True)
 class DeckAssembler:
+    # Directory that picture `ref`s are relative to (the Markdown file's folder).
+    asset_root: Path | None = None
+
     def assemble(self, docs: Iterable[SlideDoc], *, out: Path) -> None:  # noqa: C901
         prs = Presentation()
         blank = prs.slide_layouts[6]
@@ -41,32 +50,42 @@ class DeckAssembler:
             prs.part.drop_rel(rel_id)
             prs.slides._sldIdLst.remove(prs.slides._sldIdLst[0])  # type: ignore[attr-defined]
 
-        # Set deck slide size from first doc if present
-        docs_list = list(docs)
-        if docs_list:
-            first = docs_list[0]
-            with suppress(Exception):
-                prs.slide_width = Emu(first.slide.size.width_emu)
-                prs.slide_height = Emu(first.slide.size.height_emu)
-
-        for doc in docs_list:
-            s = prs.slides.add_slide(blank)
-            # Note: slide size is a deck-level setting in PPTX; we keep default for now.
-            for sh in doc.slide.shapes:
-                if isinstance(sh, TextShape):
-                    self._add_text(s, sh)
-                elif isinstance(sh, PictureShape):
-                    self._add_picture(s, sh)
-                elif isinstance(sh, TableShape):
-                    self._add_table(s, sh)
-                elif isinstance(sh, BasicShape):
-                    self._add_basic(s, sh)
-                elif isinstance(sh, LineShape):
-                    self._add_line(s, sh)
-                elif isinstance(sh, ChartShape):
-                    self._add_chart(s, sh)
-
-        prs.save(str(out))
+        # Image parts already added in this assembly, keyed by media ref / data URL digest
+        images: dict[str | bytes, Any] = {}
+        # Docs may be a lazy iterator (e.g. MarkdownReader.iter_file); consume one at a time.
+        first = True
+        for doc in docs:
+            if first:
+                # Set deck slide size from first doc
+                first = False
+                with suppressing():
+                    prs.slide_width = Emu(doc.slide.size.width_emu)
+                    prs.slide_height = Emu(doc.slide.size.height_emu)
+            with phase("build", slide=doc.slide.index):
+                s = prs.slides.add_slide(blank)
+                # Note: slide size is a deck-level setting in PPTX; we keep default for now.
+                for sh in doc.slide.shapes:
+                    kind = sh.kind.value
+                    with span(kind, "shape"), timed(f"assemble.{kind}"):
+                        self._add_shape(s, sh, images)
+                    count(f"assemble.{kind}")
+
+        with phase("save"):
+            prs.save(str(out))
+
+    def _add_shape(self, slide, sh, images: dict[str | bytes, Any]) -> None:  # noqa: ANN001
+        if isinstance(sh, TextShape):
+            self._add_text(slide, sh)
+        elif isinstance(sh, PictureShape):
+            self._add_picture(slide, sh, images)
+        elif isinstance(sh, TableShape):
+            self._add_table(slide, sh)
+        elif isinstance(sh, BasicShape):
+            self._add_basic(slide, sh)
+        elif isinstance(sh, LineShape):
+            self._add_line(slide, sh)
+        elif isinstance(sh, ChartShape):
+            self._add_chart(slide, sh)
 
     # --- helpers ---
     def _add_text(self, slide, sh: TextShape) -> None:  # noqa: ANN001
@@ -78,24 +97,64 @@ class DeckAssembler:
         tf = tx.text_frame
         write_text_frame(tf, sh.text)
 
-    def _add_picture(self, slide, sh: PictureShape) -> None:  # noqa: ANN001
+    def _add_picture(
+        self,
+        slide,  # noqa: ANN001
+        sh: PictureShape,
+        images: dict[str | bytes, Any] | None = None,
+    ) -> None:  # noqa: ANN001
         media = sh.image.media
-        if not media or not media.data_url:
-            return
-        data_url = media.data_url
-        if not data_url.startswith("data:") or ";base64," not in data_url:
-            return
-        b64 = data_url.split(",", 1)[1]
-        try:
-            data = BytesIO(__import__("base64").b64decode(b64))
-            data.seek(0)
-        except Exception:
+        if not media or not (media.data_url or media.ref):
             return
         left = Emu(sh.bbox.x_emu)
         top = Emu(sh.bbox.y_emu)
         width = Emu(sh.bbox.w_emu)
         height = Emu(sh.bbox.h_emu)
-        slide.shapes.add_picture(data, left, top, width=width, height=height)
+        # Shared-table/file refs are stable keys; a data URL is keyed by its digest so
+        # the cache does not keep every inline image's base64 text alive.
+        key = media.ref or sha256((media.data_url or "").encode()).digest()
+        part = images.get(key) if images is not None else None
+        if part is not None:
+            # Reuse the image part: no base64 decode or file read, no re-hash by python-pptx.
+            with suppressing():
+                rid = slide.part.relate_to(part, RT.IMAGE)
+                slide.shapes._add_pic_from_image_part(part, rid, left, top, width, height)  # type: ignore[attr-defined]
+                return
+        source = self._image_source(media)
+        if source is None:
+            return
+        try:
+            pic = slide.shapes.add_picture(source, left, top, width=width, height=height)
+        except Exception:
+            note_suppressed()
+            return
+        if images is not None:
+            with suppressing():
+                images[key] = slide.part.related_part(pic._element.blip_rId)
+
+    def _image_source(self, media: Media) -> BytesIO | str | None:
+        data_url = media.data_url
+        if data_url:
+            if not data_url.startswith("data:") or ";base64," not in data_url:
+                return None
+            b64 = data_url.split(",", 1)[1]
+            try:
+                data = BytesIO(base64.b64decode(b64))
+                data.seek(0)
+            except Exception:
+                note_suppressed()
+                return None
+            media_bytes("assemble", data.getbuffer().nbytes)
+            return data
+        # refs mode: the file is read lazily, once per unique ref, straight from disk
+        if not media.ref or self.asset_root is None:
+            return None
+        root = self.asset_root.resolve()
+        path = (root / media.ref).resolve()
+        if not path.is_relative_to(root) or not path.is_file():
+            return None
+        media_bytes("assemble", path.stat().st_size)
+        return str(path)
 
     def _add_table(self, slide, sh: TableShape) -> None:  # noqa: ANN001
         left = Emu(sh.bbox.x_emu)
@@ -114,7 +173,7 @@ class DeckAssembler:
             rr = r + max(1, cell.rowspan) - 1
             cc = c + max(1, cell.colspan) - 1
             if rr > r or cc > c:
-                with suppress(Exception):
+                with suppressing():
                     t.cell(r, c).merge(t.cell(rr, cc))
             # write text
             tf = t.cell(r, c).text_frame
@@ -139,20 +198,13 @@ class DeckAssembler:
             tf = shp.text_frame
             write_text_frame(tf, sh.text)
         # style (fill only; stroke best-effort)
-        with suppress(Exception):
-            if (
-                sh.style
-                and sh.style.fill
-                and sh.style.fill.color
-                and sh.style.fill.color.get("resolved_rgb")
-            ):
+        with suppressing():
+            fill = sh.style.fill if sh.style else None
+            if fill is not None and fill.color is not None:
                 shp.fill.solid()
                 from pptx.dml.color import RGBColor
 
-                rgb = sh.style.fill.color["resolved_rgb"][1:]
-                shp.fill.fore_color.rgb = RGBColor(
-                    int(rgb[0:2], 16), int(rgb[2:4], 16), int(rgb[4:6], 16)
-                )
+                shp.fill.fore_color.rgb = RGBColor.from_string(fill.color.resolved_rgb[1:])
 
     def _add_line(self, slide, sh: LineShape) -> None:  # noqa: ANN001
         x1 = Emu(sh.bbox.x_emu)
@@ -171,7 +223,7 @@ class DeckAssembler:
         height = Emu(sh.bbox.h_emu)
         chart = slide.shapes.add_chart(xl_type, left, top, width, height, data).chart
 
-        apply_plot_area(chart, sh.chart.plot_area or {})
+        apply_plot_area(chart, sh.chart.plot_area)
         plots = chart.plots
         if not plots:
             return
@@ -182,4 +234,4 @@ class DeckAssembler:
             apply_series_labels_and_color(series_obj, ser)
             apply_point_colors(series_obj, ser)
 
-        apply_axes(chart, sh.chart.axes or {})
+        apply_axes(chart, sh.chart.axes)
@@ -1,30 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import KeysView
 from enum import Enum
-from typing import Any, Literal, Optional
+from typing import Annotated, Any, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+def _is_none(value: object) -> bool:
+    return value is None
+
+
 class _FrozenModel(BaseModel):
     model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class _DictLikeFrozenModel(_FrozenModel):
+    """Read-only mapping view of a model's fields.
+
+    Lookups read the attributes directly (nothing is dumped), so nested
+    values are models rather than dicts.
+    """
+
     def get(self, key: str, default: Any = None) -> Any:
-        return self.model_dump().get(key, default)
+        return getattr(self, key) if key in type(self).model_fields else default
 
-    def items(self):
-        return self.model_dump().items()
+    def items(self) -> list[tuple[str, Any]]:
+        return [(name, getattr(self, name)) for name in type(self).model_fields]
 
-    def keys(self):
-        return self.model_dump().keys()
+    def keys(self) -> KeysView[str]:
+        return type(self).model_fields.keys()
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.model_dump()
+    def __contains__(self, key: object) -> bool:
+        return key in type(self).model_fields
 
     def __getitem__(self, key: str) -> Any:
-        return self.model_dump()[key]
+        if key not in type(self).model_fields:
+            raise KeyError(key)
+        return getattr(self, key)
 
 
 class ThemeRef(_FrozenModel):
@@ -67,6 +80,9 @@ class FontSpec(_FrozenModel):
 class TextRun(_FrozenModel):
     text: str
     font: Optional[FontSpec] = None
+    # Key into the deck style table (compact style mode) instead of an inline `font`.
+    # Left out when unset, so plain runs serialize exactly as before compact styles.
+    style: Optional[str] = Field(default=None, exclude_if=_is_none)
 
 
 class Paragraph(_FrozenModel):
@@ -253,7 +269,11 @@ class GroupShape(ShapeBase):
     children: tuple[str, ...]
 
 
-Shape = TextShape | PictureShape | TableShape | ChartShape | BasicShape | LineShape | GroupShape
+# Tagged on `kind`: validation goes straight to the matching shape class.
+Shape = Annotated[
+    TextShape | PictureShape | TableShape | ChartShape | BasicShape | LineShape | GroupShape,
+    Field(discriminator="kind"),
+]
 
 
 class SlideSize(_FrozenModel):
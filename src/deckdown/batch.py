@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import glob
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from deckdown.io import OutputManager
+from deckdown.media import MediaEmbedMode
+from deckdown.metrics import active, collecting, merge_from_worker
+from deckdown.pipeline import extract_markdown
+
+__all__ = [
+    "BatchExtractor",
+    "BatchJob",
+    "BatchReport",
+    "BatchResult",
+    "available_cpus",
+    "collect_inputs",
+]
+
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def available_cpus(cgroup_root: Path = _CGROUP_ROOT) -> int:
+    """Number of CPUs this process may use.
+
+    Honours the scheduler affinity mask and cgroup v2 (`cpu.max`) or v1
+    (`cpu.cfs_quota_us`/`cpu.cfs_period_us`) quotas, so containers limited to
+    e.g. 2 CPUs on a 64-core host do not oversubscribe.
+    """
+    try:
+        count = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        count = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota(cgroup_root)
+    if quota is not None:
+        count = min(count, quota)
+    return max(1, count)
+
+
+def _cgroup_cpu_quota(root: Path) -> int | None:
+    try:
+        raw = (root / "cpu.max").read_text(encoding="utf-8").split()
+        if len(raw) == 2 and raw[0] != "max":
+            return max(1, -(-int(raw[0]) // int(raw[1])))
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int((root / "cpu" / "cpu.cfs_quota_us").read_text(encoding="utf-8"))
+        period = int((root / "cpu" / "cpu.cfs_period_us").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if quota <= 0 or period <= 0:
+        return None
+    return max(1, -(-quota // period))
+
+
+def collect_inputs(sources: Iterable[str | Path]) -> list[Path]:
+    """Expand directories, glob patterns and manifest files into .pptx paths.
+
+    - a directory contributes every `*.pptx` below it (recursively)
+    - a `.txt`/`.lst` file is a manifest: one path per line, `#` comments allowed,
+      relative entries resolved against the manifest's directory
+    - anything else is treated as a path or glob pattern
+    Duplicates are dropped while preserving first-seen order.
+    """
+    seen: set[Path] = set()
+    out: list[Path] = []
+    for src in sources:
+        for p in _expand_source(Path(src)):
+            key = p.resolve()
+            if key in seen:
+                continue
+            seen.add(key)
+            out.append(p)
+    return out
+
+
+def _expand_source(src: Path) -> Iterator[Path]:
+    if src.is_dir():
+        yield from sorted(p for p in src.rglob("*") if _is_pptx(p))
+        return
+    if src.is_file() and src.suffix.lower() in {".txt", ".lst"}:
+        base = src.parent
+        for line in src.read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            p = Path(entry)
+            yield from _expand_source(p if p.is_absolute() else base / p)
+        return
+    if src.is_file():
+        yield src
+        return
+    yield from sorted(Path(m) for m in glob.glob(str(src), recursive=True) if _is_pptx(Path(m)))
+
+
+def _is_pptx(p: Path) -> bool:
+    return p.is_file() and p.suffix.lower() == ".pptx"
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    input_path: Path
+    output_path: Path
+    size_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    job: BatchJob
+    ok: bool
+    error: str | None = None
+
+
+@dataclass
+class BatchReport:
+    results: list[BatchResult] = field(default_factory=list)
+
+    @property
+    def failed(self) -> list[BatchResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+
+def _run_job(job: BatchJob, media_mode: MediaEmbedMode, with_notes: bool) -> str:
+    return extract_markdown(
+        job.input_path,
+        output_path=job.output_path,
+        media_mode=media_mode,
+        with_notes=with_notes,
+    )
+
+
+def _run_pooled_job(
+    job: BatchJob, media_mode: MediaEmbedMode, with_notes: bool, collect_metrics: bool
+) -> tuple[str, dict[str, Any] | None]:
+    # Executed in worker processes; returns the rendered Markdown for the parent to write,
+    # plus the job's metrics when the parent is collecting them.
+    if not collect_metrics:
+        return _run_job(job, media_mode, with_notes), None
+    with collecting() as registry:
+        text = _run_job(job, media_mode, with_notes)
+    return text, registry.to_dict()
+
+
+@dataclass(frozen=True)
+class BatchExtractor:
+    """Extract many decks across a process pool with a single writer.
+
+    Jobs are scheduled largest-file-first (LPT) to shorten the makespan. Workers
+    only return rendered Markdown; the parent writes each file as soon as it
+    completes and keeps at most `2 * jobs` results in flight so memory stays
+    bounded regardless of batch size. While metrics are being collected
+    (`deckdown.metrics.collecting`), every deck's metrics add up in the
+    parent's registry.
+    """
+
+    out_dir: Path | None = None
+    jobs: int | None = None
+    media_mode: MediaEmbedMode = "base64"
+    with_notes: bool = False
+    output: OutputManager = field(default_factory=OutputManager)
+
+    def plan(self, inputs: Iterable[Path]) -> list[BatchJob]:
+        planned: list[BatchJob] = []
+        targets: dict[Path, Path] = {}
+        for in_path in inputs:
+            out_opt = f"{self.out_dir}/" if self.out_dir is not None else None
+            out_path = self.output.resolve_markdown_output_path(in_path, out_opt)
+            key = out_path.resolve()
+            if key in targets:
+                raise ValueError(
+                    f"output collision: {in_path} and {targets[key]} both map to {out_path}"
+                )
+            targets[key] = in_path
+            planned.append(BatchJob(in_path, out_path, in_path.stat().st_size))
+        planned.sort(key=lambda j: j.size_bytes, reverse=True)
+        return planned
+
+    def run(self, inputs: Iterable[Path]) -> BatchReport:
+        planned = self.plan(inputs)
+        workers = max(1, min(self.jobs or available_cpus(), len(planned) or 1))
+        logging.info("batch: %d decks across %d worker(s)", len(planned), workers)
+        if workers == 1:
+            return self._run_serial(planned)
+        return self._run_pool(planned, workers)
+
+    def _run_serial(self, planned: list[BatchJob]) -> BatchReport:
+        report = BatchReport()
+        for job in planned:
+            try:
+                text = _run_job(job, self.media_mode, self.with_notes)
+            except Exception as exc:
+                report.results.append(self._failure(job, exc))
+                continue
+            report.results.append(self._write(job, text))
+        return report
+
+    def _run_pool(self, planned: list[BatchJob], workers: int) -> BatchReport:
+        report = BatchReport()
+        pending = iter(planned)
+        window = workers * 2
+        in_flight: dict[Future[tuple[str, dict[str, Any] | None]], BatchJob] = {}
+        collect_metrics = active() is not None
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+
+            def _submit_next() -> None:
+                job = next(pending, None)
+                if job is not None:
+                    fut = pool.submit(
+                        _run_pooled_job, job, self.media_mode, self.with_notes, collect_metrics
+                    )
+                    in_flight[fut] = job
+
+            for _ in range(window):
+                _submit_next()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    job = in_flight.pop(fut)
+                    try:
+                        text, metrics = fut.result()
+                    except Exception as exc:
+                        report.results.append(self._failure(job, exc))
+                    else:
+                        merge_from_worker(metrics)
+                        report.results.append(self._write(job, text))
+                    _submit_next()
+        return report
+
+    def _write(self, job: BatchJob, text: str) -> BatchResult:
+        try:
+            self.output.write_text_file(job.output_path, text)
+        except OSError as exc:
+            return self._failure(job, exc)
+        logging.info("batch: wrote %s", job.output_path)
+        return BatchResult(job=job, ok=True)
+
+    @staticmethod
+    def _failure(job: BatchJob, exc: BaseException) -> BatchResult:
+        logging.error("batch: failed %s: %s", job.input_path, exc)
+        return BatchResult(job=job, ok=False, error=f"{type(exc).__name__}: {exc}")
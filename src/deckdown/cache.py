@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from contextlib import suppress
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from deckdown import __version__
+from deckdown.ast import PictureShape, SlideDoc
+from deckdown.media import MEDIA_REF_PREFIX
+from deckdown.styles import style_refs
+
+if TYPE_CHECKING:
+    from deckdown.extractors.context import ExtractContext
+
+__all__ = ["SlideCache", "DEFAULT_CACHE_MAX_BYTES"]
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Relationships that point away from the slide's own content: following them
+# would make every slide's key depend on its neighbours (or its speaker notes).
+_SKIP_RELTYPES = frozenset({RT.SLIDE, RT.NOTES_SLIDE, RT.NOTES_MASTER})
+
+
+@dataclass
+class SlideCache:
+    """Persistent per-slide `SlideDoc` cache for incremental re-extraction.
+
+    Entries are keyed by a digest of everything a slide's AST depends on: its
+    XML, every part reachable through its relationships (images, charts,
+    layout, master, theme), the slide size and index, the media mode, compact
+    styles and the deckdown version. A slide whose key is present is spliced from the cache
+    instead of being walked. Entries are written atomically as each slide
+    completes, so an interrupted run resumes where it stopped. The directory
+    is kept under `max_bytes` by evicting least recently used entries in
+    `prune()`; hits refresh an entry's mtime.
+    """
+
+    root: Path
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    hits: int = 0
+    misses: int = 0
+    # Digest per part name, computed once per run (layouts/masters are shared by many slides).
+    _part_digests: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+
+    def key(self, slide: Any, index: int, ctx: ExtractContext) -> str:  # noqa: ANN401
+        h = sha256()
+        h.update(f"deckdown {__version__}\n{ctx.media_mode}\n".encode())
+        if ctx.media_mode == "refs" and ctx.asset_store is not None:
+            # Refs embed the asset directory name, which follows the Markdown file name.
+            h.update(f"{ctx.asset_store.assets_dir.name}\n".encode())
+        if ctx.style_table is not None:
+            # Compact entries carry their style-table fonts on an extra line.
+            h.update(b"styles\n")
+        h.update(f"{ctx.size.width_emu}x{ctx.size.height_emu}#{index}\n".encode())
+        for partname, digest in sorted(self._closure(slide.part).items()):
+            h.update(f"{partname} {digest}\n".encode())
+        return h.hexdigest()
+
+    def get(self, key: str, ctx: ExtractContext) -> SlideDoc | None:
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+            head, _, body = raw.partition(b"\n")
+            media: dict[str, str] = json.loads(head)
+            styles: dict[str, dict] = {}
+            if ctx.style_table is not None:
+                style_head, _, body = body.partition(b"\n")
+                styles = json.loads(style_head)
+            doc = SlideDoc.model_validate_json(body)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            logging.debug("slide cache: unreadable entry %s", path)
+            self.misses += 1
+            return None
+        if not self._media_available(doc, media, ctx) or not style_refs(doc) <= styles.keys():
+            self.misses += 1
+            return None
+        if ctx.media_table is not None:
+            ctx.media_table.update(media)
+        if ctx.style_table is not None:
+            ctx.style_table.update(styles)
+        with suppress(OSError):
+            os.utime(path)
+        self.hits += 1
+        return doc
+
+    def put(self, key: str, doc: SlideDoc, ctx: ExtractContext) -> None:
+        media: dict[str, str] = {}
+        if ctx.media_table is not None:
+            for ref in self._picture_refs(doc):
+                data_url = ctx.media_table.lookup(ref)
+                if data_url is not None:
+                    media[ref[len(MEDIA_REF_PREFIX) :]] = data_url
+        head = json.dumps(media).encode("utf-8") + b"\n"
+        if ctx.style_table is not None:
+            table = ctx.style_table
+            styles = {
+                ref: table.dump(ref) for ref in sorted(style_refs(doc)) if ref in table.entries
+            }
+            head += json.dumps(styles).encode("utf-8") + b"\n"
+        path = self._path(key)
+        payload = head + doc.model_dump_json().encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(payload)
+                os.replace(tmp, path)
+            except BaseException:
+                with suppress(OSError):
+                    os.unlink(tmp)
+                raise
+        except OSError as exc:
+            # A cache that cannot be written must never fail the extraction.
+            logging.debug("slide cache: cannot write %s: %s", path, exc)
+
+    def prune(self) -> int:
+        """Evict least recently used entries until the cache fits `max_bytes`.
+
+        Returns the number of entries removed.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        removed = 0
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            with suppress(OSError):
+                path.unlink()
+                total -= size
+                removed += 1
+        return removed
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _closure(self, part: Any) -> dict[str, str]:  # noqa: ANN401
+        seen: dict[str, str] = {}
+        stack = [part]
+        while stack:
+            cur = stack.pop()
+            name = str(cur.partname)
+            if name in seen:
+                continue
+            seen[name] = self._part_digest(cur)
+            for rel in cur.rels.values():
+                if rel.is_external or rel.reltype in _SKIP_RELTYPES:
+                    continue
+                stack.append(rel.target_part)
+        return seen
+
+    def _part_digest(self, part: Any) -> str:  # noqa: ANN401
+        name = str(part.partname)
+        digest = self._part_digests.get(name)
+        if digest is None:
+            h = sha256(part.blob)
+            # rIds in the XML resolve through the rels, so they are part of the content.
+            for rid, rel in sorted(part.rels.items()):
+                target = rel.target_ref if rel.is_external else str(rel.target_part.partname)
+                h.update(f"\n{rid} {rel.reltype} {target}".encode())
+            digest = self._part_digests[name] = h.hexdigest()
+        return digest
+
+    @staticmethod
+    def _picture_refs(doc: SlideDoc) -> list[str]:
+        return [
+            sh.image.media.ref
+            for sh in doc.slide.shapes
+            if isinstance(sh, PictureShape) and sh.image.media.ref
+        ]
+
+    def _media_available(self, doc: SlideDoc, media: dict[str, str], ctx: ExtractContext) -> bool:
+        refs = self._picture_refs(doc)
+        if ctx.media_mode == "shared":
+            return all(ref[len(MEDIA_REF_PREFIX) :] in media for ref in refs)
+        if ctx.media_mode == "refs" and ctx.asset_store is not None:
+            # Asset files may have been removed since the entry was written.
+            base = ctx.asset_store.markdown_path.parent
+            return all((base / ref).is_file() for ref in refs)
+        return True
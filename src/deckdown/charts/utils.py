@@ -6,6 +6,17 @@ from pptx.chart.data import BubbleChartData, CategoryChartData, XyChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from pptx.dml.color import RGBColor
 
+from deckdown.ast import ChartAxes, ChartSeriesModel, Color, PlotAreaSpec
+from deckdown.metrics import note_suppressed
+
+_LABEL_FLAGS = ("show_value", "show_category_name", "show_series_name", "show_percentage")
+_LEGEND_POSITIONS = {
+    "right": XL_LEGEND_POSITION.RIGHT,
+    "left": XL_LEGEND_POSITION.LEFT,
+    "top": XL_LEGEND_POSITION.TOP,
+    "bottom": XL_LEGEND_POSITION.BOTTOM,
+}
+
 
 def map_chart_type(kind: str) -> XL_CHART_TYPE:
     t = (kind or "").lower()
@@ -50,99 +61,86 @@ def build_chart_data(xl_type: XL_CHART_TYPE, series: Iterable[Any], categories:
     return data
 
 
-def apply_plot_area(chart: Any, plot_area: dict | None) -> None:  # noqa: ANN401
-    if not plot_area:
+def apply_plot_area(chart: Any, plot_area: PlotAreaSpec | None) -> None:  # noqa: ANN401
+    if plot_area is None:
         return
-    has_labels = bool(plot_area.get("has_data_labels", False))
     if chart.plots:
         try:
-            chart.plots[0].has_data_labels = has_labels
+            chart.plots[0].has_data_labels = bool(plot_area.has_data_labels)
         except Exception:
-            pass
-    chart.has_legend = bool(plot_area.get("has_legend", False))
-    pos = (plot_area.get("legend_pos") or "").lower()
-    pos_map = {
-        "right": XL_LEGEND_POSITION.RIGHT,
-        "left": XL_LEGEND_POSITION.LEFT,
-        "top": XL_LEGEND_POSITION.TOP,
-        "bottom": XL_LEGEND_POSITION.BOTTOM,
-    }
-    if pos in pos_map:
+            note_suppressed()
+    chart.has_legend = bool(plot_area.has_legend)
+    pos = _LEGEND_POSITIONS.get(plot_area.legend_pos or "")
+    if pos is not None:
         try:
-            chart.legend.position = pos_map[pos]
+            chart.legend.position = pos
         except Exception:
-            pass
+            note_suppressed()
 
 
-def apply_series_labels_and_color(plot_series: Any, ser_ast: Any) -> None:  # noqa: ANN401
-    lab = getattr(ser_ast, "labels", None) or {}
-    if lab:
+def apply_series_labels_and_color(plot_series: Any, ser_ast: ChartSeriesModel) -> None:  # noqa: ANN401
+    lab = ser_ast.labels
+    if lab is not None:
         dl = plot_series.data_labels
-        for key in ("show_value", "show_category_name", "show_series_name", "show_percentage"):
-            if key in lab and lab[key] is not None:
+        for key in _LABEL_FLAGS:
+            value = getattr(lab, key)
+            if value is not None:
                 try:
-                    setattr(dl, key, bool(lab[key]))
+                    setattr(dl, key, bool(value))
                 except Exception:
-                    pass
-        if lab.get("number_format"):
+                    note_suppressed()
+        if lab.number_format:
             try:
-                dl.number_format = str(lab["number_format"])
+                dl.number_format = lab.number_format
             except Exception:
-                pass
-    col = getattr(ser_ast, "color", None) or {}
-    hexrgb = (col.get("resolved_rgb") or "")[1:]
-    if hexrgb:
+                note_suppressed()
+    if ser_ast.color is not None:
         try:
             plot_series.format.fill.solid()
-            plot_series.format.fill.fore_color.rgb = RGBColor(
-                int(hexrgb[0:2], 16), int(hexrgb[2:4], 16), int(hexrgb[4:6], 16)
-            )
+            plot_series.format.fill.fore_color.rgb = _rgb(ser_ast.color)
         except Exception:
-            pass
+            note_suppressed()
 
 
-def apply_point_colors(plot_series: Any, ser_ast: Any) -> None:  # noqa: ANN401
-    points = getattr(ser_ast, "points", None) or []
-    for meta in points:
-        idx = meta.get("idx")
-        col = (meta.get("color") or {}).get("resolved_rgb", None)
-        if idx is None or not col:
+def apply_point_colors(plot_series: Any, ser_ast: ChartSeriesModel) -> None:  # noqa: ANN401
+    for meta in ser_ast.points or ():
+        if meta.color is None:
             continue
-        hexrgb = col[1:]
         try:
-            pt = plot_series.points[idx]
+            pt = plot_series.points[meta.idx]
             pt.format.fill.solid()
-            pt.format.fill.fore_color.rgb = RGBColor(
-                int(hexrgb[0:2], 16), int(hexrgb[2:4], 16), int(hexrgb[4:6], 16)
-            )
+            pt.format.fill.fore_color.rgb = _rgb(meta.color)
         except Exception:
+            note_suppressed()
             continue
 
 
-def apply_axes(chart: Any, axes: dict | None) -> None:  # noqa: ANN401
-    if not axes:
+def apply_axes(chart: Any, axes: ChartAxes | None) -> None:  # noqa: ANN401
+    if axes is None:
         return
-    if "category" in axes:
-        t = axes["category"].get("title")
-        if t:
-            try:
-                chart.category_axis.has_title = True
-                chart.category_axis.axis_title.text_frame.text = str(t)
-            except Exception:
-                pass
-    if "value" in axes:
-        v = axes["value"]
+    if axes.category is not None and axes.category.title:
         try:
-            if v.get("title"):
+            chart.category_axis.has_title = True
+            chart.category_axis.axis_title.text_frame.text = axes.category.title
+        except Exception:
+            note_suppressed()
+    v = axes.value
+    if v is not None:
+        try:
+            if v.title:
                 chart.value_axis.has_title = True
-                chart.value_axis.axis_title.text_frame.text = str(v["title"])
-            if v.get("min") is not None:
-                chart.value_axis.minimum_scale = float(v["min"])
-            if v.get("max") is not None:
-                chart.value_axis.maximum_scale = float(v["max"])
-            if v.get("major_unit") is not None:
-                chart.value_axis.major_unit = float(v["major_unit"])
-            if v.get("format_code"):
-                chart.value_axis.tick_labels.number_format = str(v["format_code"])
+                chart.value_axis.axis_title.text_frame.text = v.title
+            if v.min is not None:
+                chart.value_axis.minimum_scale = v.min
+            if v.max is not None:
+                chart.value_axis.maximum_scale = v.max
+            if v.major_unit is not None:
+                chart.value_axis.major_unit = v.major_unit
+            if v.format_code:
+                chart.value_axis.tick_labels.number_format = v.format_code
         except Exception:
-            pass
+            note_suppressed()
+
+
+def _rgb(color: Color) -> RGBColor:
+    return RGBColor.from_string(color.resolved_rgb[1:])
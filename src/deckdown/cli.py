@@ -2,25 +2,30 @@ from __future__ import annotations
 
 import argparse
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import ExitStack
 import logging
 from pathlib import Path
 
-from deckdown.extractors.text import TextExtractor
+from deckdown.batch import BatchExtractor, collect_inputs
+from deckdown.cache import DEFAULT_CACHE_MAX_BYTES, SlideCache
 from deckdown.io import OutputManager
-from deckdown.loader import Loader
-from deckdown.media import AssetStore, MediaEmbedMode
-from deckdown.renderers.markdown import MarkdownRenderer
-from deckdown.extractors.ast import AstExtractor
-from deckdown.validate import MarkdownValidator
-from deckdown.reader import MarkdownReader
+from deckdown.media import MediaEmbedMode
+from deckdown.metrics import collecting
+from deckdown.pipeline import write_jsonl, write_markdown
+from deckdown.validate import MarkdownValidator, ValidationCache
+from deckdown.reader import JsonlReader, MarkdownReader
 from deckdown.assemble import DeckAssembler
+from deckdown.ast import SlideDoc
 from deckdown.preview.html import HtmlPreviewRenderer
+from deckdown.trace import phase, tracing
+from deckdown.utils.slide_range import SlideRange
 
 # Exit codes (align with implementation plan)
 EXIT_OK = 0
 EXIT_USAGE = 2
 EXIT_INPUT_ERROR = 3
+EXIT_BATCH_FAILED = 4
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -41,19 +46,32 @@ def build_parser() -> argparse.ArgumentParser:
             "  deckdown extract deck.pptx\n"
             "  deckdown extract deck.pptx --md-out out.md\n"
             "  deckdown extract deck.pptx --md-out out_dir/\n"
+            "  deckdown extract deck.pptx --format jsonl\n"
         ),
     )
     p_extract.add_argument("input", metavar="INPUT.pptx", help="Path to input .pptx file")
     p_extract.add_argument(
         "--md-out",
+        "--out",
         dest="md_out",
         metavar="PATH_OR_DIR",
         help=(
             "Output path or directory. If a directory, writes <basename>.md inside.\n"
-            "Default: alongside input as <basename>.md"
+            "Default: alongside input as <basename>.md (<basename>.jsonl for jsonl)"
         ),
         default=None,
     )
+    p_extract.add_argument(
+        "--format",
+        dest="format",
+        choices=["markdown", "jsonl"],
+        default="markdown",
+        help=(
+            "Output format (default: markdown).\n"
+            "jsonl: one compact SlideDoc per line plus a <output>.idx offset index\n"
+            "for random slide access"
+        ),
+    )
     p_extract.add_argument(
         "--with-notes",
         action="store_true",
@@ -69,16 +87,159 @@ def build_parser() -> argparse.ArgumentParser:
     p_extract.add_argument(
         "--embed-media",
         dest="embed_media",
-        choices=["base64", "refs"],
+        choices=["base64", "refs", "shared"],
         default="base64",
-        help="Picture media embedding strategy (default: base64)",
+        help=(
+            "Picture media embedding strategy (default: base64).\n"
+            "shared: base64 once per unique image in a deck-level media table"
+        ),
+    )
+    p_extract.add_argument(
+        "--compact-styles",
+        dest="compact_styles",
+        action="store_true",
+        help=(
+            "Emit each distinct run font once in a deck-level style table;\n"
+            "runs refer to it by key instead of repeating the font"
+        ),
+    )
+    p_extract.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the per-slide AST walk (default: 1, serial)",
+    )
+    p_extract.add_argument(
+        "--slides",
+        dest="slides",
+        metavar="RANGE",
+        default=None,
+        help="Only extract these 1-based slides, e.g. 1-5,12 (default: all)",
+    )
+    p_extract.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        metavar="DIR",
+        default=None,
+        help=(
+            "Slide cache directory: unchanged slides are reused from earlier runs\n"
+            "(also resumes an interrupted extraction). Default: no cache"
+        ),
+    )
+    p_extract.add_argument(
+        "--cache-max-mb",
+        dest="cache_max_mb",
+        type=int,
+        default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+        help="Evict least recently used cache entries above this size (default: %(default)s)",
     )
 
+    _add_trace_args(p_extract)
+    _add_metrics_arg(p_extract)
+
+    p_batch = sub.add_parser(
+        "extract-batch",
+        help="Extract many decks to Markdown in parallel",
+        description=(
+            "Extract many .pptx decks across a process pool. Inputs may be directories\n"
+            "(searched recursively), glob patterns, or manifest files\n"
+            "(.txt/.lst, one path per line)."
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog=(
+            "Examples:\n"
+            "  deckdown extract-batch decks/ --out-dir md/\n"
+            "  deckdown extract-batch 'archive/**/*.pptx' --jobs 8\n"
+            "  deckdown extract-batch manifest.txt --out-dir md/ --embed-media refs\n"
+        ),
+    )
+    p_batch.add_argument("inputs", metavar="INPUT", nargs="+", help="Directory, glob or manifest")
+    p_batch.add_argument(
+        "--out-dir",
+        dest="out_dir",
+        metavar="DIR",
+        default=None,
+        help="Directory for <basename>.md outputs (default: alongside each input)",
+    )
+    p_batch.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPUs available to this process, cgroup-aware)",
+    )
+    p_batch.add_argument(
+        "--with-notes",
+        action="store_true",
+        help="Include speaker notes (stub; ignored for now)",
+    )
+    p_batch.add_argument(
+        "--log-level",
+        dest="log_level",
+        choices=["debug", "info", "warning", "error"],
+        default="info",
+        help="Logging level for extraction diagnostics (default: info)",
+    )
+    p_batch.add_argument(
+        "--embed-media",
+        dest="embed_media",
+        choices=["base64", "refs", "shared"],
+        default="base64",
+        help=(
+            "Picture media embedding strategy (default: base64).\n"
+            "shared: base64 once per unique image in a deck-level media table"
+        ),
+    )
+    _add_metrics_arg(p_batch)
+
     p_validate = sub.add_parser(
         "validate",
         help="Validate a markdown file containing deckdown JSON blocks",
     )
-    p_validate.add_argument("input", metavar="INPUT.md", help="Path to input .md file")
+    p_validate.add_argument(
+        "inputs", metavar="INPUT.md", nargs="+", help="Path to one or more input .md files"
+    )
+    p_validate.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Worker processes for block validation (default: 1, serial)",
+    )
+    p_validate.add_argument(
+        "--fail-fast",
+        dest="fail_fast",
+        action="store_true",
+        help="Stop at the first block with errors",
+    )
+    p_validate.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        metavar="DIR",
+        default=None,
+        help="Skip blocks unchanged since they last passed validation (default: no cache)",
+    )
+    p_validate.add_argument(
+        "--slides",
+        dest="slides",
+        metavar="RANGE",
+        default=None,
+        help="Only validate these 1-based slides, e.g. 1-5,12 (default: all)",
+    )
+    _add_trace_args(p_validate)
+
+    p_index = sub.add_parser(
+        "index",
+        help="Write a byte-offset slide index next to a Markdown or JSONL deck",
+        description=(
+            "Record each slide block's byte range in <input>.idx so that --slides\n"
+            "reads in preview, assemble and validate decode only the selected slides.\n"
+            "The index is rebuilt automatically when the deck's size or mtime changes."
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    p_index.add_argument("input", metavar="INPUT", help="Path to a deckdown .md or .jsonl file")
 
     p_assemble = sub.add_parser(
         "assemble",
@@ -93,6 +254,15 @@ def build_parser() -> argparse.ArgumentParser:
         default="info",
         help="Logging level for assemble diagnostics (default: info)",
     )
+    p_assemble.add_argument(
+        "--slides",
+        dest="slides",
+        metavar="RANGE",
+        default=None,
+        help="Only assemble these 1-based slides, e.g. 1-5,12 (default: all)",
+    )
+    _add_trace_args(p_assemble)
+    _add_metrics_arg(p_assemble)
 
     p_preview = sub.add_parser(
         "preview",
@@ -100,6 +270,14 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_preview.add_argument("input", metavar="INPUT.md", help="Path to input .md file")
     p_preview.add_argument("-o", "--output", dest="output", required=True, help="Output HTML path")
+    p_preview.add_argument(
+        "--slides",
+        dest="slides",
+        metavar="RANGE",
+        default=None,
+        help="Only preview these 1-based slides, e.g. 1-5,12 (default: all)",
+    )
+    _add_trace_args(p_preview)
 
     p_schema = sub.add_parser(
         "schema",
@@ -112,6 +290,49 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _add_trace_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--trace",
+        dest="trace",
+        metavar="OUT.json",
+        default=None,
+        help=(
+            "Write a Chrome/Perfetto trace of phases, slides and shape handlers\n"
+            "(open in chrome://tracing or ui.perfetto.dev)"
+        ),
+    )
+    p.add_argument(
+        "--profile-dir",
+        dest="profile_dir",
+        metavar="DIR",
+        default=None,
+        help="Also write a cProfile dump per phase as DIR/<phase>.prof",
+    )
+
+
+def _add_metrics_arg(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--metrics",
+        dest="metrics",
+        metavar="OUT.json",
+        default=None,
+        help=(
+            "Write per-handler metrics: shape counts, call time (total, p95),\n"
+            "media bytes and swallowed exceptions by site"
+        ),
+    )
+
+
+def _parse_slides(spec: str | None) -> SlideRange | None:
+    """Parse a `--slides` spec; raises ValueError with a user-facing message."""
+    if spec is None:
+        return None
+    try:
+        return SlideRange.parse(spec)
+    except ValueError as exc:
+        raise ValueError(f"invalid --slides '{spec}': {exc}") from exc
+
+
 def _cmd_extract(args: argparse.Namespace) -> int:
     logging.basicConfig(level=getattr(logging, str(args.log_level).upper(), logging.INFO))
     in_path = Path(args.input)
@@ -124,53 +345,153 @@ def _cmd_extract(args: argparse.Namespace) -> int:
             file=sys.stderr,
         )
         return EXIT_INPUT_ERROR
+    if args.jobs < 1:
+        print("error: --jobs must be >= 1", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        slides = _parse_slides(args.slides)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return EXIT_USAGE
+    if args.cache_max_mb < 0:
+        print("error: --cache-max-mb must be >= 0", file=sys.stderr)
+        return EXIT_USAGE
+    cache = (
+        SlideCache(Path(args.cache_dir), max_bytes=args.cache_max_mb * 1024 * 1024)
+        if args.cache_dir
+        else None
+    )
 
     output = OutputManager()
-    output_path = output.resolve_markdown_output_path(in_path, args.md_out)
     media_mode: MediaEmbedMode = getattr(args, "embed_media", "base64")
-    asset_store = AssetStore(output_path) if media_mode == "refs" else None
 
-    prs = Loader(str(in_path)).presentation()
-    extractor = TextExtractor(with_notes=bool(args.with_notes))
-    deck = extractor.extract_deck(prs, source_path=str(in_path))
+    if getattr(args, "format", "markdown") == "jsonl":
+        output_path = output.resolve_output_path(in_path, args.md_out, suffix=".jsonl")
+        with output.open_text_file(output_path) as fh:
+            index = write_jsonl(
+                in_path,
+                fh,
+                output_path=output_path,
+                media_mode=media_mode,
+                jobs=args.jobs,
+                slides=slides,
+                cache=cache,
+                compact_styles=bool(args.compact_styles),
+            )
+        index.save(output_path)
+        return EXIT_OK
+
+    output_path = output.resolve_markdown_output_path(in_path, args.md_out)
+    with output.open_text_file(output_path) as fh:
+        write_markdown(
+            in_path,
+            fh,
+            output_path=output_path,
+            media_mode=media_mode,
+            with_notes=bool(args.with_notes),
+            jobs=args.jobs,
+            slides=slides,
+            cache=cache,
+            compact_styles=bool(args.compact_styles),
+        )
+    return EXIT_OK
+
 
-    # Build AST per slide (authoritative positional data)
-    ast_docs = AstExtractor(media_mode=media_mode, asset_store=asset_store).extract(prs)
-    # Convert SlideDoc models to plain dicts for JSON dump
-    ast_dicts = {i: doc.model_dump(mode="python") for i, doc in ast_docs.items()}
-    # Tiny diagnostics
-    shape_counts: dict[str, int] = {}
-    for doc in ast_docs.values():
-        for sh in doc.slide.shapes:
-            shape_counts[sh.kind.value] = shape_counts.get(sh.kind.value, 0) + 1
-    logging.info("extracted %d slides; shapes=%s", len(ast_docs), shape_counts)
+def _cmd_extract_batch(args: argparse.Namespace) -> int:
+    logging.basicConfig(level=getattr(logging, str(args.log_level).upper(), logging.INFO))
+    if args.jobs is not None and args.jobs < 1:
+        print("error: --jobs must be >= 1", file=sys.stderr)
+        return EXIT_USAGE
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        print("error: no .pptx inputs found", file=sys.stderr)
+        return EXIT_INPUT_ERROR
 
-    markdown_text = MarkdownRenderer().render(
-        deck,
-        ast_per_slide=ast_dicts,
+    batch = BatchExtractor(
+        out_dir=Path(args.out_dir) if args.out_dir else None,
+        jobs=args.jobs,
+        media_mode=args.embed_media,
+        with_notes=bool(args.with_notes),
     )
-
-    output.write_text_file(output_path, markdown_text)
-    return EXIT_OK
+    try:
+        report = batch.run(inputs)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return EXIT_USAGE
+    for res in report.failed:
+        print(f"extract-batch: {res.job.input_path}: {res.error}", file=sys.stderr)
+    logging.info("batch: %d ok, %d failed", report.succeeded, len(report.failed))
+    return EXIT_BATCH_FAILED if report.failed else EXIT_OK
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     ns = parser.parse_args(list(argv) if argv is not None else None)
 
+    trace_path = getattr(ns, "trace", None)
+    profile_dir = getattr(ns, "profile_dir", None)
+    metrics_path = getattr(ns, "metrics", None)
+    with ExitStack() as stack:
+        if metrics_path is not None:
+            registry = stack.enter_context(collecting(Path(metrics_path)))
+            stack.callback(
+                lambda: logging.info(
+                    "metrics: %d exceptions suppressed at %d sites",
+                    sum(registry.suppressed.values()),
+                    len(registry.suppressed),
+                )
+            )
+        if trace_path is not None or profile_dir is not None:
+            stack.enter_context(
+                tracing(
+                    Path(trace_path) if trace_path else None,
+                    profile_dir=Path(profile_dir) if profile_dir else None,
+                )
+            )
+            stack.enter_context(phase(ns.command))
+        return _run(ns)
+
+
+def _run(ns: argparse.Namespace) -> int:  # noqa: C901
     if ns.command == "extract":
         return _cmd_extract(ns)
+    if ns.command == "extract-batch":
+        return _cmd_extract_batch(ns)
     if ns.command == "validate":
-        in_path = Path(ns.input)
-        if not in_path.exists() or in_path.is_dir():
-            print(f"error: input markdown not found: {in_path}", file=sys.stderr)
-            return EXIT_INPUT_ERROR
-        errs = MarkdownValidator().validate_file(in_path)
+        in_paths = [Path(p) for p in ns.inputs]
+        for in_path in in_paths:
+            if not in_path.exists() or in_path.is_dir():
+                print(f"error: input markdown not found: {in_path}", file=sys.stderr)
+                return EXIT_INPUT_ERROR
+        if ns.jobs < 1:
+            print("error: --jobs must be >= 1", file=sys.stderr)
+            return EXIT_USAGE
+        try:
+            slides = _parse_slides(ns.slides)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return EXIT_USAGE
+        validator = MarkdownValidator(
+            jobs=ns.jobs,
+            fail_fast=bool(ns.fail_fast),
+            cache=ValidationCache(Path(ns.cache_dir)) if ns.cache_dir else None,
+        )
+        errs = validator.validate_files(in_paths, slides)
         if errs:
             for e in errs:
                 print(f"validate: {e}", file=sys.stderr)
             return 6
         return EXIT_OK
+    if ns.command == "index":
+        logging.basicConfig(level=logging.INFO)
+        in_path = Path(ns.input)
+        if not in_path.exists() or in_path.is_dir():
+            print(f"error: input not found: {in_path}", file=sys.stderr)
+            return EXIT_INPUT_ERROR
+        reader = JsonlReader() if in_path.suffix.lower() == ".jsonl" else MarkdownReader()
+        index = reader.write_index(in_path)
+        logging.info("indexed %d slides in %s", len(index.slides), in_path)
+        return EXIT_OK
     if ns.command == "assemble":
         logging.basicConfig(
             level=getattr(logging, str(getattr(ns, "log_level", "info")).upper(), logging.INFO)
@@ -180,12 +501,23 @@ def main(argv: Sequence[str] | None = None) -> int:
         if not in_path.exists() or in_path.is_dir():
             print(f"error: input markdown not found: {in_path}", file=sys.stderr)
             return EXIT_INPUT_ERROR
-        docs = MarkdownReader().load_file(in_path)
-        # tiny metrics
-        slide_ct = len(docs)
-        shape_ct = sum(len(d.slide.shapes) for d in docs)
-        logging.info("assemble input: slides=%d shapes=%d", slide_ct, shape_ct)
-        DeckAssembler().assemble(docs, out=out_path)
+        try:
+            slides = _parse_slides(ns.slides)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return EXIT_USAGE
+        # tiny metrics, gathered while the reader streams slides into the assembler
+        counts = {"slides": 0, "shapes": 0}
+
+        def _counted(docs: Iterable[SlideDoc]) -> Iterator[SlideDoc]:
+            for d in docs:
+                counts["slides"] += 1
+                counts["shapes"] += len(d.slide.shapes)
+                yield d
+
+        assembler = DeckAssembler(asset_root=in_path.parent)
+        assembler.assemble(_counted(MarkdownReader().iter_file(in_path, slides)), out=out_path)
+        logging.info("assemble input: slides=%d shapes=%d", counts["slides"], counts["shapes"])
         return EXIT_OK
     if ns.command == "preview":
         in_path = Path(ns.input)
@@ -193,12 +525,16 @@ def main(argv: Sequence[str] | None = None) -> int:
         if not in_path.exists() or in_path.is_dir():
             print(f"error: input markdown not found: {in_path}", file=sys.stderr)
             return EXIT_INPUT_ERROR
-        docs = MarkdownReader().load_file(in_path)
-        html = HtmlPreviewRenderer().render_deck(docs, asset_root=in_path.parent)
-        out_path.write_text(html, encoding="utf-8")
+        try:
+            slides = _parse_slides(ns.slides)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return EXIT_USAGE
+        docs = MarkdownReader().iter_file(in_path, slides)
+        with OutputManager().open_text_file(out_path) as fh:
+            HtmlPreviewRenderer().write_deck(docs, fh, asset_root=in_path.parent)
         return EXIT_OK
     if ns.command == "schema":
-        from deckdown.ast import SlideDoc
         import json
 
         schema = SlideDoc.model_json_schema()
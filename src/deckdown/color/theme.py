@@ -1,86 +1,119 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Optional
+import colorsys
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any
 
 from lxml import etree
 from pptx.dml.color import MSO_THEME_COLOR
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from deckdown.ast import Color, ThemeRef
+from deckdown.metrics import note_suppressed
 
 
 SCHEMA_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
 
+_SCHEME_KEYS = (
+    "dk1",
+    "lt1",
+    "dk2",
+    "lt2",
+    "accent1",
+    "accent2",
+    "accent3",
+    "accent4",
+    "accent5",
+    "accent6",
+    "hlink",
+    "folHlink",
+)
+
+# Default Office-like fallbacks to avoid crashes when a theme has no color scheme.
+_DEFAULT_SCHEME = {
+    "dk1": "#000000",
+    "lt1": "#FFFFFF",
+    "dk2": "#1F497D",
+    "lt2": "#EEECE1",
+    "accent1": "#4F81BD",
+    "accent2": "#C0504D",
+    "accent3": "#9BBB59",
+    "accent4": "#8064A2",
+    "accent5": "#4BACC6",
+    "accent6": "#F79646",
+    "hlink": "#0000FF",
+    "folHlink": "#800080",
+}
+
+# Process-wide resolvers keyed by theme XML digest: decks built from the same
+# template share one parsed scheme. Oldest entries are dropped past the limit.
+_THEME_CACHE: dict[str, ThemeResolver] = {}
+_THEME_CACHE_MAX = 256
+
+
+# schemeClr values that name a color-map slot rather than a scheme entry (default map).
+_SCHEME_ALIASES = {"tx1": "dk1", "tx2": "dk2", "bg1": "lt1", "bg2": "lt2"}
+
+ColorKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+class _ColorCache:
+    """Resolved colors keyed by raw color XML, with interned `Color` instances."""
+
+    def __init__(self) -> None:
+        self.by_key: dict[ColorKey, Color | None] = {}
+        self.interned: dict[Color, Color] = {}
+        self.hits = 0
+        self.misses = 0
+
 
 @dataclass(frozen=True)
 class ThemeResolver:
     scheme: dict[str, str]
+    _colors: _ColorCache = field(default_factory=_ColorCache, compare=False, repr=False)
+
+    @classmethod
+    def from_presentation(cls, prs: Any) -> ThemeResolver:  # noqa: ANN401
+        """Resolver for the first slide master's theme (the deck-wide default)."""
+        try:
+            master = prs.slide_masters[0]
+        except Exception:
+            note_suppressed()
+            master = None
+        resolver = cls.from_master(master) if master is not None else None
+        return resolver or cls(dict(_DEFAULT_SCHEME))
 
     @classmethod
-    def from_presentation(cls, prs: Any) -> "ThemeResolver":  # noqa: ANN401
-        mapping: dict[str, str] = {}
+    def from_master(cls, master: Any) -> ThemeResolver | None:  # noqa: ANN401
+        """Resolver for the theme related to a slide master, or None if it has none."""
         try:
-            pkg = prs.part.package
-            for part in pkg.parts:  # type: ignore[attr-defined]
-                # theme content type endswith 'theme+xml'
-                if getattr(part, "content_type", "").endswith("theme+xml"):
-                    xml = part.blob
-                    root = etree.fromstring(xml)
-                    ns = {"a": SCHEMA_A}
-                    clr = root.xpath("//a:clrScheme", namespaces=ns)
-                    if not clr:
-                        continue
-                    scheme = clr[0]
-                    for key in (
-                        "dk1",
-                        "lt1",
-                        "dk2",
-                        "lt2",
-                        "accent1",
-                        "accent2",
-                        "accent3",
-                        "accent4",
-                        "accent5",
-                        "accent6",
-                        "hlink",
-                        "folHlink",
-                    ):
-                        node = scheme.find(f"{{{SCHEMA_A}}}{key}")
-                        if node is None:
-                            continue
-                        # prefer srgbClr val; fallback to sysClr lastClr
-                        srgb = node.find(f"{{{SCHEMA_A}}}srgbClr")
-                        if srgb is not None and srgb.get("val"):
-                            mapping[key] = f"#{srgb.get('val').upper()}"
-                            continue
-                        sys = node.find(f"{{{SCHEMA_A}}}sysClr")
-                        if sys is not None and sys.get("lastClr"):
-                            mapping[key] = f"#{sys.get('lastClr').upper()}"
-            if not mapping:
-                # default Office-like fallbacks to avoid crashes
-                mapping = {
-                    "dk1": "#000000",
-                    "lt1": "#FFFFFF",
-                    "dk2": "#1F497D",
-                    "lt2": "#EEECE1",
-                    "accent1": "#4F81BD",
-                    "accent2": "#C0504D",
-                    "accent3": "#9BBB59",
-                    "accent4": "#8064A2",
-                    "accent5": "#4BACC6",
-                    "accent6": "#F79646",
-                    "hlink": "#0000FF",
-                    "folHlink": "#800080",
-                }
+            part = master.part.part_related_by(RT.THEME)
+            blob = part.blob
         except Exception:
-            mapping = {
-                "dk1": "#000000",
-                "lt1": "#FFFFFF",
-            }
-        return cls(mapping)
+            note_suppressed()
+            return None
+        return cls.from_theme_xml(blob)
+
+    @classmethod
+    def from_theme_xml(cls, blob: bytes) -> ThemeResolver:
+        """Resolver for a theme part's XML, shared across decks with identical themes."""
+        digest = hashlib.sha256(blob).hexdigest()
+        cached = _THEME_CACHE.get(digest)
+        if cached is not None:
+            return cached
+        resolver = cls(_parse_scheme(blob))
+        if len(_THEME_CACHE) >= _THEME_CACHE_MAX:
+            _THEME_CACHE.pop(next(iter(_THEME_CACHE)))
+        _THEME_CACHE[digest] = resolver
+        return resolver
 
     def _key_from_theme_enum(self, theme_enum: Any) -> str | None:  # noqa: ANN401
         try:
             name = theme_enum.name  # MSO_THEME_COLOR enum
         except Exception:
+            note_suppressed()
             return None
         table = {
             "ACCENT_1": "accent1",
@@ -98,11 +131,96 @@ class ThemeResolver:
         }
         return table.get(name)
 
+    def color_from_colorformat(self, cf: Any) -> Color | None:  # noqa: ANN401
+        """Resolve a python-pptx `ColorFormat` to a shared `Color`, or None.
+
+        Colors backed by XML are memoized per resolver by their raw color
+        element (value plus modifiers), so repeated colors return one instance.
+        """
+        xclr = getattr(getattr(cf, "_color", None), "_xClr", None)
+        if xclr is not None:
+            return self.color_from_xml(xclr)
+        data = self._color_dict_from_proxy(cf)
+        try:
+            return Color.model_validate(data) if data else None
+        except Exception:
+            note_suppressed()
+            return None
+
     def color_dict_from_colorformat(self, cf: Any) -> dict | None:  # noqa: ANN401
+        color = self.color_from_colorformat(cf)
+        return color.model_dump(exclude_none=True) if color is not None else None
+
+    def color_from_xml(self, xclr: Any) -> Color | None:  # noqa: ANN401
+        """Resolve an ``a:srgbClr``/``a:schemeClr``/``a:sysClr`` element with its modifiers."""
+        try:
+            tag = etree.QName(xclr).localname
+            mods = tuple(
+                (etree.QName(m).localname, m.get("val", ""))
+                for m in xclr.iterchildren()
+                if isinstance(m.tag, str)
+            )
+            # sysClr's val names a system color ("windowText"); its RGB is in lastClr,
+            # as in `_parse_scheme`.
+            val = xclr.get("lastClr") if tag == "sysClr" else xclr.get("val")
+            key: ColorKey = (tag, val or "", mods)
+        except Exception:
+            note_suppressed()
+            return None
+        cache = self._colors
+        if key in cache.by_key:
+            cache.hits += 1
+            return cache.by_key[key]
+        cache.misses += 1
+        color = self._resolve(key)
+        if color is not None:
+            color = cache.interned.setdefault(color, color)
+        cache.by_key[key] = color
+        return color
+
+    def log_color_stats(self) -> None:
+        cache = self._colors
+        lookups = cache.hits + cache.misses
+        if not lookups:
+            return
+        logging.debug(
+            "color cache: %d/%d hits (%.1f%%), %d keys, %d distinct colors",
+            cache.hits,
+            lookups,
+            100.0 * cache.hits / lookups,
+            len(cache.by_key),
+            len(cache.interned),
+        )
+
+    def _resolve(self, key: ColorKey) -> Color | None:
+        tag, val, mods = key
+        theme_ref = None
+        if tag in ("srgbClr", "sysClr"):
+            if not val:
+                return None
+            base = val
+        elif tag == "schemeClr":
+            name = _SCHEME_ALIASES.get(val, val)
+            rgb = self.scheme.get(name)
+            if rgb is None:
+                return None
+            base = rgb[1:]
+            theme_ref = ThemeRef(key=name, tint=_brightness(mods))
+        else:
+            return None
+        try:
+            rgb_hex, alpha = _apply_modifiers(base, mods)
+            return Color(resolved_rgb=f"#{rgb_hex}", alpha=alpha, theme_ref=theme_ref)
+        except Exception:
+            note_suppressed()
+            return None
+
+    def _color_dict_from_proxy(self, cf: Any) -> dict | None:  # noqa: ANN401
         # Prefer theme color if present
         try:
             theme_enum = getattr(cf, "theme_color", None)
         except Exception:
+            note_suppressed()
             theme_enum = None
         key = self._key_from_theme_enum(theme_enum) if theme_enum else None
         if key:
@@ -118,5 +236,71 @@ class ThemeResolver:
             if rgb is not None:
                 return {"resolved_rgb": f"#{str(rgb)}"}
         except Exception:
+            note_suppressed()
             return None
         return None
+
+
+def _pct(val: str) -> float:
+    # DrawingML percentages are thousandths of a percent ("75000" is 75%).
+    return int(val) / 100000.0
+
+
+def _brightness(mods: tuple[tuple[str, str], ...]) -> float | None:
+    # Same reading as python-pptx `ColorFormat.brightness`: lumOff is a tint,
+    # a lone lumMod is a shade.
+    found = dict(mods)
+    try:
+        if "lumOff" in found:
+            return round(max(-1.0, min(1.0, _pct(found["lumOff"]))), 4)
+        if "lumMod" in found:
+            return round(max(-1.0, min(1.0, _pct(found["lumMod"]) - 1.0)), 4)
+    except ValueError:
+        return None
+    return None
+
+
+def _apply_modifiers(base: str, mods: tuple[tuple[str, str], ...]) -> tuple[str, float | None]:
+    """Apply lumMod/lumOff/tint/shade/alpha in document order to ``RRGGBB``."""
+    r, g, b = (int(base[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
+    alpha = None
+    for name, val in mods:
+        if name in ("lumMod", "lumOff"):
+            h, lum, sat = colorsys.rgb_to_hls(r, g, b)
+            lum = lum * _pct(val) if name == "lumMod" else lum + _pct(val)
+            r, g, b = colorsys.hls_to_rgb(h, max(0.0, min(1.0, lum)), sat)
+        elif name == "tint":
+            t = _pct(val)
+            r, g, b = (c * t + (1.0 - t) for c in (r, g, b))
+        elif name == "shade":
+            t = _pct(val)
+            r, g, b = (c * t for c in (r, g, b))
+        elif name == "alpha":
+            alpha = round(_pct(val), 4)
+    rgb_hex = "".join(f"{round(max(0.0, min(1.0, c)) * 255):02X}" for c in (r, g, b))
+    return rgb_hex, alpha
+
+
+def _parse_scheme(blob: bytes) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    try:
+        root = etree.fromstring(blob)
+    except Exception:
+        note_suppressed()
+        return dict(_DEFAULT_SCHEME)
+    scheme = next(root.iter(f"{{{SCHEMA_A}}}clrScheme"), None)
+    if scheme is None:
+        return dict(_DEFAULT_SCHEME)
+    for key in _SCHEME_KEYS:
+        node = scheme.find(f"{{{SCHEMA_A}}}{key}")
+        if node is None:
+            continue
+        # prefer srgbClr val; fallback to sysClr lastClr
+        srgb = node.find(f"{{{SCHEMA_A}}}srgbClr")
+        if srgb is not None and srgb.get("val"):
+            mapping[key] = f"#{srgb.get('val').upper()}"
+            continue
+        sys = node.find(f"{{{SCHEMA_A}}}sysClr")
+        if sys is not None and sys.get("lastClr"):
+            mapping[key] = f"#{sys.get('lastClr').upper()}"
+    return mapping or dict(_DEFAULT_SCHEME)
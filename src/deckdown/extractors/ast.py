@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 
 from deckdown.ast import Shape, SlideDoc, SlideModel, SlideSize
+from deckdown.cache import SlideCache
 from deckdown.extractors.context import ExtractContext
 from deckdown.extractors.handlers.base import ShapeHandler
 from deckdown.extractors.handlers.table_handler import TableShapeHandler
@@ -14,8 +15,13 @@ from deckdown.extractors.handlers.picture_handler import PictureShapeHandler
 from deckdown.extractors.handlers.basic_line_handler import BasicShapeHandler, LineShapeHandler
 from deckdown.extractors.handlers.text_handler import TextShapeHandler
 from deckdown.extractors.group import GroupExtractor
+from deckdown.extractors.registry import HandlerRegistry
 from deckdown.color.theme import ThemeResolver
-from deckdown.media import AssetStore, MediaEmbedMode
+from deckdown.media import AssetStore, MediaEmbedMode, MediaTable
+from deckdown.metrics import count, timed
+from deckdown.styles import StyleTable
+from deckdown.trace import phase, span
+from deckdown.utils.slide_range import SlideRange
 
 
 @dataclass(frozen=True)
@@ -28,16 +34,51 @@ class AstExtractor:
 
     media_mode: MediaEmbedMode = "base64"
     asset_store: AssetStore | None = None
+    media_table: MediaTable | None = None
+    style_table: StyleTable | None = None
+    cache: SlideCache | None = None
 
-    def extract(self, prs: Any) -> dict[int, SlideDoc]:  # noqa: ANN401
+    def extract(
+        self,
+        prs: Any,  # noqa: ANN401
+        slides: SlideRange | None = None,
+    ) -> dict[int, SlideDoc]:
+        return {doc.slide.index: doc for doc in self.iter_slides(prs, slides)}
+
+    def iter_slides(
+        self,
+        prs: Any,  # noqa: ANN401
+        slides: SlideRange | None = None,
+    ) -> Iterator[SlideDoc]:
+        """Yield one `SlideDoc` per slide, in order, without holding earlier slides.
+
+        With `slides`, only the selected 1-based indices are walked.
+        """
+        ctx = self.context(prs)
+        walker = self.walker()
+        for idx, slide in enumerate(prs.slides, start=1):
+            if slides is not None and not slides.contains(idx):
+                continue
+            with phase("walk", slide=idx):
+                doc = self.slide_doc(slide, idx, walker=walker, ctx=ctx)
+            yield doc
+        for theme in {id(t): t for t in (ctx.theme, *ctx.master_themes.values())}.values():
+            theme.log_color_stats()
+
+    def context(self, prs: Any) -> ExtractContext:  # noqa: ANN401
         size = SlideSize(width_emu=int(prs.slide_width), height_emu=int(prs.slide_height))
-        ctx = ExtractContext(
+        with phase("theme"):
+            theme = ThemeResolver.from_presentation(prs)
+        return ExtractContext(
             size=size,
-            theme=ThemeResolver.from_presentation(prs),
+            theme=theme,
             media_mode=self.media_mode,
             asset_store=self.asset_store,
+            media_table=self.media_table,
+            style_table=self.style_table,
         )
 
+    def walker(self) -> SlideWalker:
         handlers: tuple[ShapeHandler, ...] = (
             TableShapeHandler(),
             ChartShapeHandler(),
@@ -46,19 +87,42 @@ class AstExtractor:
             BasicShapeHandler(),
             TextShapeHandler(),
         )
-        group_extractor = GroupExtractor(handlers=handlers)
-        walker = SlideWalker(handlers=handlers, group_extractor=group_extractor)
+        registry = HandlerRegistry(handlers)
+        return SlideWalker(registry=registry, group_extractor=GroupExtractor(registry=registry))
 
-        out: dict[int, SlideDoc] = {}
-        for idx, slide in enumerate(prs.slides, start=1):
-            walked = walker.walk(slide.shapes, ctx=ctx)
-            out[idx] = SlideDoc(slide=SlideModel(index=idx, size=size, shapes=tuple(walked)))
-        return out
+    def build_slide(
+        self,
+        slide: Any,  # noqa: ANN401
+        index: int,
+        *,
+        walker: SlideWalker,
+        ctx: ExtractContext,
+    ) -> SlideDoc:
+        walked = walker.walk(slide.shapes, ctx=ctx.for_slide(slide))
+        return SlideDoc(slide=SlideModel(index=index, size=ctx.size, shapes=tuple(walked)))
+
+    def slide_doc(
+        self,
+        slide: Any,  # noqa: ANN401
+        index: int,
+        *,
+        walker: SlideWalker,
+        ctx: ExtractContext,
+    ) -> SlideDoc:
+        """`build_slide`, served from the slide cache when the slide is unchanged."""
+        if self.cache is None:
+            return self.build_slide(slide, index, walker=walker, ctx=ctx)
+        key = self.cache.key(slide, index, ctx)
+        doc = self.cache.get(key, ctx)
+        if doc is None:
+            doc = self.build_slide(slide, index, walker=walker, ctx=ctx)
+            self.cache.put(key, doc, ctx)
+        return doc
 
 
 @dataclass(frozen=True)
 class SlideWalker:
-    handlers: tuple[ShapeHandler, ...]
+    registry: HandlerRegistry
     group_extractor: GroupExtractor
 
     def walk(self, shapes: Iterable[Any], *, ctx: ExtractContext) -> list[Shape]:  # noqa: ANN401
@@ -76,18 +140,25 @@ class SlideWalker:
         ctx: ExtractContext,
         out: list[Shape],
     ) -> int:
-        if getattr(shp, "shape_type", None) == MSO_SHAPE_TYPE.GROUP:
-            children, next_z, group_shape = self.group_extractor.extract(shp, z_start=current_z, ctx=ctx)
+        shape_type = getattr(shp, "shape_type", None)
+        if shape_type == MSO_SHAPE_TYPE.GROUP:
+            with span("GroupExtractor", "handler"), timed("GroupExtractor"):
+                children, next_z, group_shape = self.group_extractor.extract(
+                    shp, z_start=current_z, ctx=ctx
+                )
+            count("extract.group")
             out.append(group_shape)
             out.extend(children)
             return next_z
 
-        for handler in self.handlers:
-            if not handler.supports(shp):
-                continue
+        handler = self.registry.handler_for(shp, shape_type)
+        if handler is None:
+            count("extract.unsupported")
+            return current_z
+        name = type(handler).__name__
+        with span(name, "handler"), timed(name):
             built = handler.build(shp, z=current_z, ctx=ctx)
-            if built is not None:
-                out.append(built)
-            return current_z + 1
-
-        return current_z
+        if built is not None:
+            count(f"extract.{built.kind.value}")
+            out.append(built)
+        return current_z + 1
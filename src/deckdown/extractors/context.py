@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from typing import Any
 
-from deckdown.ast import BBox, SlideSize
+from deckdown.ast import BBox, Media, SlideSize
 from deckdown.color.theme import ThemeResolver
-from deckdown.media import AssetStore, MediaEmbedMode
+from deckdown.media import AssetStore, MediaEmbedMode, MediaTable
+from deckdown.metrics import note_suppressed
+from deckdown.styles import StyleTable
 
 
 @dataclass(frozen=True)
@@ -13,6 +16,12 @@ class ExtractContext:
     theme: ThemeResolver
     media_mode: MediaEmbedMode = "base64"
     asset_store: AssetStore | None = None
+    media_table: MediaTable | None = None
+    style_table: StyleTable | None = None
+    # Built Media per image part name: each unique image is encoded/stored once per deck.
+    media_cache: dict[str, Media] = field(default_factory=dict)
+    # Theme per slide master part name: each master's theme is resolved once per deck.
+    master_themes: dict[str, ThemeResolver] = field(default_factory=dict)
 
     def bbox(self, *, left_emu: int, top_emu: int, width_emu: int, height_emu: int) -> BBox:
         width = float(self.size.width_emu or 1)
@@ -33,15 +42,33 @@ class ExtractContext:
             h_norm=_norm(height_emu, height),
         )
 
-    def with_offset(self, dx_emu: int, dy_emu: int) -> "ExtractContext":
+    def with_offset(self, dx_emu: int, dy_emu: int) -> ExtractContext:
         # For grouped shapes (future): an offset-aware context
         return ExtractContext(
             size=self.size,
             theme=self.theme,
             media_mode=self.media_mode,
             asset_store=self.asset_store,
+            media_table=self.media_table,
+            style_table=self.style_table,
+            media_cache=self.media_cache,
+            master_themes=self.master_themes,
         )
 
+    def for_slide(self, slide: Any) -> ExtractContext:  # noqa: ANN401
+        """This context with `theme` resolved through the slide's layout and master."""
+        try:
+            master = slide.slide_layout.slide_master
+            key = str(master.part.partname)
+        except Exception:
+            note_suppressed()
+            return self
+        theme = self.master_themes.get(key)
+        if theme is None:
+            theme = ThemeResolver.from_master(master) or self.theme
+            self.master_themes[key] = theme
+        return self if theme is self.theme else replace(self, theme=theme)
+
     def bbox_for_shape(self, shape: object) -> BBox:
         left = int(getattr(shape, "left", 0))
         top = int(getattr(shape, "top", 0))
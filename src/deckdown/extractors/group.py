@@ -7,12 +7,14 @@ from pptx.enum.shapes import MSO_SHAPE_TYPE
 
 from deckdown.ast import GroupShape, Shape
 from deckdown.extractors.context import ExtractContext
-from deckdown.extractors.handlers.base import ShapeHandler
+from deckdown.extractors.registry import HandlerRegistry
+from deckdown.metrics import count, timed
+from deckdown.trace import span
 
 
 @dataclass(frozen=True)
 class GroupExtractor:
-    handlers: tuple[ShapeHandler, ...]
+    registry: HandlerRegistry
 
     def extract(
         self, grp: Any, *, z_start: int, ctx: ExtractContext
@@ -38,11 +40,13 @@ class GroupExtractor:
             # Simpler: most handlers compute bbox via shape.left/top; we can create a small proxy with adjusted left/top
             proxy = _ShapeProxy(shp, dx=gx, dy=gy)
             built = None
-            for h in self.handlers:
-                if h.supports(proxy):
+            h = self.registry.handler_for(proxy, getattr(proxy, "shape_type", None))
+            if h is not None:
+                name = type(h).__name__
+                with span(name, "handler"), timed(name):
                     built = h.build(proxy, z=z, ctx=ctx)
-                    break
             if built is not None:
+                count(f"extract.{built.kind.value}")
                 # tag with group id using model_copy since models are frozen
                 built = built.model_copy(update={"group": group_id})  # type: ignore[attr-defined]
                 out.append(built)
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
+
+from pptx.enum.shapes import MSO_SHAPE_TYPE
 
 from deckdown.ast import Shape
 from deckdown.extractors.context import ExtractContext
 
 
 class ShapeHandler(ABC):
+    # Shape types the handler may claim; None offers it every shape (see `HandlerRegistry`).
+    shape_types: ClassVar[frozenset[MSO_SHAPE_TYPE] | None] = None
+
     @abstractmethod
     def supports(self, shape: Any) -> bool:  # noqa: ANN401
         ...
 
+    def accepts(self, shape: Any, shape_type: MSO_SHAPE_TYPE | None) -> bool:  # noqa: ANN401
+        """`supports` given the shape type already read by the dispatcher.
+
+        `shape_type` is recomputed from XML on every access, so handlers that
+        look at it should override this instead of reading it again.
+        """
+        return self.supports(shape)
+
     @abstractmethod
     def build(self, shape: Any, *, z: int, ctx: ExtractContext) -> Optional[Shape]:  # noqa: ANN401
         ...
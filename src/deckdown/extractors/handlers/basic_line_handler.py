@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
+from pptx.enum.dml import MSO_FILL
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 
 from deckdown.ast import (
     BasicShape,
     BasicStyle,
+    Color,
     FillSpec,
     LineShape,
     ShapeKind,
@@ -16,20 +18,29 @@ from deckdown.ast import (
 from deckdown.extractors.context import ExtractContext
 from deckdown.extractors.handlers.base import ShapeHandler
 from deckdown.extractors.utils import extract_text_payload
+from deckdown.metrics import measured, note_suppressed
 
 
-def _color_from_fill(fill: Any, ctx: ExtractContext) -> dict | None:  # noqa: ANN401
+_FORE_COLOR_FILLS = frozenset({MSO_FILL.SOLID, MSO_FILL.PATTERNED})
+
+
+def _color_from_fill(fill: Any, ctx: ExtractContext) -> Color | None:  # noqa: ANN401
+    # Other fill types (and no fill) raise on `fore_color`; that is expected, not a failure.
+    if getattr(fill, "type", None) not in _FORE_COLOR_FILLS:
+        return None
     try:
         fc = getattr(fill, "fore_color", None)
         if fc is not None:
-            data = ctx.theme.color_dict_from_colorformat(fc)
+            data = ctx.theme.color_from_colorformat(fc)
             if data:
                 return data
     except Exception:
+        note_suppressed()
         return None
     return None
 
 
+@measured
 def _basic_style(shp: Any, ctx: ExtractContext) -> BasicStyle | None:  # noqa: ANN401
     try:
         fill_color = _color_from_fill(getattr(shp, "fill", None), ctx)
@@ -41,25 +52,31 @@ def _basic_style(shp: Any, ctx: ExtractContext) -> BasicStyle | None:  # noqa: A
             try:
                 stroke_color = _color_from_fill(getattr(line, "fill", None), ctx)
             except Exception:
-                pass
+                note_suppressed()
             try:
                 if getattr(line, "width", None) is not None:
                     width_pt = round(float(line.width.pt), 2)  # type: ignore[union-attr]
             except Exception:
-                pass
+                note_suppressed()
         if fill_color or stroke_color or width_pt:
             return BasicStyle(
                 fill=FillSpec(color=fill_color) if fill_color else None,
                 stroke=StrokeSpec(color=stroke_color, width_pt=width_pt, dash=dash),
             )
     except Exception:
+        note_suppressed()
         return None
     return None
 
 
 class BasicShapeHandler(ShapeHandler):
+    shape_types = frozenset({MSO_SHAPE_TYPE.AUTO_SHAPE})
+
     def supports(self, shape: Any) -> bool:  # noqa: ANN401
-        return getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.AUTO_SHAPE
+        return self.accepts(shape, getattr(shape, "shape_type", None))
+
+    def accepts(self, shape: Any, shape_type: MSO_SHAPE_TYPE | None) -> bool:  # noqa: ANN401
+        return shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE
 
     def build(self, shape: Any, *, z: int, ctx: ExtractContext) -> Optional[BasicShape]:  # noqa: ANN401
         bbox = ctx.bbox_for_shape(shape)
@@ -69,11 +86,12 @@ class BasicShapeHandler(ShapeHandler):
         style = _basic_style(shape, ctx)
         text_payload: TextPayload | None = None
         if getattr(shape, "has_text_frame", False):
-            text_payload = extract_text_payload(shape.text_frame, ctx.theme)
+            text_payload = extract_text_payload(shape.text_frame, ctx.theme, ctx.style_table)
         rot = None
         try:
             rot = float(getattr(shape, "rotation"))  # type: ignore[arg-type]
         except Exception:
+            note_suppressed()
             rot = None
         return BasicShape(
             id=f"s{getattr(shape, 'shape_id', z)}",
@@ -89,8 +107,13 @@ class BasicShapeHandler(ShapeHandler):
 
 
 class LineShapeHandler(ShapeHandler):
+    shape_types = frozenset({MSO_SHAPE_TYPE.LINE})
+
     def supports(self, shape: Any) -> bool:  # noqa: ANN401
-        return getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.LINE
+        return self.accepts(shape, getattr(shape, "shape_type", None))
+
+    def accepts(self, shape: Any, shape_type: MSO_SHAPE_TYPE | None) -> bool:  # noqa: ANN401
+        return shape_type == MSO_SHAPE_TYPE.LINE
 
     def build(self, shape: Any, *, z: int, ctx: ExtractContext) -> Optional[LineShape]:  # noqa: ANN401
         bbox = ctx.bbox_for_shape(shape)
@@ -99,6 +122,7 @@ class LineShapeHandler(ShapeHandler):
         try:
             rot = float(getattr(shape, "rotation"))  # type: ignore[arg-type]
         except Exception:
+            note_suppressed()
             rot = None
         return LineShape(
             id=f"s{getattr(shape, 'shape_id', z)}",
@@ -18,9 +18,11 @@ from deckdown.ast import (
 )
 from deckdown.extractors.context import ExtractContext
 from deckdown.extractors.handlers.base import ShapeHandler
+from deckdown.metrics import note_suppressed
 
 
 class ChartShapeHandler(ShapeHandler):
+    # Chart placeholders report PLACEHOLDER, not CHART, so every shape is offered.
     def supports(self, shape: Any) -> bool:  # noqa: ANN401
         return bool(getattr(shape, "has_chart", False))
 
@@ -70,64 +72,47 @@ class ChartShapeHandler(ShapeHandler):
                 ctype = str(ctype_enum).split(" ")[0].lower()
 
         plots = list(getattr(ch, "plots", ()))
-        cats: list[str | float] = []
-        if plots:
+        cats: list[str | float] | None = None
+        series_out: list[ChartSeriesModel] = []
+        for plot in plots:
             try:
-                raw = list(plots[0].categories)
-                cats = [self._cat_value(val) for val in raw]
+                plot_series = list(plot.series)
             except Exception:
-                cats = []
-
-        series_out: list[ChartSeriesModel] = []
-        if plots:
-            for ser in plots[0].series:
+                note_suppressed()
+                plot_series = []
+            for ser in plot_series:
+                # Point caches and dPt overrides come from one walk of the c:ser element;
+                # python-pptx re-runs an xpath per point for `values` and per `points` item.
+                caches, dpt_idxs = self._series_caches(getattr(ser, "_element", None))
+                if cats is None and "cat" in caches:
+                    cats = list(caches["cat"])
                 name = getattr(ser, "name", None)
-                vals = tuple(getattr(ser, "values", ()) or ())
-                xvals = None
-                sizes = None
-                # scatter/bubble carry x and sizes
-                try:
-                    xv = getattr(ser, "x_values", None)
-                    if xv is not None:
-                        xvals = tuple(xv)
-                except Exception:
-                    xvals = None
-                if xvals is None:
-                    x_cache = self._extract_numeric_values(getattr(ser, "_ser", None), "xVal")
-                    if x_cache:
-                        xvals = tuple(x_cache)
-                try:
-                    bs = getattr(ser, "bubble_sizes", None)
-                    if bs is not None:
-                        sizes = tuple(bs)
-                except Exception:
-                    sizes = None
-                if sizes is None and ctype in ("bubble",):
-                    s_cache = self._extract_numeric_values(getattr(ser, "_ser", None), "bubbleSize")
-                    if s_cache:
-                        sizes = tuple(s_cache)
+                vals = caches.get("val", caches.get("yVal", ())) or ()
+                xvals = caches.get("xVal") or None
+                sizes = caches.get("bubbleSize") or None
                 color = None
                 try:
-                    f = ser.format.fill
-                    fc = getattr(f, "fore_color", None)
-                    if fc is not None:
-                        color = ctx.theme.color_dict_from_colorformat(fc)
+                    if ser._element.spPr is not None:
+                        f = ser.format.fill
+                        fc = getattr(f, "fore_color", None)
+                        if fc is not None:
+                            color = ctx.theme.color_from_colorformat(fc)
                 except Exception:
+                    note_suppressed()
                     color = None
                 points_meta: list[ChartDataPoint] = []
-                try:
-                    for idx, pt in enumerate(ser.points):
+                for idx in dpt_idxs:
+                    pc = None
+                    try:
+                        pt = ser.points[idx]
+                        fc = getattr(getattr(pt.format, "fill", None), "fore_color", None)
+                        if fc is not None:
+                            pc = ctx.theme.color_from_colorformat(fc)
+                    except Exception:
+                        note_suppressed()
                         pc = None
-                        try:
-                            fc = getattr(getattr(pt.format, "fill", None), "fore_color", None)
-                            if fc is not None:
-                                pc = ctx.theme.color_dict_from_colorformat(fc)
-                        except Exception:
-                            pc = None
-                        if pc:
-                            points_meta.append(ChartDataPoint(idx=idx, color=pc))
-                except Exception:
-                    points_meta = []
+                    if pc:
+                        points_meta.append(ChartDataPoint(idx=idx, color=pc))
                 labels = None
                 try:
                     dl = getattr(ser, "data_labels", None)
@@ -144,22 +129,23 @@ class ChartShapeHandler(ShapeHandler):
                                 if val is not None:
                                     labels[key] = bool(val)
                             except Exception:
-                                pass
+                                note_suppressed()
                         try:
                             pos = getattr(dl, "position", None)
                             if pos is not None:
                                 labels["position"] = str(pos).split(" ")[0].lower()
                         except Exception:
-                            pass
+                            note_suppressed()
                         try:
                             fmt = getattr(dl, "number_format", None)
                             if fmt:
                                 labels["number_format"] = str(fmt)
                         except Exception:
-                            pass
+                            note_suppressed()
                         if not labels:
                             labels = None
                 except Exception:
+                    note_suppressed()
                     labels = None
 
                 series_out.append(
@@ -192,16 +178,17 @@ class ChartShapeHandler(ShapeHandler):
 
         axes_category = None
         axes_value = None
+        has_category_axis, has_value_axis = _axis_presence(ch)
         try:
-            ca = getattr(ch, "category_axis", None)
+            ca = getattr(ch, "category_axis", None) if has_category_axis else None
             if ca is not None and getattr(ca, "has_title", False):
                 title = getattr(getattr(ca, "axis_title", None), "text_frame", None)
                 if title is not None and title.text:
                     axes_category = CategoryAxis(title=str(title.text))
         except Exception:
-            pass
+            note_suppressed()
         try:
-            va = getattr(ch, "value_axis", None)
+            va = getattr(ch, "value_axis", None) if has_value_axis else None
             if va is not None:
                 v_args: dict[str, float | str] = {}
                 try:
@@ -210,7 +197,7 @@ class ChartShapeHandler(ShapeHandler):
                         if t is not None and t.text:
                             v_args["title"] = str(t.text)
                 except Exception:
-                    pass
+                    note_suppressed()
                 for key, attr in (
                     ("min", "minimum_scale"),
                     ("max", "maximum_scale"),
@@ -221,17 +208,17 @@ class ChartShapeHandler(ShapeHandler):
                         if val is not None:
                             v_args[key] = float(val)
                     except Exception:
-                        pass
+                        note_suppressed()
                 try:
                     fmt = getattr(getattr(va, "tick_labels", None), "number_format", None)
                     if fmt:
                         v_args["format_code"] = str(fmt)
                 except Exception:
-                    pass
+                    note_suppressed()
                 if v_args:
                     axes_value = ValueAxis(**v_args)
         except Exception:
-            pass
+            note_suppressed()
 
         axes = None
         if axes_category or axes_value:
@@ -243,6 +230,7 @@ class ChartShapeHandler(ShapeHandler):
             if style_val is not None:
                 style = int(style_val)
         except Exception:
+            note_suppressed()
             style = None
 
         return ChartShape(
@@ -255,7 +243,7 @@ class ChartShapeHandler(ShapeHandler):
             chart=ChartPayload(
                 type=ctype or "unknown",
                 subtype=subtype,
-                categories=tuple(cats),
+                categories=tuple(cats or ()),
                 series=tuple(series_out),
                 plot_area=plot_area,
                 axes=axes,
@@ -264,63 +252,131 @@ class ChartShapeHandler(ShapeHandler):
         )
 
     @staticmethod
-    def _extract_numeric_values(ser_obj: Any, attr: str) -> tuple[float | None, ...] | None:  # noqa: ANN401
-        if ser_obj is None:
-            return None
-        try:
-            data_src = getattr(ser_obj, attr)
-        except Exception:
-            data_src = None
-        if data_src is None:
-            return None
-        try:
-            containers = list(data_src.getchildren())
-        except Exception:
-            return None
-        values: list[float | None] = []
-        for container in containers:
-            tag = getattr(container, "tag", "")
-            if tag.endswith("numRef"):
-                cache = ChartShapeHandler._find_child(container, "numCache")
-                if cache is not None:
-                    values.extend(ChartShapeHandler._collect_numeric_points(cache))
-            elif tag.endswith("numLit"):
-                values.extend(ChartShapeHandler._collect_numeric_points(container))
-        return tuple(values) if values else None
+    def _series_caches(
+        ser_el: Any,  # noqa: ANN401
+    ) -> tuple[dict[str, tuple[Any, ...]], list[int]]:
+        """Read a ``c:ser`` element's point caches and ``c:dPt`` indices in one walk.
+
+        Returns caches keyed by source tag (``cat``, ``val``, ``xVal``, ``yVal``,
+        ``bubbleSize``) plus the sorted indices of points carrying an override.
+        """
+        caches: dict[str, tuple[Any, ...]] = {}
+        dpt_idxs: list[int] = []
+        if ser_el is None:
+            return caches, dpt_idxs
+        for child in ser_el.iterchildren():
+            local = _local(child.tag)
+            if local == "dPt":
+                idx_el = child.find(_C + "idx")
+                try:
+                    dpt_idxs.append(int(idx_el.get("val")))
+                except Exception:
+                    note_suppressed()
+                    continue
+            elif local == "cat":
+                labels = ChartShapeHandler._cache_points(child, numeric=False)
+                if labels is not None:
+                    caches[local] = tuple("" if v is None else v for v in labels)
+            elif local in _NUMERIC_SOURCES:
+                values = ChartShapeHandler._cache_points(child, numeric=True)
+                if values is not None:
+                    caches[local] = values
+        dpt_idxs.sort()
+        return caches, dpt_idxs
 
     @staticmethod
-    def _find_child(node: Any, suffix: str) -> Any | None:  # noqa: ANN401
-        try:
-            for child in node.getchildren():
-                if getattr(child, "tag", "").endswith(suffix):
-                    return child
-        except Exception:
+    def _cache_points(source: Any, *, numeric: bool) -> tuple[Any, ...] | None:  # noqa: ANN401
+        """Expand a data source's cache into a dense, ``idx``-ordered tuple.
+
+        Missing ``c:pt`` entries become ``None``. Numeric reads only accept
+        ``numRef``/``numLit`` sources; multi-level categories use the first level.
+        """
+        cache = ChartShapeHandler._find_cache(source, numeric=numeric)
+        if cache is None:
             return None
+        count, pts = ChartShapeHandler._read_cache(cache)
+        out: list[Any] = [None] * count
+        for idx, text in pts.items():
+            if text is None or not numeric:
+                out[idx] = text
+                continue
+            try:
+                out[idx] = float(text)
+            except ValueError:
+                out[idx] = None
+        return tuple(out)
+
+    @staticmethod
+    def _find_cache(source: Any, *, numeric: bool) -> Any | None:  # noqa: ANN401
+        for ref in source.iterchildren():
+            local = _local(ref.tag)
+            if local in ("numLit", "strLit"):
+                cache = ref
+            elif local in ("numRef", "strRef", "multiLvlStrRef"):
+                cache = ref.find(_C + local[:-3] + "Cache")
+            else:
+                continue
+            return None if numeric and not local.startswith("num") else cache
         return None
 
     @staticmethod
-    def _collect_numeric_points(container: Any) -> list[float | None]:  # noqa: ANN401
-        pts: list[float | None] = []
+    def _read_cache(cache: Any) -> tuple[int, dict[int, str | None]]:  # noqa: ANN401
+        """(dense length, point texts by idx) of a ``c:numCache``/``c:strCache``-like element.
+
+        ``ptCount`` and ``idx`` come from the file, so both are bounded by
+        `_MAX_POINTS` before they size the dense tuple.
+        """
+        count = 0
+        pts: dict[int, str | None] = {}
+        for el in cache.iterchildren():
+            local = _local(el.tag)
+            if local == "ptCount":
+                try:
+                    count = int(el.get("val"))
+                except Exception:
+                    note_suppressed()
+                    count = 0
+            elif local == "pt":
+                ChartShapeHandler._read_pt(el, pts)
+            elif local == "lvl" and not pts:
+                for pt in el.iterchildren(_C + "pt"):
+                    ChartShapeHandler._read_pt(pt, pts)
+        count = max(0, min(count, _MAX_POINTS))
+        if pts:
+            count = max(count, max(pts) + 1)
+        return count, pts
+
+    @staticmethod
+    def _read_pt(pt: Any, into: dict[int, str | None]) -> None:  # noqa: ANN401
         try:
-            children = container.getchildren()
+            idx = int(pt.get("idx"))
         except Exception:
-            return pts
-        for child in children:
-            if not getattr(child, "tag", "").endswith("pt"):
-                continue
-            try:
-                v_el = child.getchildren()[0]
-                txt = getattr(v_el, "text", None)
-                pts.append(float(txt) if txt is not None else None)
-            except Exception:
-                pts.append(None)
-        return pts
+            note_suppressed()
+            return
+        if not 0 <= idx < _MAX_POINTS:
+            return
+        v_el = pt.find(_C + "v")
+        into[idx] = v_el.text if v_el is not None else None
 
-    @staticmethod
-    def _cat_value(val: Any) -> str | float:  # noqa: ANN401
-        if hasattr(val, "label"):
-            try:
-                return str(val.label)
-            except Exception:
-                return str(val)
-        return val
+_C = "{http://schemas.openxmlformats.org/drawingml/2006/chart}"
+_NUMERIC_SOURCES = frozenset({"val", "xVal", "yVal", "bubbleSize"})
+# Excel's row limit: no cached series can hold more points than a sheet has rows.
+_MAX_POINTS = 1_048_576
+
+
+def _local(tag: Any) -> str:  # noqa: ANN401
+    # Comments and processing instructions carry a non-string tag.
+    return tag.rpartition("}")[2] if isinstance(tag, str) else ""
+
+
+def _axis_presence(chart: Any) -> tuple[bool, bool]:  # noqa: ANN401
+    """Whether `chart` has a category and a value axis.
+
+    python-pptx raises `ValueError` for missing axes, which is the normal case
+    for pie and doughnut charts, so check the plot area instead of catching it.
+    """
+    cs = getattr(chart, "_chartSpace", None)
+    if cs is None:
+        return True, True  # not a python-pptx chart: let the attribute reads decide
+    has_value = bool(cs.valAx_lst)
+    return has_value or bool(cs.catAx_lst) or bool(cs.dateAx_lst), has_value
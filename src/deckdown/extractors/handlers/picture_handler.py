@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 from typing import Any, Optional
 
 from pptx.enum.shapes import MSO_SHAPE_TYPE
@@ -8,43 +7,27 @@ from pptx.enum.shapes import MSO_SHAPE_TYPE
 from deckdown.ast import CropSpec, Media, PicturePayload, PictureShape, ShapeKind
 from deckdown.extractors.context import ExtractContext
 from deckdown.extractors.handlers.base import ShapeHandler
+from deckdown.media import data_url_for
+from deckdown.metrics import media_bytes, note_suppressed
 
 
 class PictureShapeHandler(ShapeHandler):
+    shape_types = frozenset({MSO_SHAPE_TYPE.PICTURE})
+
     def supports(self, shape: Any) -> bool:  # noqa: ANN401
-        return getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.PICTURE
+        return self.accepts(shape, getattr(shape, "shape_type", None))
+
+    def accepts(self, shape: Any, shape_type: MSO_SHAPE_TYPE | None) -> bool:  # noqa: ANN401
+        return shape_type == MSO_SHAPE_TYPE.PICTURE
 
     def build(self, shape: Any, *, z: int, ctx: ExtractContext) -> Optional[PictureShape]:  # noqa: ANN401
         bbox = ctx.bbox_for_shape(shape)
-        blob: bytes | None = None
-        content_type = "application/octet-stream"
-        try:
-            image = getattr(shape, "image", None)
-            if image is not None:
-                blob = getattr(image, "blob", None)
-                content_type = getattr(image, "content_type", content_type)
-        except Exception:
-            blob = None
-            content_type = "application/octet-stream"
-
-        data_url: str | None = None
-        try:
-            include_data_url = ctx.media_mode == "base64" or ctx.asset_store is None
-            if blob and include_data_url:
-                b64 = base64.b64encode(blob).decode("ascii")
-                data_url = f"data:{content_type};base64,{b64}"
-        except Exception:
-            data_url = None
-
-        ref: str | None = None
-        if blob and ctx.media_mode == "refs" and ctx.asset_store is not None:
-            hint_raw = getattr(shape, "name", None)
-            hint = str(hint_raw) if hint_raw else None
-            ref = ctx.asset_store.save_image(
-                blob=blob,
-                content_type=content_type,
-                name_hint=hint,
-            )
+        part_key = self._image_part_key(shape)
+        media = ctx.media_cache.get(part_key) if part_key is not None else None
+        if media is None:
+            media = self._build_media(shape, ctx)
+            if part_key is not None:
+                ctx.media_cache[part_key] = media
 
         # crop values
         crop: CropSpec | None = None
@@ -56,6 +39,7 @@ class PictureShapeHandler(ShapeHandler):
             if any(v != 0.0 for v in (cl, cr, ct, cb)):
                 crop = CropSpec(left=cl, right=cr, top=ct, bottom=cb)
         except Exception:
+            note_suppressed()
             crop = None
         alt = None
         try:
@@ -63,14 +47,16 @@ class PictureShapeHandler(ShapeHandler):
             if alt:
                 alt = str(alt)
         except Exception:
+            note_suppressed()
             alt = None
         rot = None
         try:
             rot = float(getattr(shape, "rotation"))  # type: ignore[arg-type]
         except Exception:
+            note_suppressed()
             rot = None
         payload = PicturePayload(
-            media=Media(data_url=data_url, ref=ref),
+            media=media,
             crop=crop,
             opacity=None,
             alt=alt,
@@ -84,3 +70,40 @@ class PictureShapeHandler(ShapeHandler):
             rotation=rot,
             image=payload,
         )
+
+    @staticmethod
+    def _image_part_key(shape: Any) -> str | None:  # noqa: ANN401
+        # Pictures sharing an image part (e.g. a logo on every slide) share one Media.
+        try:
+            rid = shape._element.blip_rId
+            return str(shape.part.related_part(rid).partname) if rid else None
+        except Exception:
+            note_suppressed()
+            return None
+
+    def _build_media(self, shape: Any, ctx: ExtractContext) -> Media:  # noqa: ANN401
+        blob: bytes | None = None
+        content_type = "application/octet-stream"
+        try:
+            image = getattr(shape, "image", None)
+            if image is not None:
+                blob = getattr(image, "blob", None)
+                content_type = getattr(image, "content_type", content_type)
+        except Exception:
+            note_suppressed()
+            blob = None
+            content_type = "application/octet-stream"
+        if not blob:
+            return Media()
+        media_bytes("extract", len(blob))
+
+        if ctx.media_mode == "refs" and ctx.asset_store is not None:
+            ref = ctx.asset_store.save_image(blob=blob, content_type=content_type)
+            return Media(ref=ref)
+        if ctx.media_mode == "shared" and ctx.media_table is not None:
+            return Media(ref=ctx.media_table.add_blob(blob, content_type))
+        try:
+            return Media(data_url=data_url_for(blob, content_type))
+        except Exception:
+            note_suppressed()
+            return Media()
@@ -4,30 +4,38 @@ from typing import Any, Optional
 
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 
-from pptx.oxml.ns import qn
-from deckdown.ast import ShapeKind, TableCell, TablePayload, TableShape, TextPayload
+from deckdown.ast import Color, ShapeKind, TableCell, TablePayload, TableShape, TextPayload
 from deckdown.extractors.context import ExtractContext
 from deckdown.extractors.handlers.base import ShapeHandler
 from deckdown.extractors.utils import extract_text_payload
+from deckdown.metrics import note_suppressed
 
 
 class TableShapeHandler(ShapeHandler):
+    shape_types = frozenset({MSO_SHAPE_TYPE.TABLE})
+
     def supports(self, shape: Any) -> bool:  # noqa: ANN401
-        return getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.TABLE and bool(
-            getattr(shape, "has_table", False)
-        )
+        return self.accepts(shape, getattr(shape, "shape_type", None))
 
-    def _cell_fill(self, cell: Any, ctx: ExtractContext) -> dict | None:  # noqa: ANN401
+    def accepts(self, shape: Any, shape_type: MSO_SHAPE_TYPE | None) -> bool:  # noqa: ANN401
+        return shape_type == MSO_SHAPE_TYPE.TABLE and bool(getattr(shape, "has_table", False))
+
+    def _cell_fill(self, cell: Any, ctx: ExtractContext) -> Color | None:  # noqa: ANN401
         try:
+            # Read-only fast path: `cell.fill` would add an empty tcPr to unfilled cells.
+            tc_pr = cell._tc.tcPr
+            if tc_pr is None or tc_pr.eg_fillProperties is None:
+                return None
             fill = getattr(cell, "fill", None)
             if fill is None:
                 return None
             fore = getattr(fill, "fore_color", None)
             if fore is None:
                 return None
-            data = ctx.theme.color_dict_from_colorformat(fore)
+            data = ctx.theme.color_from_colorformat(fore)
             return data
         except Exception:
+            note_suppressed()
             return None
 
     def build(self, shape: Any, *, z: int, ctx: ExtractContext) -> Optional[TableShape]:  # noqa: ANN401
@@ -35,52 +43,28 @@ class TableShapeHandler(ShapeHandler):
         tbl = shape.table
         n_rows = len(tbl.rows)
         n_cols = len(tbl.columns)
-        colspans = [[1 for _ in range(n_cols)] for _ in range(n_rows)]
-        rowspans = [[1 for _ in range(n_cols)] for _ in range(n_rows)]
-        hmerge = [[False for _ in range(n_cols)] for _ in range(n_rows)]
-        vmerge = [[False for _ in range(n_cols)] for _ in range(n_rows)]
-        for r in range(n_rows):
-            for c in range(n_cols):
-                tc = tbl.cell(r, c)._tc
-                gs = tc.get("gridSpan")
-                rs = tc.get("rowSpan")
-                hm = tc.get("hMerge")
-                vm = tc.get("vMerge")
-                if gs:
-                    try:
-                        colspans[r][c] = max(1, int(gs))
-                    except Exception:
-                        pass
-                if rs:
-                    try:
-                        rowspans[r][c] = max(1, int(rs))
-                    except Exception:
-                        pass
-                if hm:
-                    hmerge[r][c] = True
-                if vm:
-                    vmerge[r][c] = True
-
-        visited: set[tuple[int, int]] = set()
+        # One pass over a:tr/a:tc in grid order: `tbl.cell(r, c)` re-runs the row/cell
+        # lookup on every call, so spans, merges, text and fill are all read per cell here.
+        covered: set[tuple[int, int]] = set()
         out_cells: list[TableCell] = []
-        for r in range(n_rows):
-            for c in range(n_cols):
-                if (r, c) in visited:
-                    continue
-                if hmerge[r][c] or vmerge[r][c]:
-                    continue
-                rowspan = max(1, rowspans[r][c])
-                colspan = max(1, colspans[r][c])
+        for i, cell in enumerate(tbl.iter_cells()):
+            r, c = divmod(i, n_cols)
+            if r >= n_rows:
+                break
+            tc = cell._tc
+            if (r, c) in covered or tc.get("hMerge") or tc.get("vMerge"):
+                continue
+            rowspan = _span(tc.get("rowSpan"))
+            colspan = _span(tc.get("gridSpan"))
+            if rowspan > 1 or colspan > 1:
                 for rr in range(r, min(r + rowspan, n_rows)):
                     for cc in range(c, min(c + colspan, n_cols)):
-                        if rr == r and cc == c:
-                            continue
-                        visited.add((rr, cc))
-                text: TextPayload = extract_text_payload(tbl.cell(r, c).text_frame, ctx.theme)
-                fill = self._cell_fill(tbl.cell(r, c), ctx)
-                out_cells.append(
-                    TableCell(r=r, c=c, rowspan=rowspan, colspan=colspan, text=text, fill=fill)
-                )
+                        covered.add((rr, cc))
+            text: TextPayload = extract_text_payload(cell.text_frame, ctx.theme, ctx.style_table)
+            fill = self._cell_fill(cell, ctx)
+            out_cells.append(
+                TableCell(r=r, c=c, rowspan=rowspan, colspan=colspan, text=text, fill=fill)
+            )
 
         header_row = bool(getattr(tbl, "first_row", False))
         payload = TablePayload(
@@ -98,3 +82,12 @@ class TableShapeHandler(ShapeHandler):
             rotation=None,
             table=payload,
         )
+
+
+def _span(value: str | None) -> int:
+    if not value:
+        return 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return 1
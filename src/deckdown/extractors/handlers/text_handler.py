@@ -8,22 +8,27 @@ from deckdown.ast import ShapeKind, TextPayload, TextShape
 from deckdown.extractors.context import ExtractContext
 from deckdown.extractors.handlers.base import ShapeHandler
 from deckdown.extractors.utils import extract_text_payload
+from deckdown.metrics import note_suppressed
 
 
 class TextShapeHandler(ShapeHandler):
+    # Any type with a text frame (text boxes, placeholders, freeforms, ...), so no `shape_types`.
     def supports(self, shape: Any) -> bool:  # noqa: ANN401
-        st = getattr(shape, "shape_type", None)
-        if st in (MSO_SHAPE_TYPE.TABLE, MSO_SHAPE_TYPE.LINE, MSO_SHAPE_TYPE.AUTO_SHAPE):
+        return self.accepts(shape, getattr(shape, "shape_type", None))
+
+    def accepts(self, shape: Any, shape_type: MSO_SHAPE_TYPE | None) -> bool:  # noqa: ANN401
+        if shape_type in (MSO_SHAPE_TYPE.TABLE, MSO_SHAPE_TYPE.LINE, MSO_SHAPE_TYPE.AUTO_SHAPE):
             return False
         return bool(getattr(shape, "has_text_frame", False))
 
     def build(self, shape: Any, *, z: int, ctx: ExtractContext) -> Optional[TextShape]:  # noqa: ANN401
         bbox = ctx.bbox_for_shape(shape)
-        text: TextPayload = extract_text_payload(shape.text_frame, ctx.theme)
+        text: TextPayload = extract_text_payload(shape.text_frame, ctx.theme, ctx.style_table)
         rot = None
         try:
             rot = float(getattr(shape, "rotation"))  # type: ignore[arg-type]
         except Exception:
+            note_suppressed()
             rot = None
         return TextShape(
             id=f"s{getattr(shape, 'shape_id', z)}",
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+from deckdown.ast import SlideDoc
+from deckdown.cache import DEFAULT_CACHE_MAX_BYTES, SlideCache
+from deckdown.extractors.ast import AstExtractor, SlideWalker
+from deckdown.extractors.context import ExtractContext
+from deckdown.loader import Loader
+from deckdown.media import AssetStore, MediaEmbedMode, MediaTable
+from deckdown.metrics import active, collecting, merge_from_worker
+from deckdown.styles import StyleTable
+from deckdown.utils.slide_range import SlideRange
+
+__all__ = ["ParallelAstExtractor", "partition_indices"]
+
+# Per-worker state: the package is opened once per worker process, not per chunk.
+_WORKER: dict[str, Any] = {}
+
+
+def partition_indices(count: int, chunks: int) -> list[tuple[int, ...]]:
+    """Split 1-based slide indices 1..count into up to `chunks` contiguous runs."""
+    if count <= 0:
+        return []
+    chunks = max(1, min(chunks, count))
+    size, extra = divmod(count, chunks)
+    out: list[tuple[int, ...]] = []
+    start = 1
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        out.append(tuple(range(start, end)))
+        start = end
+    return out
+
+
+def _init_worker(
+    path: str,
+    media_mode: MediaEmbedMode,
+    markdown_path: str | None,
+    cache_dir: str | None,
+    cache_max_bytes: int,
+    compact_styles: bool,
+    collect_metrics: bool = False,
+) -> None:
+    prs = Loader(path).presentation()
+    # Content-addressed names keep per-worker stores consistent with each other.
+    store = AssetStore(Path(markdown_path)) if markdown_path is not None else None
+    table = MediaTable() if media_mode == "shared" else None
+    # Entries are written atomically under their digest, so workers can share one directory.
+    cache = SlideCache(Path(cache_dir), cache_max_bytes) if cache_dir is not None else None
+    extractor = AstExtractor(
+        media_mode=media_mode,
+        asset_store=store,
+        media_table=table,
+        style_table=StyleTable() if compact_styles else None,
+        cache=cache,
+    )
+    _WORKER["slides"] = list(prs.slides)
+    _WORKER["extractor"] = extractor
+    _WORKER["ctx"] = extractor.context(prs)
+    _WORKER["walker"] = extractor.walker()
+    _WORKER["collect_metrics"] = collect_metrics
+
+
+def _extract_chunk(
+    indices: tuple[int, ...],
+) -> tuple[list[tuple[int, bytes]], dict[str, str], dict[str, dict], dict[str, Any] | None]:
+    extractor: AstExtractor = _WORKER["extractor"]
+    ctx: ExtractContext = _WORKER["ctx"]
+    walker: SlideWalker = _WORKER["walker"]
+    slides = _WORKER["slides"]
+    out: list[tuple[int, bytes]] = []
+    with collecting() if _WORKER.get("collect_metrics") else nullcontext() as registry:
+        for idx in indices:
+            doc = extractor.slide_doc(slides[idx - 1], idx, walker=walker, ctx=ctx)
+            # Ship compact JSON bytes back; pickling frozen pydantic trees is far slower.
+            out.append((idx, doc.model_dump_json().encode("utf-8")))
+    # Media-table entries first seen by this worker travel with the chunk that uses them.
+    table = extractor.media_table
+    styles = extractor.style_table
+    return (
+        out,
+        table.drain_new() if table is not None else {},
+        styles.drain_new() if styles is not None else {},
+        registry.to_dict() if registry is not None else None,
+    )
+
+
+@dataclass(frozen=True)
+class ParallelAstExtractor:
+    """Extract slides of one deck across worker processes.
+
+    Each worker opens the package itself and runs the regular handler pipeline
+    on its share of slide indices. Results come back as JSON bytes and are
+    re-validated in slide order, so the output matches `AstExtractor.extract`.
+    In refs mode each worker writes assets through its own `AssetStore` rooted
+    at `markdown_path`; in shared mode new media-table entries are merged into
+    `media_table` before the slides that use them are yielded, and likewise
+    new style-table entries into `style_table` (compact styles). With `cache_dir`,
+    workers read and write the shared slide cache (see `SlideCache`). While
+    metrics are being collected (`deckdown.metrics.collecting`), each chunk's
+    handler metrics are merged into the parent's registry.
+    """
+
+    jobs: int
+    media_mode: MediaEmbedMode = "base64"
+    markdown_path: Path | None = None
+    chunks_per_job: int = 4
+    cache_dir: Path | None = None
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+
+    def extract(
+        self,
+        path: str | PathLike[str],
+        *,
+        slide_count: int,
+        media_table: MediaTable | None = None,
+        style_table: StyleTable | None = None,
+        slides: SlideRange | None = None,
+    ) -> dict[int, SlideDoc]:
+        docs = self.iter_slides(
+            path,
+            slide_count=slide_count,
+            media_table=media_table,
+            style_table=style_table,
+            slides=slides,
+        )
+        return {doc.slide.index: doc for doc in docs}
+
+    def iter_slides(
+        self,
+        path: str | PathLike[str],
+        *,
+        slide_count: int,
+        media_table: MediaTable | None = None,
+        style_table: StyleTable | None = None,
+        slides: SlideRange | None = None,
+    ) -> Iterator[SlideDoc]:
+        if self.media_mode == "refs" and self.markdown_path is None:
+            raise ValueError("refs mode requires markdown_path for the asset directory")
+        selected = [i for i in range(1, slide_count + 1) if slides is None or slides.contains(i)]
+        # Several chunks per worker keeps cores busy when slide cost is uneven.
+        parts = [
+            tuple(selected[pos - 1] for pos in part)
+            for part in partition_indices(len(selected), self.jobs * self.chunks_per_job)
+        ]
+        if not parts:
+            return
+        workers = max(1, min(self.jobs, len(parts)))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                str(path),
+                self.media_mode,
+                str(self.markdown_path) if self.media_mode == "refs" else None,
+                str(self.cache_dir) if self.cache_dir is not None else None,
+                self.cache_max_bytes,
+                style_table is not None,
+                active() is not None,
+            ),
+        ) as pool:
+            for chunk, media, styles, metrics in pool.map(_extract_chunk, parts):
+                merge_from_worker(metrics)
+                if media_table is not None:
+                    media_table.update(media)
+                if style_table is not None:
+                    style_table.update(styles)
+                for _idx, raw in chunk:
+                    yield SlideDoc.model_validate_json(raw)
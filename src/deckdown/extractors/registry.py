@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import functools
+import logging
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Any
+
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from deckdown.extractors.handlers.base import ShapeHandler
+
+__all__ = ["HANDLER_ENTRY_POINTS", "HandlerRegistry", "plugin_handlers"]
+
+# Entry-point group for third-party handlers: each entry names a `ShapeHandler`
+# subclass (or any zero-argument callable returning a handler instance).
+HANDLER_ENTRY_POINTS = "deckdown.handlers"
+
+
+@functools.cache
+def plugin_handlers() -> tuple[ShapeHandler, ...]:
+    """Handlers registered by installed packages, loaded once per process, by entry name."""
+    out: list[ShapeHandler] = []
+    for ep in sorted(entry_points(group=HANDLER_ENTRY_POINTS), key=lambda ep: ep.name):
+        try:
+            handler = ep.load()()
+        except Exception as exc:
+            logging.warning("handler plugin %s: cannot load %s: %s", ep.name, ep.value, exc)
+            continue
+        if not isinstance(handler, ShapeHandler):
+            logging.warning("handler plugin %s: %s is not a ShapeHandler", ep.name, ep.value)
+            continue
+        out.append(handler)
+    return tuple(out)
+
+
+@dataclass(frozen=True)
+class HandlerRegistry:
+    """Pick the handler for a shape through a table keyed by its shape type.
+
+    The caller reads `shape_type` once and passes it in; only the handlers
+    whose `shape_types` contain it (or that declare none) are asked, through
+    `ShapeHandler.accepts`, in priority order. Candidate lists are built the
+    first time each shape type is seen.
+
+    With `plugins`, handlers from the `deckdown.handlers` entry-point group
+    are loaded on first dispatch and take priority over `handlers`, so a
+    plugin can claim shapes a built-in handler would otherwise take.
+    """
+
+    handlers: tuple[ShapeHandler, ...]
+    plugins: bool = True
+    _table: dict[MSO_SHAPE_TYPE | None, tuple[ShapeHandler, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def handler_for(
+        self,
+        shape: Any,  # noqa: ANN401
+        shape_type: MSO_SHAPE_TYPE | None,
+    ) -> ShapeHandler | None:
+        candidates = self._table.get(shape_type)
+        if candidates is None:
+            candidates = self._table[shape_type] = self._candidates(shape_type)
+        for handler in candidates:
+            if handler.accepts(shape, shape_type):
+                return handler
+        return None
+
+    def _candidates(self, shape_type: MSO_SHAPE_TYPE | None) -> tuple[ShapeHandler, ...]:
+        ordered = (*plugin_handlers(), *self.handlers) if self.plugins else self.handlers
+        return tuple(h for h in ordered if h.shape_types is None or shape_type in h.shape_types)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from deckdown.ast import BasicShape, Shape, SlideDoc, TableShape, TextPayload, TextShape
+from deckdown.extractors.text import ParagraphSplitter
+from deckdown.models import Bullet, Deck, Slide, Table, TextBlock
+from deckdown.utils.slide_range import SlideRange
+
+
+def _payload_paragraphs(text: TextPayload | None) -> list[tuple[str, int]]:
+    if text is None:
+        return []
+    out: list[tuple[str, int]] = []
+    for p in text.paras:
+        txt = "".join(r.text for r in p.runs).strip()
+        if txt:
+            out.append((txt, p.lvl))
+    return out
+
+
+def _text_of(shape: Shape) -> TextPayload | None:
+    if isinstance(shape, (TextShape, BasicShape)):
+        return shape.text
+    return None
+
+
+def _position(shape: Shape) -> tuple[int, int]:
+    return (shape.bbox.y_emu, shape.bbox.x_emu)
+
+
+@dataclass(frozen=True)
+class SlideSummarizer:
+    """Derive the human-readable `Slide` sections from an already-built `SlideDoc`.
+
+    Mirrors `SlideTextExtractor` (top-level text shapes in reading order, title
+    de-duplication, paragraph/bullet split) without touching the slide XML again,
+    and additionally fills `tables` from the AST table cells.
+    """
+
+    splitter: ParagraphSplitter = ParagraphSplitter()
+
+    def summarize(self, doc: SlideDoc, *, title_id: str | None = None) -> Slide:
+        shapes = [sh for sh in doc.slide.shapes if sh.group is None]
+        title_shape = next((sh for sh in shapes if sh.id == title_id), None)
+        title = self._title(title_shape)
+
+        blocks: list[TextBlock] = []
+        bullets: list[Bullet] = []
+        text_shapes = [sh for sh in shapes if _text_of(sh) is not None]
+        text_shapes.sort(key=_position)
+        for shape in text_shapes:
+            if shape is title_shape:
+                continue
+            paragraphs = _payload_paragraphs(_text_of(shape))
+            if not paragraphs:
+                continue
+            if title and len(paragraphs) == 1 and paragraphs[0][0] == title:
+                continue
+            body_lines, bullet_items = self.splitter.split(paragraphs)
+            if body_lines:
+                blocks.append(TextBlock(text="\n".join(body_lines)))
+            bullets.extend(bullet_items)
+
+        tables = [sh for sh in doc.slide.shapes if isinstance(sh, TableShape)]
+        tables.sort(key=_position)
+        return Slide(
+            index=doc.slide.index,
+            title=title,
+            text_blocks=tuple(blocks),
+            bullets=tuple(bullets),
+            tables=tuple(self._table(t) for t in tables),
+            charts=(),
+        )
+
+    def _title(self, shape: Shape | None) -> str | None:
+        text = _text_of(shape) if shape is not None else None
+        if text is None or not text.paras:
+            return None
+        t = "".join(r.text for r in text.paras[0].runs).strip()
+        return t or None
+
+    def _table(self, shape: TableShape) -> Table:
+        tbl = shape.table
+        grid = [["" for _ in range(tbl.cols)] for _ in range(tbl.rows)]
+        for cell in tbl.cells:
+            if cell.r < tbl.rows and cell.c < tbl.cols:
+                grid[cell.r][cell.c] = "\n".join(t for t, _ in _payload_paragraphs(cell.text))
+        return Table(rows=tuple(tuple(row) for row in grid))
+
+
+def title_shape_ids(
+    prs: Any,  # noqa: ANN401
+    slides: SlideRange | None = None,
+) -> dict[int, str]:
+    """Map 1-based slide index to the AST id of its title placeholder.
+
+    Only scans placeholder elements in each slide's shape tree; text frames are
+    not read, so this stays cheap next to the AST walk. With `slides`, the shape
+    trees of unselected slides are not touched.
+    """
+    out: dict[int, str] = {}
+    for idx, slide in enumerate(prs.slides, start=1):
+        if slides is not None and not slides.contains(idx):
+            continue
+        try:
+            shape = slide.shapes.title
+        except Exception:
+            shape = None
+        if shape is not None and getattr(shape, "has_text_frame", False):
+            out[idx] = f"s{shape.shape_id}"
+    return out
+
+
+@dataclass(frozen=True)
+class DeckSummarizer:
+    slide_summarizer: SlideSummarizer = SlideSummarizer()
+
+    def summarize(
+        self,
+        docs: Iterable[SlideDoc],
+        *,
+        source_path: str,
+        title_ids: Mapping[int, str] | None = None,
+        core_title: str | None = None,
+    ) -> Deck:
+        ids = title_ids or {}
+        slides = tuple(
+            self.slide_summarizer.summarize(d, title_id=ids.get(d.slide.index)) for d in docs
+        )
+        title = slides[0].title if slides and slides[0].title else core_title
+        return Deck(file=source_path, title=title, slides=slides)
+
+    def summarize_presentation(
+        self,
+        prs: Any,  # noqa: ANN401
+        docs: Mapping[int, SlideDoc],
+        *,
+        source_path: str,
+    ) -> Deck:
+        core = getattr(getattr(prs, "core_properties", None), "title", None)
+        return self.summarize(
+            (docs[i] for i in sorted(docs)),
+            source_path=source_path,
+            title_ids=title_shape_ids(prs),
+            core_title=str(core) if core else None,
+        )
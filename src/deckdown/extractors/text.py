@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from deckdown.models import Bullet, Deck, Slide, TextBlock
+from deckdown.utils.slide_range import SlideRange
 
 
 @dataclass(frozen=True)
@@ -109,8 +110,19 @@ class TextExtractor:
     orderer: ShapeOrderer = ShapeOrderer()
     splitter: ParagraphSplitter = ParagraphSplitter()
 
-    def extract_deck(self, prs: Any, *, source_path: str) -> Deck:  # noqa: ANN401
+    def extract_deck(
+        self,
+        prs: Any,  # noqa: ANN401
+        *,
+        source_path: str,
+        slides: SlideRange | None = None,
+    ) -> Deck:
         slide_extractor = SlideTextExtractor(self.orderer, self.splitter)
-        slides = [slide_extractor.extract(i, s) for i, s in enumerate(prs.slides, start=1)]
+        # Unselected slides are skipped before any of their shapes are touched.
+        out = [
+            slide_extractor.extract(i, s)
+            for i, s in enumerate(prs.slides, start=1)
+            if slides is None or slides.contains(i)
+        ]
         title = TitleResolver(slide_extractor).derive(prs)
-        return Deck(file=source_path, title=title, slides=tuple(slides))
+        return Deck(file=source_path, title=title, slides=tuple(out))
@@ -2,57 +2,97 @@ from __future__ import annotations
 
 from typing import Any
 
-from deckdown.ast import Paragraph, TextPayload, TextRun
+from pptx.oxml.ns import qn
+from pptx.text.text import _Run
+
+from deckdown.ast import Color, Paragraph, TextPayload, TextRun
 from deckdown.color.theme import ThemeResolver
+from deckdown.metrics import measured, note_suppressed
+from deckdown.styles import StyleTable
+
+_BR = qn("a:br")
 
 
 def align_to_str(align: Any) -> str | None:  # noqa: ANN401
+    if align is None:
+        return None  # inherited alignment: the common case, not a failure
     try:
-        name = align._member_name_  # type: ignore[attr-defined]
+        name = align.name  # type: ignore[attr-defined]
     except Exception:
+        note_suppressed()
         return None
     low = name.lower()
     return low if low in {"left", "center", "right", "justify"} else None
 
 
-def color_dict_from_font(font: Any, theme: ThemeResolver) -> dict | None:  # noqa: ANN401
+def color_from_font(font: Any, theme: ThemeResolver) -> Color | None:  # noqa: ANN401
     try:
+        # Read-only fast path: `font.color` adds an empty fill to runs that have none.
+        rpr = getattr(font, "_rPr", None)
+        if rpr is not None and rpr.eg_fillProperties is None:
+            return None
         col = getattr(font, "color", None)
         if col is None:
             return None
-        data = theme.color_dict_from_colorformat(col)
+        data = theme.color_from_colorformat(col)
         if data:
             return data
     except Exception:
+        note_suppressed()
         return None
     return None
 
 
-def extract_text_payload(text_frame: Any, theme: ThemeResolver) -> TextPayload:  # noqa: ANN401
+def _content_runs(p: Any) -> list[Any]:  # noqa: ANN401
+    """Text runs and fields of a paragraph in document order, with None for each line break."""
+    elm = getattr(p, "_p", None)
+    if elm is None:
+        return list(p.runs)
+    return [None if child.tag == _BR else _Run(child, p) for child in elm.content_children]
+
+
+def _run_font(f: Any, theme: ThemeResolver) -> dict[str, Any]:  # noqa: ANN401
+    font: dict[str, Any] = {}
+    if f is not None and f.size is not None:
+        try:
+            font["size_pt"] = round(float(f.size.pt), 2)  # type: ignore[union-attr]
+        except Exception:
+            note_suppressed()
+    if f is not None and f.name:
+        font["family"] = f.name
+    if f is not None and f.bold is not None:
+        font["bold"] = bool(f.bold)
+    if f is not None and f.italic is not None:
+        font["italic"] = bool(f.italic)
+    if f is not None and f.underline is not None:
+        font["underline"] = bool(f.underline)
+    c = color_from_font(f, theme)
+    if c:
+        font["color"] = c
+    return font
+
+
+@measured
+def extract_text_payload(
+    text_frame: Any,  # noqa: ANN401
+    theme: ThemeResolver,
+    styles: StyleTable | None = None,
+) -> TextPayload:
+    """Paragraphs and runs of a text frame; with `styles`, run fonts become style refs."""
     paras: list[Paragraph] = []
     try:
         for p in text_frame.paragraphs:
             runs: list[TextRun] = []
-            for r in p.runs:
-                font = {}
-                f = r.font
-                if f is not None and f.size is not None:
-                    try:
-                        font["size_pt"] = round(float(f.size.pt), 2)  # type: ignore[union-attr]
-                    except Exception:
-                        pass
-                if f is not None and f.name:
-                    font["family"] = f.name
-                if f is not None and f.bold is not None:
-                    font["bold"] = bool(f.bold)
-                if f is not None and f.italic is not None:
-                    font["italic"] = bool(f.italic)
-                if f is not None and f.underline is not None:
-                    font["underline"] = bool(f.underline)
-                c = color_dict_from_font(f, theme)
-                if c:
-                    font["color"] = c
-                runs.append(TextRun(text=r.text or "", font=font or None))
+            for r in _content_runs(p):
+                if r is None:
+                    # Soft line break: kept as "\v", as `_Paragraph.text` renders it.
+                    runs.append(TextRun(text="\v"))
+                    continue
+                font = _run_font(r.font, theme)
+                if styles is not None:
+                    runs.append(styles.run(r.text or "", font))
+                else:
+                    runs.append(TextRun(text=r.text or "", font=font or None))
             paras.append(
                 Paragraph(
                     lvl=int(getattr(p, "level", 0) or 0),
@@ -61,5 +101,5 @@ def extract_text_payload(text_frame: Any, theme: ThemeResolver) -> TextPayload:
                 )
             )
     except Exception:  # pragma: no cover
-        pass
+        note_suppressed()
     return TextPayload(paras=tuple(paras))
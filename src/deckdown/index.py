@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+from deckdown.io import OutputManager
+
+# Format tag written into every offset index sidecar.
+INDEX_FORMAT = "deckdown-index-1"
+INDEX_SUFFIX = ".idx"
+
+
+def index_path_for(path: Path) -> Path:
+    """Sidecar index path for a deck output file (`deck.jsonl` → `deck.jsonl.idx`)."""
+    return path.with_name(f"{path.name}{INDEX_SUFFIX}")
+
+
+def digest_of(data: bytes) -> str:
+    return sha256(data).hexdigest()
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Byte span of one record in the indexed file."""
+
+    offset: int
+    length: int
+    digest: str
+
+
+@dataclass
+class SlideIndex:
+    """Slide index → byte span in a deck output file, plus deck-level table records.
+
+    `slides` maps each slide to the span of its record; `tables` lists the
+    spans of media/style table records in file order, so a reader can load the
+    entries a slide may refer to without touching other slides. `size` and
+    `mtime_ns` describe the indexed file and are used to detect a stale sidecar.
+    """
+
+    size: int = 0
+    mtime_ns: int | None = None
+    slides: dict[int, IndexEntry] = field(default_factory=dict)
+    tables: list[IndexEntry] = field(default_factory=list)
+
+    def add_slide(self, index: int, offset: int, data: bytes) -> None:
+        self.slides[index] = IndexEntry(offset, len(data), digest_of(data))
+
+    def add_table(self, offset: int, data: bytes) -> None:
+        self.tables.append(IndexEntry(offset, len(data), digest_of(data)))
+
+    def tables_before(self, offset: int) -> list[IndexEntry]:
+        return [t for t in self.tables if t.offset < offset]
+
+    def in_file_order(self) -> list[tuple[int, IndexEntry]]:
+        return sorted(self.slides.items(), key=lambda item: item[1].offset)
+
+    def is_current(self, path: Path) -> bool:
+        """True when `path` still has the size (and mtime, if recorded) this index describes."""
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        return st.st_size == self.size and self.mtime_ns in (None, st.st_mtime_ns)
+
+    def save(self, path: Path) -> None:
+        """Write this index as the sidecar of the data file at `path`."""
+        if self.mtime_ns is None:
+            st = path.stat()
+            self.size, self.mtime_ns = st.st_size, st.st_mtime_ns
+        with OutputManager().open_text_file(index_path_for(path)) as fh:
+            fh.write(self.to_json())
+
+    def to_json(self) -> str:
+        payload: dict[str, Any] = {
+            "format": INDEX_FORMAT,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "slides": [
+                {"index": idx, "offset": e.offset, "length": e.length, "digest": e.digest}
+                for idx, e in sorted(self.slides.items())
+            ],
+            "tables": [
+                {"offset": e.offset, "length": e.length, "digest": e.digest} for e in self.tables
+            ],
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> SlideIndex:
+        payload = json.loads(text)
+        if not isinstance(payload, dict) or payload.get("format") != INDEX_FORMAT:
+            raise ValueError(f"not a {INDEX_FORMAT} index")
+        return cls(
+            size=int(payload.get("size", 0)),
+            mtime_ns=int(payload["mtime_ns"]) if payload.get("mtime_ns") is not None else None,
+            slides={
+                int(s["index"]): IndexEntry(int(s["offset"]), int(s["length"]), str(s["digest"]))
+                for s in payload.get("slides", [])
+            },
+            tables=[
+                IndexEntry(int(t["offset"]), int(t["length"]), str(t["digest"]))
+                for t in payload.get("tables", [])
+            ],
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> SlideIndex | None:
+        """The sidecar index at `path`, or None when it is missing or unreadable."""
+        try:
+            return cls.from_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
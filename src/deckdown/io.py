@@ -1,6 +1,26 @@
 from __future__ import annotations
 
+import os
+import stat
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from pathlib import Path
+from typing import TextIO
+
+
+def replace_mode(path: Path) -> int:
+    """Permission bits for a file about to replace `path` via a temp file and `os.replace`.
+
+    `mkstemp` creates files 0600; outputs should keep the existing file's mode,
+    or get the umask default a plain `open` would have given them.
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
 
 
 class OutputManager:
@@ -10,22 +30,44 @@ class OutputManager:
         return input_path.with_name(f"{name}.md")
 
     def resolve_markdown_output_path(self, input_path: Path, output_opt: str | Path | None) -> Path:
+        return self.resolve_output_path(input_path, output_opt, suffix=".md")
+
+    def resolve_output_path(
+        self, input_path: Path, output_opt: str | Path | None, *, suffix: str
+    ) -> Path:
+        """Like `resolve_markdown_output_path` for an output format with `suffix`."""
+        default = self.derive_markdown_path_next_to_input(input_path).with_suffix(suffix)
         if output_opt is None:
-            return self.derive_markdown_path_next_to_input(input_path)
+            return default
 
         dest = Path(output_opt)
         directory_hint = self._is_directory_hint(str(output_opt))
         treat_as_dir = (
             directory_hint
             or self._is_existing_directory(dest)
-            or self._should_treat_as_directory(dest)
+            or self._should_treat_as_directory(dest, suffix)
         )
-        return dest / self._markdown_filename(input_path) if treat_as_dir else dest
+        return dest / default.name if treat_as_dir else dest
 
     def write_text_file(self, path: Path, content: str) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(content, encoding="utf-8")
 
+    @contextmanager
+    def open_text_file(self, path: Path) -> Iterator[TextIO]:
+        """Stream text into `path`; the file only appears once writing succeeded."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+                yield fh
+            os.chmod(tmp, replace_mode(path))
+            os.replace(tmp, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
+
     def _is_directory_hint(self, s: str) -> bool:
         return s.endswith("/") or s.endswith("\\")
 
@@ -36,8 +78,8 @@ class OutputManager:
     def _is_existing_directory(self, p: Path) -> bool:
         return p.exists() and p.is_dir()
 
-    def _should_treat_as_directory(self, p: Path) -> bool:
-        return (not p.exists()) and (p.suffix.lower() != ".md")
+    def _should_treat_as_directory(self, p: Path, suffix: str = ".md") -> bool:
+        return (not p.exists()) and (p.suffix.lower() != suffix)
 
     def _markdown_filename(self, input_path: Path) -> str:
         return self.derive_markdown_path_next_to_input(input_path).name
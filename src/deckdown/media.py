@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import base64
+import os
+import tempfile
+from collections import Counter
+from contextlib import suppress
 from dataclasses import dataclass, field
+from hashlib import sha256
 from mimetypes import guess_extension
 from pathlib import Path
 from typing import Literal
 
-MediaEmbedMode = Literal["base64", "refs"]
+from deckdown.ast import PictureShape, SlideDoc
+from deckdown.io import replace_mode
+
+MediaEmbedMode = Literal["base64", "refs", "shared"]
+
+# Fence info string for deck-level media table blocks ("shared" embed mode).
+MEDIA_BLOCK_INFO = "json deckdown-media"
+MEDIA_REF_PREFIX = "media:"
+
+
+def data_url_for(blob: bytes, content_type: str) -> str:
+    return f"data:{content_type};base64,{base64.b64encode(blob).decode('ascii')}"
 
 
 def _extension_for(content_type: str) -> str:
@@ -25,10 +42,18 @@ def _extension_for(content_type: str) -> str:
 
 @dataclass
 class AssetStore:
+    """Content-addressed image store next to the Markdown output.
+
+    Files are named by a SHA-256 prefix of their bytes, so an image that repeats
+    across slides is written once and every occurrence gets the same `ref`.
+    Names are deterministic, which also makes concurrent writers (one store per
+    worker process) safe: they can only ever write identical bytes to a name.
+    """
+
     markdown_path: Path
     asset_dir_name_suffix: str = "_assets"
-    filename_prefix: str = "image"
-    _counter: int = field(default=0, init=False, repr=False)
+    digest_chars: int = 16
+    _written: set[str] = field(default_factory=set, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.markdown_path = Path(self.markdown_path)
@@ -40,32 +65,114 @@ class AssetStore:
     def assets_dir(self) -> Path:
         return self._assets_dir
 
-    def save_image(
-        self,
-        *,
-        blob: bytes,
-        content_type: str,
-        name_hint: str | None = None,
-    ) -> str:
-        self._ensure_directory()
-        ext = _extension_for(content_type)
-        base_name = self._sanitize_name(name_hint) if name_hint else self.filename_prefix
-        index = self._counter
-        while True:
-            candidate = f"{base_name}-{index:03d}{ext}"
-            path = self._assets_dir / candidate
-            if not path.exists():
-                break
-            index += 1
-        path.write_bytes(blob)
-        self._counter = index + 1
+    def save_image(self, *, blob: bytes, content_type: str) -> str:
+        name = f"{sha256(blob).hexdigest()[: self.digest_chars]}{_extension_for(content_type)}"
+        if name not in self._written:
+            self._write_once(self._assets_dir / name, blob)
+            self._written.add(name)
         # Return path relative to markdown output parent for portability
-        rel_path = Path(self._assets_dir.name) / candidate
-        return str(rel_path)
+        return str(Path(self._assets_dir.name) / name)
 
-    def _ensure_directory(self) -> None:
+    def _write_once(self, path: Path, blob: bytes) -> None:
         self._assets_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            if path.stat().st_size == len(blob):
+                return  # same digest and size: written by an earlier run or another worker
+        except FileNotFoundError:
+            pass
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=self._assets_dir)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(blob)
+            os.chmod(tmp, replace_mode(path))
+            os.replace(tmp, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+
+@dataclass
+class AssetReport:
+    """Tally of asset references seen in extracted slides, for dedup reporting."""
+
+    root: Path
+    refs: Counter[str] = field(default_factory=Counter)
+
+    def observe(self, ref: str) -> None:
+        self.refs[ref] += 1
+
+    def summary(self) -> dict[str, int]:
+        written = saved = 0
+        for ref, count in self.refs.items():
+            try:
+                size = (self.root / ref).stat().st_size
+            except OSError:
+                continue
+            written += size
+            saved += size * (count - 1)
+        return {
+            "references": sum(self.refs.values()),
+            "unique": len(self.refs),
+            "bytes_written": written,
+            "bytes_saved": saved,
+        }
+
+
+@dataclass
+class MediaTable:
+    """Deck-level table of base64 data URLs keyed by content digest.
+
+    Pictures reference entries as `media:<digest>` instead of repeating the
+    data URL. Entries added since the last `drain_new()` are handed to the
+    renderer, so each one is emitted exactly once, ahead of the first slide
+    that uses it; readers accumulate entries as they stream.
+    """
+
+    digest_chars: int = 16
+    entries: dict[str, str] = field(default_factory=dict)
+    _new: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def add_blob(self, blob: bytes, content_type: str) -> str:
+        key = sha256(blob).hexdigest()[: self.digest_chars]
+        if key not in self.entries:
+            self.add(key, data_url_for(blob, content_type))
+        return f"{MEDIA_REF_PREFIX}{key}"
+
+    def add(self, key: str, data_url: str) -> None:
+        if key not in self.entries:
+            self.entries[key] = data_url
+            self._new.append(key)
+
+    def update(self, entries: dict[str, str]) -> None:
+        for key, data_url in entries.items():
+            self.add(key, data_url)
+
+    def drain_new(self) -> dict[str, str]:
+        out = {key: self.entries[key] for key in self._new}
+        self._new.clear()
+        return out
+
+    def lookup(self, ref: str | None) -> str | None:
+        if not ref or not ref.startswith(MEDIA_REF_PREFIX):
+            return None
+        return self.entries.get(ref[len(MEDIA_REF_PREFIX) :])
 
-    def _sanitize_name(self, value: str) -> str:
-        clean = "".join(ch for ch in value if ch.isalnum() or ch in ("-", "_"))
-        return clean or self.filename_prefix
+    def resolve(self, doc: SlideDoc) -> SlideDoc:
+        """Fill `data_url` for pictures that reference this table (the `ref` is kept)."""
+        shapes = list(doc.slide.shapes)
+        changed = False
+        for i, sh in enumerate(shapes):
+            if not isinstance(sh, PictureShape) or sh.image.media.data_url:
+                continue
+            data_url = self.lookup(sh.image.media.ref)
+            if data_url is None:
+                continue
+            media = sh.image.media.model_copy(update={"data_url": data_url})
+            image = sh.image.model_copy(update={"media": media})
+            shapes[i] = sh.model_copy(update={"image": image})
+            changed = True
+        if not changed:
+            return doc
+        slide = doc.slide.model_copy(update={"shapes": tuple(shapes)})
+        return doc.model_copy(update={"slide": slide})
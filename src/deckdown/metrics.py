@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import functools
+import json
+import math
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType, TracebackType
+from typing import Any, ParamSpec, TypeVar
+
+from deckdown.io import OutputManager
+
+__all__ = [
+    "HandlerStats",
+    "Metrics",
+    "active",
+    "aggregate",
+    "collecting",
+    "count",
+    "measured",
+    "media_bytes",
+    "merge_from_worker",
+    "note_suppressed",
+    "suppressing",
+    "timed",
+]
+
+METRICS_FORMAT = "deckdown-metrics-1"
+
+# Latency histogram buckets are quarter octaves (~19% wide), in microseconds.
+_BUCKET_BASE = 2**0.25
+
+# The registry collecting for this process; None keeps the helpers below no-ops.
+_ACTIVE: Metrics | None = None
+_NULL: AbstractContextManager[None] = nullcontext()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class HandlerStats:
+    """Call count and latency distribution of one handler.
+
+    Latencies go into a log-scale histogram so stats from separate runs can be
+    merged and still give a p95 (the upper edge of the bucket holding it).
+    """
+
+    calls: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    def add(self, seconds: float) -> None:
+        self.calls += 1
+        self.total_s += seconds
+        self.max_s = max(self.max_s, seconds)
+        b = _bucket(seconds)
+        self.buckets[b] = self.buckets.get(b, 0) + 1
+
+    def merge(self, other: HandlerStats) -> None:
+        self.calls += other.calls
+        self.total_s += other.total_s
+        self.max_s = max(self.max_s, other.max_s)
+        for b, n in other.buckets.items():
+            self.buckets[b] = self.buckets.get(b, 0) + n
+
+    def p95(self) -> float:
+        rank = math.ceil(self.calls * 0.95)
+        seen = 0
+        for b in sorted(self.buckets):
+            seen += self.buckets[b]
+            if seen >= rank:
+                return min(_BUCKET_BASE**b / 1e6, self.max_s)
+        return 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_s": round(self.total_s, 6),
+            "p95_s": round(self.p95(), 6),
+            "max_s": round(self.max_s, 6),
+            "buckets": {str(b): n for b, n in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HandlerStats:
+        return cls(
+            calls=int(data.get("calls", 0)),
+            total_s=float(data.get("total_s", 0.0)),
+            max_s=float(data.get("max_s", 0.0)),
+            buckets={int(b): int(n) for b, n in data.get("buckets", {}).items()},
+        )
+
+
+@dataclass
+class Metrics:
+    """Counters gathered while extracting or assembling decks.
+
+    - `counts`: shapes per kind, e.g. `extract.text_box`, `assemble.chart`
+    - `handlers`: per-handler call count, cumulative and p95 time
+    - `media_bytes`: image bytes processed, per phase (`extract`, `assemble`)
+    - `suppressed`: exceptions swallowed by `except Exception` fallbacks, per
+      site (`module.function:line`)
+
+    Registries merge by addition, so per-deck metrics add up to a batch total.
+    """
+
+    counts: dict[str, int] = field(default_factory=dict)
+    handlers: dict[str, HandlerStats] = field(default_factory=dict)
+    media_bytes: dict[str, int] = field(default_factory=dict)
+    suppressed: dict[str, int] = field(default_factory=dict)
+
+    def count(self, key: str, n: int = 1) -> None:
+        self.counts[key] = self.counts.get(key, 0) + n
+
+    def observe(self, handler: str, seconds: float) -> None:
+        stats = self.handlers.get(handler)
+        if stats is None:
+            stats = self.handlers[handler] = HandlerStats()
+        stats.add(seconds)
+
+    def add_media_bytes(self, phase: str, n: int) -> None:
+        self.media_bytes[phase] = self.media_bytes.get(phase, 0) + n
+
+    def note_suppressed(self, site: str) -> None:
+        self.suppressed[site] = self.suppressed.get(site, 0) + 1
+
+    def merge(self, other: Metrics) -> None:
+        for key, n in other.counts.items():
+            self.count(key, n)
+        for name, stats in other.handlers.items():
+            self.handlers.setdefault(name, HandlerStats()).merge(stats)
+        for phase, n in other.media_bytes.items():
+            self.add_media_bytes(phase, n)
+        for site, n in other.suppressed.items():
+            self.suppressed[site] = self.suppressed.get(site, 0) + n
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": METRICS_FORMAT,
+            "counts": dict(sorted(self.counts.items())),
+            "handlers": {name: s.to_dict() for name, s in sorted(self.handlers.items())},
+            "media_bytes": dict(sorted(self.media_bytes.items())),
+            "suppressed": dict(sorted(self.suppressed.items(), key=lambda kv: (-kv[1], kv[0]))),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Metrics:
+        if data.get("format") != METRICS_FORMAT:
+            raise ValueError(f"not a {METRICS_FORMAT} record")
+        return cls(
+            counts={k: int(v) for k, v in data.get("counts", {}).items()},
+            handlers={k: HandlerStats.from_dict(v) for k, v in data.get("handlers", {}).items()},
+            media_bytes={k: int(v) for k, v in data.get("media_bytes", {}).items()},
+            suppressed={k: int(v) for k, v in data.get("suppressed", {}).items()},
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def save(self, path: Path) -> None:
+        with OutputManager().open_text_file(path) as fh:
+            fh.write(self.to_json() + "\n")
+
+    @classmethod
+    def load(cls, path: Path) -> Metrics:
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def aggregate(paths: Iterable[Path]) -> Metrics:
+    """Sum the metrics files at `paths` (e.g. one per batch run)."""
+    total = Metrics()
+    for path in paths:
+        total.merge(Metrics.load(path))
+    return total
+
+
+def active() -> Metrics | None:
+    return _ACTIVE
+
+
+def merge_from_worker(data: dict[str, Any] | None) -> None:
+    """Add a registry shipped back from a worker process (`Metrics.to_dict`) to the active one."""
+    if _ACTIVE is not None and data:
+        _ACTIVE.merge(Metrics.from_dict(data))
+
+
+def count(key: str, n: int = 1) -> None:
+    if _ACTIVE is not None:
+        _ACTIVE.count(key, n)
+
+
+def media_bytes(phase: str, n: int) -> None:
+    if _ACTIVE is not None:
+        _ACTIVE.add_media_bytes(phase, n)
+
+
+def timed(handler: str) -> AbstractContextManager[None]:
+    """Time the block as one call of `handler` while collecting; a no-op otherwise."""
+    registry = _ACTIVE
+    return _NULL if registry is None else _timer(registry, handler)
+
+
+def measured(fn: Callable[P, R]) -> Callable[P, R]:  # noqa: UP047
+    """Decorator form of `timed`, keyed by the function's qualified name."""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        registry = _ACTIVE
+        if registry is None:
+            return fn(*args, **kwargs)
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            registry.observe(name, time.perf_counter() - t0)
+
+    return wrapper
+
+
+def note_suppressed() -> None:
+    """Count an exception swallowed by the calling `except` block."""
+    if _ACTIVE is not None:
+        frame = sys._getframe(1)
+        _ACTIVE.note_suppressed(_site(frame, frame.f_lineno))
+
+
+def suppressing() -> AbstractContextManager[None]:
+    """`contextlib.suppress(Exception)` that also counts what it swallows."""
+    return _SUPPRESSING
+
+
+@contextmanager
+def collecting(path: Path | None = None) -> Iterator[Metrics]:
+    """Collect metrics in this process until the block exits; save them to `path` if given."""
+    global _ACTIVE
+    previous = _ACTIVE
+    registry = Metrics()
+    _ACTIVE = registry
+    try:
+        yield registry
+    finally:
+        _ACTIVE = previous
+        if path is not None:
+            registry.save(path)
+
+
+@contextmanager
+def _timer(registry: Metrics, handler: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(handler, time.perf_counter() - t0)
+
+
+class _Suppressing:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        typ: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        if typ is None or not issubclass(typ, Exception):
+            return False
+        if _ACTIVE is not None and tb is not None:
+            _ACTIVE.note_suppressed(_site(tb.tb_frame, tb.tb_lineno))
+        return True
+
+
+_SUPPRESSING = _Suppressing()
+
+
+def _bucket(seconds: float) -> int:
+    us = seconds * 1e6
+    return math.ceil(math.log(us, _BUCKET_BASE)) if us > 1 else 0
+
+
+def _site(frame: FrameType, lineno: int) -> str:
+    module = frame.f_globals.get("__name__", "?").rpartition(".")[2]
+    return f"{module}.{frame.f_code.co_qualname}:{lineno}"
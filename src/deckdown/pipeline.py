@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from deckdown.ast import PictureShape, SlideDoc
+from deckdown.cache import DEFAULT_CACHE_MAX_BYTES, SlideCache
+from deckdown.extractors.ast import AstExtractor
+from deckdown.extractors.parallel import ParallelAstExtractor
+from deckdown.extractors.summary import SlideSummarizer, title_shape_ids
+from deckdown.index import SlideIndex
+from deckdown.loader import Loader
+from deckdown.media import AssetReport, AssetStore, MediaEmbedMode, MediaTable
+from deckdown.renderers.jsonl import JsonlStream
+from deckdown.renderers.markdown import MarkdownRenderer
+from deckdown.styles import StyleTable
+from deckdown.trace import phase
+from deckdown.utils.slide_range import SlideRange
+
+__all__ = ["extract_markdown", "write_jsonl", "write_markdown"]
+
+
+def write_markdown(
+    in_path: Path,
+    out: TextIO,
+    *,
+    output_path: Path,
+    media_mode: MediaEmbedMode = "base64",
+    with_notes: bool = False,
+    jobs: int = 1,
+    slides: SlideRange | None = None,
+    cache: SlideCache | None = None,
+    compact_styles: bool = False,
+) -> None:
+    """Run Loader → AstExtractor → SlideSummarizer → MarkdownRenderer for one deck.
+
+    Slides are streamed: each slide's heading, sections and JSON block are
+    written to `out` as soon as its `SlideDoc` is built, so peak memory is
+    proportional to one slide rather than the whole deck.
+
+    `output_path` is only used to place the asset directory in refs mode, where
+    repeated images are stored once and the dedup savings are logged. In shared
+    mode each unique image is emitted once in a media-table block. With
+    `jobs > 1` the AST walk is spread across worker processes. The slides are
+    walked once: the text summary sections are derived from the AST rather than
+    re-reading every text frame. `with_notes` is accepted for CLI compatibility
+    (notes are not extracted yet). With `slides`, unselected slides are skipped
+    before their shapes are walked. With `cache`, unchanged slides are spliced
+    from the slide cache instead of being walked again. With `compact_styles`,
+    each distinct run font is emitted once in a style-table block and runs
+    refer to it by key.
+    """
+    with phase("load"):
+        prs = Loader(str(in_path)).presentation()
+        title_ids = title_shape_ids(prs, slides)
+    summarizer = SlideSummarizer()
+    renderer = MarkdownRenderer()
+    stream = renderer.stream(out, heading=_heading(in_path, prs))
+
+    # Tiny diagnostics
+    slide_ct = 0
+    shape_counts: dict[str, int] = {}
+    assets = AssetReport(output_path.parent)
+    table = MediaTable() if media_mode == "shared" else None
+    styles = StyleTable() if compact_styles else None
+    docs = _iter_docs(
+        prs,
+        in_path,
+        output_path=output_path,
+        media_mode=media_mode,
+        media_table=table,
+        style_table=styles,
+        jobs=jobs,
+        slides=slides,
+        cache=cache,
+    )
+    for doc in docs:
+        with phase("render", slide=doc.slide.index):
+            slide = summarizer.summarize(doc, title_id=title_ids.get(doc.slide.index))
+            stream.write_slide(
+                slide,
+                doc,
+                table.drain_new() if table is not None else None,
+                styles.drain_new() if styles is not None else None,
+            )
+        slide_ct += 1
+        for sh in doc.slide.shapes:
+            shape_counts[sh.kind.value] = shape_counts.get(sh.kind.value, 0) + 1
+            if media_mode == "refs" and isinstance(sh, PictureShape) and sh.image.media.ref:
+                assets.observe(sh.image.media.ref)
+    stream.close()
+    logging.info("extracted %d slides; shapes=%s", slide_ct, shape_counts)
+    if assets.refs:
+        logging.info("assets: %s", assets.summary())
+    if table is not None:
+        logging.info("media table: %d unique images", len(table.entries))
+    if styles is not None:
+        logging.info("style table: %d distinct fonts", len(styles.entries))
+    if cache is not None:
+        evicted = cache.prune()
+        if jobs > 1:
+            logging.info("slide cache: %d entries evicted", evicted)
+        else:
+            logging.info(
+                "slide cache: %d hits, %d misses, %d entries evicted",
+                cache.hits,
+                cache.misses,
+                evicted,
+            )
+
+
+def extract_markdown(
+    in_path: Path,
+    *,
+    output_path: Path,
+    media_mode: MediaEmbedMode = "base64",
+    with_notes: bool = False,
+    jobs: int = 1,
+    slides: SlideRange | None = None,
+    cache: SlideCache | None = None,
+    compact_styles: bool = False,
+) -> str:
+    """Like `write_markdown`, returning the Markdown as a string."""
+    buf = io.StringIO()
+    write_markdown(
+        in_path,
+        buf,
+        output_path=output_path,
+        media_mode=media_mode,
+        with_notes=with_notes,
+        jobs=jobs,
+        slides=slides,
+        cache=cache,
+        compact_styles=compact_styles,
+    )
+    return buf.getvalue()
+
+
+def write_jsonl(
+    in_path: Path,
+    out: TextIO,
+    *,
+    output_path: Path,
+    media_mode: MediaEmbedMode = "base64",
+    jobs: int = 1,
+    slides: SlideRange | None = None,
+    cache: SlideCache | None = None,
+    compact_styles: bool = False,
+) -> SlideIndex:
+    """Like `write_markdown`, writing one compact `SlideDoc` per line to `out`.
+
+    No summary sections are rendered. Returns the offset index of the lines
+    written, for the caller to store next to the output.
+    """
+    with phase("load"):
+        prs = Loader(str(in_path)).presentation()
+    stream = JsonlStream(out)
+    table = MediaTable() if media_mode == "shared" else None
+    styles = StyleTable() if compact_styles else None
+    docs = _iter_docs(
+        prs,
+        in_path,
+        output_path=output_path,
+        media_mode=media_mode,
+        media_table=table,
+        style_table=styles,
+        jobs=jobs,
+        slides=slides,
+        cache=cache,
+    )
+    for doc in docs:
+        with phase("render", slide=doc.slide.index):
+            stream.write_slide(
+                doc,
+                table.drain_new() if table is not None else None,
+                styles.drain_new() if styles is not None else None,
+            )
+    index = stream.close()
+    logging.info("extracted %d slides to jsonl (%d bytes)", len(index.slides), index.size)
+    if cache is not None:
+        cache.prune()
+    return index
+
+
+def _iter_docs(
+    prs: Any,  # noqa: ANN401
+    in_path: Path,
+    *,
+    output_path: Path,
+    media_mode: MediaEmbedMode,
+    media_table: MediaTable | None,
+    style_table: StyleTable | None,
+    jobs: int,
+    slides: SlideRange | None,
+    cache: SlideCache | None,
+) -> Iterator[SlideDoc]:
+    # Build AST per slide (authoritative positional data)
+    if jobs > 1:
+        return ParallelAstExtractor(
+            jobs=jobs,
+            media_mode=media_mode,
+            markdown_path=output_path,
+            cache_dir=cache.root if cache is not None else None,
+            cache_max_bytes=cache.max_bytes if cache is not None else DEFAULT_CACHE_MAX_BYTES,
+        ).iter_slides(
+            in_path,
+            slide_count=len(prs.slides),
+            media_table=media_table,
+            style_table=style_table,
+            slides=slides,
+        )
+    asset_store = AssetStore(output_path) if media_mode == "refs" else None
+    return AstExtractor(
+        media_mode=media_mode,
+        asset_store=asset_store,
+        media_table=media_table,
+        style_table=style_table,
+        cache=cache,
+    ).iter_slides(prs, slides)
+
+
+def _heading(in_path: Path, prs: Any) -> str:  # noqa: ANN401
+    base = os.path.basename(str(in_path))
+    name = base[:-5] if base.lower().endswith(".pptx") else base
+    if name:
+        return name
+    core = getattr(getattr(prs, "core_properties", None), "title", None)
+    return str(core) if core else "Untitled Deck"
@@ -2,13 +2,31 @@ from __future__ import annotations
 
 import base64
 import html
+import io
 import mimetypes
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TextIO
 
 from deckdown.ast import Media, SlideDoc
+from deckdown.trace import phase
 
 
+_PAGE = """<!doctype html>
+<meta charset="utf-8" />
+<title>DeckDown Preview</title>
+<style>
+  body { background:#fafafa; }
+  .slide { box-shadow:0 2px 8px rgba(0,0,0,0.08); background:white; }
+  table td { min-width: 24px; }
+  img.pic { image-rendering:auto; }
+  .text { white-space:nowrap; text-overflow:ellipsis; }
+</style>
+<div class="deck">
+{body}
+</div>"""
+
 EMU_PER_INCH = 914400
 DPI = 96.0
 
@@ -96,23 +114,23 @@ class HtmlPreviewRenderer:
         out.append("</div>")
         return "\n".join(out)
 
-    def render_deck(self, docs: list[SlideDoc], asset_root: Path | None = None) -> str:
-        body = "\n".join(self.render_slide(d, asset_root=asset_root) for d in docs)
-        return f"""
-<!doctype html>
-<meta charset="utf-8" />
-<title>DeckDown Preview</title>
-<style>
-  body {{ background:#fafafa; }}
-  .slide {{ box-shadow:0 2px 8px rgba(0,0,0,0.08); background:white; }}
-  table td {{ min-width: 24px; }}
-  img.pic {{ image-rendering:auto; }}
-  .text {{ white-space:nowrap; text-overflow:ellipsis; }}
-</style>
-<div class="deck">
-{body}
-</div>
-""".strip()
+    def render_deck(self, docs: Iterable[SlideDoc], asset_root: Path | None = None) -> str:
+        buf = io.StringIO()
+        self.write_deck(docs, buf, asset_root=asset_root)
+        return buf.getvalue()
+
+    def write_deck(
+        self, docs: Iterable[SlideDoc], out: TextIO, asset_root: Path | None = None
+    ) -> None:
+        """Write the preview page to `out`, rendering one slide at a time."""
+        head, tail = _PAGE.split("{body}")
+        out.write(head)
+        for i, d in enumerate(docs):
+            if i:
+                out.write("\n")
+            with phase("render", slide=d.slide.index):
+                out.write(self.render_slide(d, asset_root=asset_root))
+        out.write(tail)
 
     def _media_data_url(self, media: Media, asset_root: Path | None) -> str | None:
         if media.data_url:
@@ -1,36 +1,341 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import logging
+import mmap
+import re
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass, field
 from pathlib import Path
-from collections.abc import Iterable
 
 from deckdown.ast import SlideDoc
+from deckdown.decode import decode_slide, decode_tables
+from deckdown.index import IndexEntry, SlideIndex, digest_of, index_path_for
+from deckdown.media import MEDIA_BLOCK_INFO, MediaTable
+from deckdown.styles import STYLE_BLOCK_INFO, StyleTable
+from deckdown.utils.slide_range import SlideRange
+
+_FENCES = frozenset({"```json", f"```{MEDIA_BLOCK_INFO}", f"```{STYLE_BLOCK_INFO}"})
+# Slide index as rendered (`"slide": {"index": N, ...`), read without decoding the block.
+_INDEX_RE = re.compile(r'"slide"\s*:\s*\{\s*"index"\s*:\s*(\d+)')
 
 
 @dataclass(frozen=True)
 class MarkdownReader:
-    def iter_blocks(self, text: str) -> Iterable[str]:
-        lines = text.splitlines()
-        in_block = False
+    def iter_blocks(self, text: str | Iterable[str]) -> Iterator[str]:
+        """Yield the body of each ```json fenced block (one per slide).
+
+        Accepts either the whole document or any iterable of lines (such as an
+        open file handle), in which case only the current block is buffered.
+        """
+        for _line, body in self.iter_blocks_at(text):
+            yield body
+
+    def iter_blocks_at(self, text: str | Iterable[str]) -> Iterator[tuple[int, str]]:
+        """Like `iter_blocks`, pairing each body with its first line number (1-based)."""
+        for info, body, line in self._iter_fenced(text):
+            if info == "json":
+                yield line, body
+
+    def iter_file(self, path: Path, slides: SlideRange | None = None) -> Iterator[SlideDoc]:
+        """Lazily yield validated `SlideDoc`s, reading `path` line by line.
+
+        Media-table blocks (shared embed mode) are collected as they appear and
+        picture refs into the table are resolved to their shared data URL.
+        Style-table blocks (compact styles) are collected the same way and runs
+        referencing them get their `font` filled in.
+        Memory stays proportional to the largest single slide block plus the
+        unique media seen so far. With `slides`, blocks whose slide index is not
+        selected are skipped without being decoded or validated; when the file
+        has an index sidecar (`deckdown index`), the selected blocks are read
+        straight from their recorded byte ranges instead of scanning the file.
+        """
+        if slides is not None and index_path_for(path).exists():
+            with self.open(path) as deck:
+                yield from deck.iter_slides(slides)
+            return
+        table = MediaTable()
+        styles = StyleTable()
+        with path.open("r", encoding="utf-8") as fh:
+            for info, body, _line in self._iter_fenced(fh):
+                if info in (MEDIA_BLOCK_INFO, STYLE_BLOCK_INFO):
+                    # Kept even for skipped slides: later slides may refer to these entries.
+                    decode_tables(body, table, styles)
+                elif info == "json":
+                    if slides is not None and not self._selected(body, slides):
+                        continue
+                    yield decode_slide(body, table, styles)
+
+    def load_file(self, path: Path, slides: SlideRange | None = None) -> list[SlideDoc]:
+        return list(self.iter_file(path, slides))
+
+    def open(self, path: Path) -> IndexedDeck:
+        """Random access to the slides of `path` through its offset index.
+
+        The sidecar index is used when it matches the file's size and mtime;
+        otherwise the file is re-indexed with one scan (and a stale sidecar is
+        rewritten).
+        """
+        index = _current_index(path, self.build_index)
+        return IndexedDeck(path=path, index=index, rebuild=self.build_index)
+
+    def write_index(self, path: Path) -> SlideIndex:
+        index = self.build_index(path)
+        index.save(path)
+        return index
+
+    @staticmethod
+    def build_index(path: Path) -> SlideIndex:
+        """Record the byte range of every fenced block body, reading slide indices only."""
+        st = path.stat()
+        index = SlideIndex(mtime_ns=st.st_mtime_ns)
+        offset = 0
+        info: str | None = None
+        start = 0
+        buf: list[bytes] = []
+        with path.open("rb") as fh:
+            for raw in fh:
+                ln = raw.rstrip(b"\r\n")
+                if info is None:
+                    fence = ln.strip().lower().decode("utf-8", "replace")
+                    if fence in _FENCES:
+                        info = fence[3:]
+                        start = offset + len(raw)
+                        buf = []
+                elif ln.strip() == b"```":
+                    body = b"".join(buf).rstrip(b"\r\n")
+                    if info == "json":
+                        slide_no = _slide_index(body.decode("utf-8"))
+                        if slide_no is not None:
+                            index.add_slide(slide_no, start, body)
+                    else:
+                        index.add_table(start, body)
+                    info = None
+                else:
+                    buf.append(raw)
+                offset += len(raw)
+        index.size = offset
+        return index
+
+    @staticmethod
+    def _selected(body: str, slides: SlideRange) -> bool:
+        index = _slide_index(body)
+        if index is None:
+            return True  # let validation report the malformed block
+        return index > 0 and slides.contains(index)
+
+    @staticmethod
+    def _iter_fenced(text: str | Iterable[str]) -> Iterator[tuple[str, str, int]]:
+        lines = text.splitlines() if isinstance(text, str) else text
+        info: str | None = None
+        start = 0
         buf: list[str] = []
-        for ln in lines:
-            if not in_block and ln.strip().lower() == "```json":
-                in_block = True
-                buf = []
+        for line_no, raw in enumerate(lines, start=1):
+            ln = raw.rstrip("\r\n")
+            if info is None:
+                fence = ln.strip().lower()
+                if fence in _FENCES:
+                    info = fence[3:]
+                    start = line_no + 1
+                    buf = []
                 continue
-            if in_block and ln.strip() == "```":
-                yield "\n".join(buf)
-                in_block = False
+            if ln.strip() == "```":
+                yield info, "\n".join(buf), start
+                info = None
                 buf = []
                 continue
-            if in_block:
-                buf.append(ln)
-
-    def load_file(self, path: Path) -> list[SlideDoc]:
-        text = path.read_text(encoding="utf-8")
-        docs: list[SlideDoc] = []
-        for raw in self.iter_blocks(text):
-            payload = json.loads(raw)
-            docs.append(SlideDoc.model_validate(payload))
-        return docs
+            buf.append(ln)
+
+
+@dataclass(frozen=True)
+class JsonlReader:
+    """Reads `extract --format jsonl` output: one compact `SlideDoc` per line.
+
+    `iter_file` streams the whole file like `MarkdownReader.iter_file`. `open`
+    uses the sidecar offset index to seek straight to a slide, decoding only
+    that line and the table records ahead of it; a missing or stale index is
+    rebuilt with one scan of the file that decodes no slides.
+    """
+
+    verify: bool = True
+
+    def iter_file(self, path: Path, slides: SlideRange | None = None) -> Iterator[SlideDoc]:
+        table = MediaTable()
+        styles = StyleTable()
+        with path.open("r", encoding="utf-8", newline="") as fh:
+            for raw in fh:
+                line = raw.rstrip("\r\n")
+                if not line.strip():
+                    continue
+                if _is_table_record(line):
+                    decode_tables(line, table, styles)
+                    continue
+                if slides is not None and not MarkdownReader._selected(line, slides):
+                    continue
+                yield decode_slide(line, table, styles)
+
+    def open(self, path: Path) -> IndexedDeck:
+        index = _current_index(path, self.build_index)
+        return IndexedDeck(path=path, index=index, verify=self.verify, rebuild=self.build_index)
+
+    def write_index(self, path: Path) -> SlideIndex:
+        index = self.build_index(path)
+        index.save(path)
+        return index
+
+    @staticmethod
+    def build_index(path: Path) -> SlideIndex:
+        """Index a JSONL deck by scanning its lines (slide indices read without decoding)."""
+        st = path.stat()
+        index = SlideIndex(mtime_ns=st.st_mtime_ns)
+        offset = 0
+        with path.open("rb") as fh:
+            for raw in fh:
+                data = raw.rstrip(b"\r\n")
+                if data.strip():
+                    text = data.decode("utf-8")
+                    if _is_table_record(text):
+                        index.add_table(offset, data)
+                    else:
+                        slide_no = _slide_index(text)
+                        if slide_no is not None:
+                            index.add_slide(slide_no, offset, data)
+                offset += len(raw)
+        index.size = offset
+        return index
+
+
+@dataclass
+class IndexedDeck:
+    """Random access to the slides of one Markdown or JSONL deck through its offset index.
+
+    The file is memory-mapped on first use; each read slices one record,
+    checks it against the index digest and decodes only that record (plus
+    the media/style table records ahead of it, once). A record that no
+    longer matches (the file was edited without changing its size or mtime)
+    makes the deck re-index the file once with `rebuild` and retry.
+    """
+
+    path: Path
+    index: SlideIndex
+    verify: bool = True
+    rebuild: Callable[[Path], SlideIndex] | None = field(default=None, repr=False)
+    _mm: mmap.mmap | None = field(default=None, init=False, repr=False)
+    _media: MediaTable = field(default_factory=MediaTable, init=False, repr=False)
+    _styles: StyleTable = field(default_factory=StyleTable, init=False, repr=False)
+    _loaded: set[int] = field(default_factory=set, init=False, repr=False)
+
+    def __enter__(self) -> IndexedDeck:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index.slides)
+
+    def __contains__(self, slide_no: object) -> bool:
+        return slide_no in self.index.slides
+
+    @property
+    def slide_numbers(self) -> list[int]:
+        """Indexed slide numbers in file order."""
+        return [slide_no for slide_no, _ in self.index.in_file_order()]
+
+    def slide(self, slide_no: int) -> SlideDoc:
+        """Seek to slide `slide_no` (1-based) and decode only its record."""
+        return decode_slide(self.raw(slide_no), self._media, self._styles)
+
+    def raw(self, slide_no: int) -> bytes:
+        """The undecoded record of slide `slide_no`, with the tables ahead of it loaded."""
+        try:
+            return self._raw(slide_no)
+        except _StaleRecordError:
+            if self.rebuild is None:
+                raise
+        logging.info("slide index for %s does not match its records; rebuilding", self.path)
+        self._reindex(self.rebuild)
+        return self._raw(slide_no)
+
+    def line_of(self, slide_no: int) -> int:
+        """1-based line number at which slide `slide_no`'s record starts."""
+        entry = self.index.slides[slide_no]
+        return self._map()[: entry.offset].count(b"\n") + 1
+
+    def iter_slides(self, slides: SlideRange | None = None) -> Iterator[SlideDoc]:
+        for slide_no in self.slide_numbers:
+            if slides is None or slides.contains(slide_no):
+                yield self.slide(slide_no)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _map(self) -> mmap.mmap:
+        if self._mm is None:
+            with self.path.open("rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm
+
+    def _raw(self, slide_no: int) -> bytes:
+        entry = self.index.slides.get(slide_no)
+        if entry is None:
+            raise KeyError(f"slide {slide_no} not in {self.path}")
+        for table in self.index.tables_before(entry.offset):
+            if table.offset not in self._loaded:
+                decode_tables(self._read(table), self._media, self._styles)
+                self._loaded.add(table.offset)
+        return self._read(entry)
+
+    def _reindex(self, build: Callable[[Path], SlideIndex]) -> None:
+        # Only once: a record that still mismatches is reported, not re-indexed again.
+        self.rebuild = None
+        self.close()
+        self.index = build(self.path)
+        self._media = MediaTable()
+        self._styles = StyleTable()
+        self._loaded.clear()
+        with suppress(OSError):
+            self.index.save(self.path)
+
+    def _read(self, entry: IndexEntry) -> bytes:
+        data = self._map()[entry.offset : entry.offset + entry.length]
+        if self.verify and digest_of(data) != entry.digest:
+            raise _StaleRecordError(
+                f"{self.path}: record at byte {entry.offset} does not match its index digest"
+            )
+        return data
+
+
+class _StaleRecordError(ValueError):
+    """A record whose bytes differ from the digest its index recorded."""
+
+
+def _current_index(path: Path, build: Callable[[Path], SlideIndex]) -> SlideIndex:
+    sidecar = index_path_for(path)
+    index = SlideIndex.load(sidecar)
+    if index is not None and index.is_current(path):
+        return index
+    index = build(path)
+    if sidecar.exists():
+        logging.info("slide index for %s is stale; rebuilding", path)
+        with suppress(OSError):
+            index.save(path)
+    return index
+
+
+def _slide_index(body: str) -> int | None:
+    m = _INDEX_RE.search(body)
+    if m is not None:
+        return int(m.group(1))
+    # Hand-edited block with a different key order: decode to find the index.
+    try:
+        return int(json.loads(body)["slide"]["index"])
+    except Exception:
+        return None
+
+
+def _is_table_record(line: str) -> bool:
+    return line.startswith(('{"media"', '{"styles"'))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
 __all__ = [
+    "jsonl",
     "markdown",
 ]
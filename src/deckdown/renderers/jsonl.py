@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+from deckdown.ast import SlideDoc
+from deckdown.index import SlideIndex
+from deckdown.renderers.markdown import MarkdownRenderer
+
+__all__ = ["JsonlStream"]
+
+
+@dataclass
+class JsonlStream:
+    """Writes one compact `SlideDoc` per line and records each line's byte span.
+
+    Shared media and style-table entries (shared embed mode, compact styles) go
+    on their own `{"media": ...}` / `{"styles": ...}` lines ahead of the first
+    slide that uses them, mirroring the fenced table blocks of the Markdown
+    output. `out` must not translate newlines (see `OutputManager.open_text_file`)
+    so the recorded offsets match the bytes on disk.
+    """
+
+    out: TextIO
+    index: SlideIndex = field(default_factory=SlideIndex)
+    _offset: int = field(default=0, init=False, repr=False)
+
+    def write_slide(
+        self,
+        doc: SlideDoc,
+        media: Mapping[str, str] | None = None,
+        styles: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> None:
+        if styles:
+            self._write_table({"styles": dict(styles)})
+        if media:
+            self._write_table({"media": dict(media)})
+        offset, data = self._write_line(MarkdownRenderer._dump_json(doc, indent=None))
+        self.index.add_slide(doc.slide.index, offset, data)
+
+    def close(self) -> SlideIndex:
+        """Finish the stream and return the index of everything written."""
+        self.index.size = self._offset
+        return self.index
+
+    def _write_table(self, record: dict[str, Any]) -> None:
+        offset, data = self._write_line(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        )
+        self.index.add_table(offset, data)
+
+    def _write_line(self, line: str) -> tuple[int, bytes]:
+        data = line.encode("utf-8")
+        offset = self._offset
+        self.out.write(line)
+        self.out.write("\n")
+        self._offset += len(data) + 1
+        return offset, data
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import io
 import json
 import os
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Mapping, TextIO
 
 from deckdown.models import Deck, Slide, Table
 from deckdown.ast import SlideDoc
+from deckdown.media import MEDIA_BLOCK_INFO
+from deckdown.styles import STYLE_BLOCK_INFO
 
-__all__ = ["MarkdownRenderer"]
+__all__ = ["MarkdownRenderer", "MarkdownStream"]
 
 
 @dataclass(frozen=True)
@@ -20,25 +23,56 @@ class MarkdownRenderer:
         deck: Deck,
         ast_per_slide: Mapping[int, SlideDoc | Mapping[str, Any]] | None = None,
     ) -> str:
-        lines: list[str] = []
-        heading = self._basename(deck.file) or deck.title or "Untitled Deck"
-        lines.append(f"# {heading}")
-        lines.append("")
+        buf = io.StringIO()
+        self.render_to(buf, deck, ast_per_slide=ast_per_slide)
+        return buf.getvalue()
 
+    def render_to(
+        self,
+        out: TextIO,
+        deck: Deck,
+        ast_per_slide: Mapping[int, SlideDoc | Mapping[str, Any]] | None = None,
+    ) -> None:
+        heading = self._basename(deck.file) or deck.title or "Untitled Deck"
+        stream = self.stream(out, heading=heading)
         for slide in deck.slides:
-            self._render_slide(slide, lines)
-            # Append AST (authoritative) if provided
-            if ast_per_slide is not None and slide.index in ast_per_slide:
-                lines.append("---")
-                lines.append("```json")
-                lines.append(self._dump_json(ast_per_slide[slide.index]))
-                lines.append("```")
-                lines.append("")
+            ast = ast_per_slide.get(slide.index) if ast_per_slide is not None else None
+            stream.write_slide(slide, ast)
+        stream.close()
 
-        # Trim trailing blank lines and ensure a single trailing newline
-        while lines and lines[-1] == "":
-            lines.pop()
-        return "\n".join(lines) + "\n"
+    def stream(self, out: TextIO, *, heading: str) -> MarkdownStream:
+        """Start an incremental document: each slide is written as soon as it is given."""
+        stream = MarkdownStream(renderer=self, out=out)
+        stream.write_lines([f"# {heading}", ""])
+        return stream
+
+    def slide_lines(
+        self,
+        slide: Slide,
+        ast: SlideDoc | Mapping[str, Any] | None = None,
+        media: Mapping[str, str] | None = None,
+        styles: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> list[str]:
+        lines: list[str] = []
+        self._render_slide(slide, lines)
+        # Append AST (authoritative) if provided
+        if ast is not None:
+            lines.append("---")
+            if styles:
+                # Style-table fonts first used by this slide (compact styles)
+                lines.append(f"```{STYLE_BLOCK_INFO}")
+                lines.append(json.dumps({"styles": dict(styles)}, ensure_ascii=False, indent=2))
+                lines.append("```")
+            if media:
+                # Shared media-table entries first used by this slide
+                lines.append(f"```{MEDIA_BLOCK_INFO}")
+                lines.append(json.dumps({"media": dict(media)}, ensure_ascii=False, indent=2))
+                lines.append("```")
+            lines.append("```json")
+            lines.append(self._dump_json(ast))
+            lines.append("```")
+            lines.append("")
+        return lines
 
     def _render_slide(self, slide: Slide, lines: list[str]) -> None:
         lines.append(f"## Slide {slide.index} — {slide.title or 'Untitled'}")
@@ -141,12 +175,53 @@ class MarkdownRenderer:
         return base[:-5] if base.lower().endswith(".pptx") else base
 
     @staticmethod
-    def _dump_json(obj: SlideDoc | Mapping[str, Any]) -> str:
+    def _dump_json(obj: SlideDoc | Mapping[str, Any], indent: int | None = 2) -> str:
+        """Serialize a slide AST; `indent=None` gives the compact one-line form."""
         if isinstance(obj, SlideDoc):
-            return obj.model_dump_json(indent=2, ensure_ascii=False)
+            return obj.model_dump_json(indent=indent, ensure_ascii=False)
 
         model_dump = getattr(obj, "model_dump_json", None)
         if callable(model_dump):
-            return model_dump(indent=2, ensure_ascii=False)
+            return model_dump(indent=indent, ensure_ascii=False)
+
+        separators = None if indent is not None else (",", ":")
+        return json.dumps(obj, ensure_ascii=False, indent=indent, separators=separators)
 
-        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=False)
+
+@dataclass
+class MarkdownStream:
+    """Line sink that writes rendered slides straight to a text stream.
+
+    Blank lines are held back until the next non-blank line so the result is
+    byte-identical to `MarkdownRenderer.render`, which trims trailing blanks and
+    ends with a single newline.
+    """
+
+    renderer: MarkdownRenderer
+    out: TextIO
+    _pending_blank: int = field(default=0, init=False, repr=False)
+    _started: bool = field(default=False, init=False, repr=False)
+
+    def write_slide(
+        self,
+        slide: Slide,
+        ast: SlideDoc | Mapping[str, Any] | None = None,
+        media: Mapping[str, str] | None = None,
+        styles: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> None:
+        self.write_lines(self.renderer.slide_lines(slide, ast, media, styles))
+
+    def write_lines(self, lines: list[str]) -> None:
+        for line in lines:
+            if line == "":
+                self._pending_blank += 1
+                continue
+            if self._started:
+                self.out.write("\n" * (self._pending_blank + 1))
+            self.out.write(line)
+            self._started = True
+            self._pending_blank = 0
+
+    def close(self) -> None:
+        self.out.write("\n")
+        self._pending_blank = 0
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import Any
+
+from deckdown.ast import (
+    BasicShape,
+    FontSpec,
+    SlideDoc,
+    TableShape,
+    TextPayload,
+    TextRun,
+    TextShape,
+)
+
+# Fence info string for deck-level style table blocks (compact style mode).
+STYLE_BLOCK_INFO = "json deckdown-styles"
+
+_FONT_FIELDS = ("family", "size_pt", "bold", "italic", "underline", "color")
+
+
+@dataclass
+class StyleTable:
+    """Deck-level table of distinct run fonts keyed by content digest.
+
+    In compact mode runs carry `style: <key>` instead of repeating their
+    `FontSpec`. Like `MediaTable`, entries added since the last `drain_new()`
+    are emitted once, ahead of the first slide that uses them, and readers
+    accumulate entries as they stream. Keys are digests of the font JSON, so
+    tables built independently (worker processes, cached slides) agree.
+    """
+
+    digest_chars: int = 8
+    entries: dict[str, FontSpec] = field(default_factory=dict)
+    _new: list[str] = field(default_factory=list, init=False, repr=False)
+    # Key per raw font tuple: a repeated font costs one dict lookup, no model.
+    _keys: dict[tuple[Any, ...], str] = field(default_factory=dict, init=False, repr=False)
+
+    def run(self, text: str, font: dict[str, Any]) -> TextRun:
+        """A `TextRun` referencing `font` through this table (plain when `font` is empty)."""
+        if not font:
+            return TextRun(text=text)
+        return TextRun(text=text, style=self.add_font(font))
+
+    def add_font(self, font: dict[str, Any]) -> str:
+        raw = tuple(font.get(name) for name in _FONT_FIELDS)
+        key = self._keys.get(raw)
+        if key is None:
+            spec = FontSpec.model_validate(font)
+            body = spec.model_dump_json(exclude_none=True)
+            key = sha256(body.encode("utf-8")).hexdigest()[: self.digest_chars]
+            self._add_spec(key, spec)
+            self._keys[raw] = key
+        return key
+
+    def add(self, key: str, font: dict[str, Any]) -> None:
+        if key not in self.entries:
+            self._add_spec(key, FontSpec.model_validate(font))
+
+    def update(self, entries: dict[str, dict[str, Any]]) -> None:
+        for key, font in entries.items():
+            self.add(key, font)
+
+    def drain_new(self) -> dict[str, dict[str, Any]]:
+        out = {key: self.dump(key) for key in self._new}
+        self._new.clear()
+        return out
+
+    def dump(self, key: str) -> dict[str, Any]:
+        return self.entries[key].model_dump(mode="json", exclude_none=True)
+
+    def expand(self, payload: Any) -> Any:  # noqa: ANN401
+        """Fill `font` for runs in a decoded slide block that reference this table.
+
+        Works on the JSON payload before validation, so readers get the same
+        models as an uncompacted document (the `style` key is kept). Runs share
+        the table's `FontSpec` instances.
+        """
+        if isinstance(payload, dict):
+            runs = payload.get("runs")
+            if isinstance(runs, list):
+                for run in runs:
+                    key = run.get("style") if isinstance(run, dict) else None
+                    if key and not run.get("font") and key in self.entries:
+                        run["font"] = self.entries[key]
+            for value in payload.values():
+                if isinstance(value, (dict, list)):
+                    self.expand(value)
+        elif isinstance(payload, list):
+            for item in payload:
+                if isinstance(item, (dict, list)):
+                    self.expand(item)
+        return payload
+
+    def _add_spec(self, key: str, spec: FontSpec) -> None:
+        self.entries[key] = spec
+        self._new.append(key)
+
+
+def style_refs(doc: SlideDoc) -> set[str]:
+    """Style keys referenced by runs anywhere in `doc`."""
+    return {
+        run.style for text in _iter_text(doc) for p in text.paras for run in p.runs if run.style
+    }
+
+
+def _iter_text(doc: SlideDoc) -> Iterator[TextPayload]:
+    for sh in doc.slide.shapes:
+        if isinstance(sh, (TextShape, BasicShape)) and sh.text is not None:
+            yield sh.text
+        elif isinstance(sh, TableShape):
+            for cell in sh.table.cells:
+                yield cell.text
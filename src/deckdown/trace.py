@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from deckdown.io import OutputManager
+
+__all__ = ["Tracer", "phase", "span", "tracing"]
+
+# The tracer recording for this process; None keeps `span`/`phase` no-ops.
+_ACTIVE: Tracer | None = None
+_NULL: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass
+class Tracer:
+    """Nested timing spans in the Chrome trace-event format.
+
+    Load a saved trace in `chrome://tracing` or https://ui.perfetto.dev.
+    Phases are spans that, with `profile_dir`, also run under cProfile: each
+    phase name accumulates its own profile (time spent in a nested phase is
+    only counted there), dumped as `<profile_dir>/<phase>.prof`.
+    """
+
+    profile_dir: Path | None = None
+    events: list[dict[str, Any]] = field(default_factory=list)
+    _t0: int = field(default_factory=time.perf_counter_ns, repr=False)
+    _profiles: dict[str, cProfile.Profile] = field(default_factory=dict, repr=False)
+    _running: list[cProfile.Profile] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def span(self, name: str, cat: str, args: dict[str, Any] | None = None) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start - self._t0) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    @contextmanager
+    def phase(self, name: str, args: dict[str, Any] | None = None) -> Iterator[None]:
+        if self.profile_dir is None:
+            with self.span(name, "phase", args):
+                yield
+            return
+        prof = self._profiles.setdefault(name, cProfile.Profile())
+        if self._running:
+            self._running[-1].disable()
+        self._running.append(prof)
+        prof.enable()
+        try:
+            with self.span(name, "phase", args):
+                yield
+        finally:
+            prof.disable()
+            self._running.pop()
+            if self._running:
+                self._running[-1].enable()
+
+    def to_json(self) -> str:
+        meta = {"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": "deckdown"}}
+        payload = {"traceEvents": [meta, *self.events], "displayTimeUnit": "ms"}
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+    def save(self, path: Path) -> None:
+        with OutputManager().open_text_file(path) as fh:
+            fh.write(self.to_json())
+
+    def dump_profiles(self) -> list[Path]:
+        """Write one `.prof` file per profiled phase; returns their paths."""
+        if self.profile_dir is None:
+            return []
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        for name, prof in self._profiles.items():
+            path = self.profile_dir / f"{name}.prof"
+            prof.dump_stats(str(path))
+            written.append(path)
+        return written
+
+
+def span(name: str, cat: str = "span", **args: Any) -> AbstractContextManager[None]:  # noqa: ANN401
+    """Record a nested span while a `tracing` block is active; a no-op otherwise."""
+    tracer = _ACTIVE
+    return _NULL if tracer is None else tracer.span(name, cat, args)
+
+
+def phase(name: str, **args: Any) -> AbstractContextManager[None]:  # noqa: ANN401
+    """Like `span`, for a pipeline phase: profiled per name when a profile directory is set."""
+    tracer = _ACTIVE
+    return _NULL if tracer is None else tracer.phase(name, args)
+
+
+@contextmanager
+def tracing(path: Path | None = None, *, profile_dir: Path | None = None) -> Iterator[Tracer]:
+    """Record spans in this process until the block exits, then save them.
+
+    The trace is written to `path` (if given) and phase profiles to
+    `profile_dir` (if given), also when the block raises. Work done in worker
+    processes (`--jobs > 1`) is not traced beyond the parent's phases.
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    tracer = Tracer(profile_dir=profile_dir)
+    _ACTIVE = tracer
+    try:
+        yield tracer
+    finally:
+        _ACTIVE = previous
+        if path is not None:
+            tracer.save(path)
+        tracer.dump_profiles()
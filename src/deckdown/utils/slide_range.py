@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
@@ -24,8 +25,9 @@ class SlideRange:
     def contains(self, index: int) -> bool:
         if index <= 0:
             raise ValueError("index must be positive (1-based)")
-        # Binary search could be used; linear is fine for small ranges
-        return index in self.items
+        # items are sorted and unique (enforced above): O(log n)
+        pos = bisect_left(self.items, index)
+        return pos < len(self.items) and self.items[pos] == index
 
     def as_list(self) -> list[int]:
         return list(self.items)
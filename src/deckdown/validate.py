@@ -1,55 +1,206 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+import re
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from hashlib import sha256
+from json.decoder import scanstring
 from pathlib import Path
+from typing import Any
 
+from pydantic import ValidationError
+
+from deckdown import __version__
 from deckdown.ast import SlideDoc
+from deckdown.decode import decode_slide, json_error
+from deckdown.reader import MarkdownReader
+from deckdown.trace import phase, span
+from deckdown.utils.slide_range import SlideRange
+
+__all__ = ["MarkdownValidator", "ValidationCache"]
+
+# (source label, block number, first body line in the file, body)
+Block = tuple[str, int, int, str]
+
+_JSON_POS_RE = re.compile(r"line (\d+) column (\d+)")
+_DECODER = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+@dataclass
+class ValidationCache:
+    """Digests of slide blocks that passed validation in an earlier run.
+
+    Blocks whose digest is listed are skipped. Digests cover the block text
+    and the deckdown version, so an upgrade revalidates everything. New
+    digests are appended to `<root>/validated.txt` in a single write, which
+    keeps concurrent CI jobs sharing one directory safe.
+    """
+
+    root: Path
+    _known: set[str] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+
+    @property
+    def path(self) -> Path:
+        return self.root / "validated.txt"
+
+    @staticmethod
+    def key(body: str) -> str:
+        return sha256(f"deckdown {__version__}\n{body}".encode()).hexdigest()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._load()
+
+    def record(self, keys: Iterable[str]) -> None:
+        known = self._load()
+        new = [k for k in dict.fromkeys(keys) if k not in known]
+        if not new:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, "".join(f"{k}\n" for k in new).encode("ascii"))
+        finally:
+            os.close(fd)
+        known.update(new)
+
+    def _load(self) -> set[str]:
+        if self._known is None:
+            try:
+                self._known = set(self.path.read_text(encoding="utf-8").split())
+            except OSError:
+                self._known = set()
+        return self._known
 
 
 @dataclass(frozen=True)
 class MarkdownValidator:
+    """Schema and invariant checks for the slide blocks of deckdown Markdown.
+
+    Errors read `SOURCE:LINE:COL: block N: message`, pointing at the offending
+    value inside the block. With `jobs > 1` blocks are checked across worker
+    processes; results are reported in document order either way. With
+    `fail_fast`, checking stops after the first block that has errors. With
+    `cache`, blocks that passed before are skipped and newly passing ones are
+    recorded.
+    """
+
+    jobs: int = 1
+    fail_fast: bool = False
+    cache: ValidationCache | None = None
+    chunks_per_job: int = 4
+
     def find_json_blocks(self, text: str) -> list[str]:
-        lines = text.splitlines()
-        blocks: list[str] = []
-        in_block = False
-        buf: list[str] = []
-        for ln in lines:
-            if not in_block and ln.strip().lower() == "```json":
-                in_block = True
-                buf = []
-                continue
-            if in_block and ln.strip() == "```":
-                blocks.append("\n".join(buf))
-                in_block = False
-                buf = []
-                continue
-            if in_block:
-                buf.append(ln)
+        return list(MarkdownReader().iter_blocks(text))
+
+    def validate_text(self, text: str, *, source: str = "<text>") -> list[str]:
+        with phase("read"):
+            blocks = [
+                (source, i, line, body)
+                for i, (line, body) in enumerate(MarkdownReader().iter_blocks_at(text), start=1)
+            ]
+        return self._run(blocks)
+
+    def validate_file(self, path: Path, slides: SlideRange | None = None) -> list[str]:
+        return self.validate_files([path], slides)
+
+    def validate_files(self, paths: Sequence[Path], slides: SlideRange | None = None) -> list[str]:
+        """Validate the blocks of every file in `paths` as one batch.
+
+        With `slides`, only those slides are read, through each file's offset
+        index (see `MarkdownReader.open`): unselected blocks are neither
+        decoded nor validated.
+        """
+        blocks: list[Block] = []
+        with phase("read"):
+            for path in paths:
+                blocks.extend(self._file_blocks(path, slides))
+        return self._run(blocks)
+
+    def check_block(self, block: Block) -> list[str]:
+        """Errors for one block, each located at `SOURCE:LINE:COL`."""
+        source, number, first_line, body = block
+        with span("block", "block", source=source, block=number):
+            found = self._validate_block(body)
+        return [
+            f"{source}:{first_line + line - 1}:{col}: block {number}: {msg}"
+            for line, col, msg in found
+        ]
+
+    def _file_blocks(self, path: Path, slides: SlideRange | None) -> list[Block]:
+        if slides is None:
+            return [
+                (str(path), i, line, body)
+                for i, (line, body) in enumerate(
+                    MarkdownReader().iter_blocks_at(path.read_text(encoding="utf-8")), start=1
+                )
+            ]
+        blocks: list[Block] = []
+        with MarkdownReader().open(path) as deck:
+            for i, slide_no in enumerate(deck.slide_numbers, start=1):
+                if slides.contains(slide_no):
+                    body = deck.raw(slide_no).decode("utf-8")
+                    blocks.append((str(path), i, deck.line_of(slide_no), body))
         return blocks
 
-    def validate_text(self, text: str) -> list[str]:
+    def _run(self, blocks: list[Block]) -> list[str]:
+        cache = self.cache
+        pending = [b for b in blocks if cache is None or ValidationCache.key(b[3]) not in cache]
+        with phase("check"):
+            results = self._check_all(pending)
         errors: list[str] = []
-        for i, raw in enumerate(self.find_json_blocks(text), start=1):
-            try:
-                payload = json.loads(raw)
-            except Exception as exc:  # pragma: no cover - error path exercised in tests
-                errors.append(f"block {i}: invalid JSON: {exc}")
-                continue
-            try:
-                doc = SlideDoc.model_validate(payload)
-            except Exception as exc:  # pragma: no cover
-                errors.append(f"block {i}: schema error: {exc}")
-                continue
-            # invariants
-            errs = self._check_invariants(doc)
-            for e in errs:
-                errors.append(f"block {i}: {e}")
+        passed: list[str] = []
+        for block, errs in zip(pending, results, strict=False):
+            if errs:
+                errors.extend(errs)
+                if self.fail_fast:
+                    break
+            elif cache is not None:
+                passed.append(ValidationCache.key(block[3]))
+        if cache is not None:
+            cache.record(passed)
         return errors
 
-    def validate_file(self, path: Path) -> list[str]:
-        text = path.read_text(encoding="utf-8")
-        return self.validate_text(text)
+    def _check_all(self, blocks: list[Block]) -> list[list[str]]:
+        """Per-block errors in block order; may stop early when failing fast."""
+        if self.jobs <= 1 or len(blocks) < 2:
+            out: list[list[str]] = []
+            for block in blocks:
+                out.append(self.check_block(block))
+                if self.fail_fast and out[-1]:
+                    break
+            return out
+        parts = _partition(blocks, self.jobs * self.chunks_per_job)
+        out = []
+        with ProcessPoolExecutor(max_workers=min(self.jobs, len(parts))) as pool:
+            futures: list[Future[list[list[str]]]] = [
+                pool.submit(_check_chunk, self.fail_fast, part) for part in parts
+            ]
+            for fut in futures:
+                chunk = fut.result()
+                out.extend(chunk)
+                if self.fail_fast and any(chunk):
+                    for rest in futures:
+                        rest.cancel()
+                    break
+        return out
+
+    def _validate_block(self, raw: str) -> list[tuple[int, int, str]]:
+        """(line, column, message) within `raw` for each problem found."""
+        try:
+            doc = decode_slide(raw)
+        except ValidationError as exc:
+            if json_error(exc):
+                return [_json_error_at(exc)]
+            return [_schema_error_at(raw, err) for err in exc.errors()]
+        # invariants: reported at the start of the block
+        return [(1, 1, e) for e in self._check_invariants(doc)]
 
     def _check_invariants(self, doc: SlideDoc) -> list[str]:
         errs: list[str] = []
@@ -109,3 +260,85 @@ class MarkdownValidator:
             if g and g not in group_ids:
                 errs.append(f"shape {sh.id} has non-existent group id {g}")
         return errs
+
+
+def _check_chunk(fail_fast: bool, blocks: list[Block]) -> list[list[str]]:
+    validator = MarkdownValidator()
+    out: list[list[str]] = []
+    for block in blocks:
+        out.append(validator.check_block(block))
+        if fail_fast and out[-1]:
+            break
+    return out
+
+
+def _partition(blocks: list[Block], chunks: int) -> list[list[Block]]:
+    size = max(1, -(-len(blocks) // max(1, chunks)))
+    return [blocks[i : i + size] for i in range(0, len(blocks), size)]
+
+
+def _json_error_at(exc: ValidationError) -> tuple[int, int, str]:
+    err = exc.errors()[0]
+    detail = str((err.get("ctx") or {}).get("error", err.get("msg", "")))
+    m = _JSON_POS_RE.search(detail)
+    line, col = (int(m.group(1)), int(m.group(2))) if m else (1, 1)
+    return line, col, f"invalid JSON: {detail}"
+
+
+def _schema_error_at(raw: str, err: Any) -> tuple[int, int, str]:  # noqa: ANN401
+    loc = tuple(err.get("loc", ()))
+    line, col = _position(raw, _offset_of(raw, loc))
+    where = ".".join(str(part) for part in loc) or "<root>"
+    return line, col, f"schema error at {where}: {err.get('msg', '')}"
+
+
+def _offset_of(text: str, loc: tuple[Any, ...]) -> int:
+    """Offset of the value at pydantic location `loc`, or of its deepest existing parent.
+
+    Segments that name no key (union tags such as `text_box`) are skipped.
+    """
+    pos = _skip_ws(text, 0)
+    for seg in loc:
+        child = _child_offset(text, pos, seg)
+        if child is not None:
+            pos = child
+    return pos
+
+
+def _child_offset(text: str, pos: int, seg: Any) -> int | None:  # noqa: ANN401
+    try:
+        if text[pos] == "{" and isinstance(seg, str):
+            i = _skip_ws(text, pos + 1)
+            while text[i] == '"':
+                key, i = scanstring(text, i + 1)
+                i = _skip_ws(text, i)
+                i = _skip_ws(text, i + 1)  # past ":"
+                if key == seg:
+                    return i
+                _, i = _DECODER.raw_decode(text, i)
+                i = _skip_ws(text, i)
+                if text[i] != ",":
+                    return None
+                i = _skip_ws(text, i + 1)
+        elif text[pos] == "[" and isinstance(seg, int):
+            i = _skip_ws(text, pos + 1)
+            for _ in range(seg):
+                _, i = _DECODER.raw_decode(text, i)
+                i = _skip_ws(text, i)
+                if text[i] != ",":
+                    return None
+                i = _skip_ws(text, i + 1)
+            return i if text[i] != "]" else None
+    except (IndexError, ValueError):
+        return None
+    return None
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    m = _WS.match(text, pos)
+    return m.end() if m is not None else pos
+
+
+def _position(text: str, offset: int) -> tuple[int, int]:
+    line = text.count("\n", 0, offset) + 1
+    return line, offset - (text.rfind("\n", 0, offset) + 1) + 1
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from deckdown.assemble import DeckAssembler
+from deckdown.ast import ChartAxes, Color, SlideDoc, ValueAxis
+
+_BBOX = {
+    "x_emu": 914400,
+    "y_emu": 914400,
+    "w_emu": 3657600,
+    "h_emu": 2438400,
+    "x_norm": 0.1,
+    "y_norm": 0.1,
+    "w_norm": 0.4,
+    "h_norm": 0.474,
+}
+
+
+def _doc(*shapes: dict) -> SlideDoc:
+    return SlideDoc.model_validate(
+        {
+            "slide": {
+                "index": 1,
+                "size": {"width_emu": 9144000, "height_emu": 5143500},
+                "shapes": list(shapes),
+            }
+        }
+    )
+
+
+def test_mapping_access_returns_nested_models() -> None:
+    axes = ChartAxes(value=ValueAxis(title="Units", min=0.0))
+    assert "value" in axes and "bogus" not in axes
+    assert isinstance(axes["value"], ValueAxis)
+    assert axes.get("value").get("min") == 0.0
+    assert axes.get("bogus", 1) == 1
+    assert dict(axes.items())["category"] is None
+    assert list(axes.keys()) == ["category", "value"]
+
+
+def test_assemble_applies_series_point_and_fill_colors(tmp_path: Path) -> None:
+    chart = {
+        "type": "column",
+        "categories": ["A", "B"],
+        "series": [
+            {
+                "name": "S1",
+                "values": [1, 2],
+                "color": {"resolved_rgb": "#1F4E79"},
+                "points": [{"idx": 1, "color": {"resolved_rgb": "#C00000"}}],
+            }
+        ],
+    }
+    basic = {
+        "id": "b1",
+        "kind": "shape_basic",
+        "bbox": _BBOX,
+        "z": 1,
+        "geom": "rect",
+        "style": {"fill": {"color": Color(resolved_rgb="#70AD47").model_dump()}},
+    }
+    out = tmp_path / "out.pptx"
+    DeckAssembler().assemble(
+        [_doc({"id": "c1", "kind": "chart", "bbox": _BBOX, "z": 0, "chart": chart}, basic)],
+        out=out,
+    )
+
+    from pptx import Presentation
+
+    shapes = Presentation(str(out)).slides[0].shapes
+    series = shapes[0].chart.plots[0].series[0]
+    assert str(series.format.fill.fore_color.rgb) == "1F4E79"
+    assert str(series.points[1].format.fill.fore_color.rgb) == "C00000"
+    assert str(shapes[1].fill.fore_color.rgb) == "70AD47"
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from deckdown.assemble import DeckAssembler
+from deckdown.ast import SlideDoc
+
+PNG_1PX = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAASUVORK5CYII="
+)
+
+
+def _picture_doc(index: int, data_url: str | None = None, *, ref: str | None = None) -> SlideDoc:
+    media = {"data_url": data_url} if data_url is not None else {"ref": ref}
+    return SlideDoc.model_validate(
+        {
+            "slide": {
+                "index": index,
+                "size": {"width_emu": 9144000, "height_emu": 5143500},
+                "shapes": [
+                    {
+                        "id": "s1",
+                        "kind": "picture",
+                        "bbox": {
+                            "x_emu": 0,
+                            "y_emu": 0,
+                            "w_emu": 914400,
+                            "h_emu": 914400,
+                            "x_norm": 0.0,
+                            "y_norm": 0.0,
+                            "w_norm": 0.1,
+                            "h_norm": 0.178,
+                        },
+                        "z": 0,
+                        "image": {"media": media},
+                    }
+                ],
+            }
+        }
+    )
+
+
+def test_repeated_picture_reuses_one_image_part(tmp_path: Path) -> None:
+    url = "data:image/png;base64," + PNG_1PX
+    # distinct but equal strings, as produced by parsing separate JSON blocks
+    docs = [_picture_doc(i, url[:-1] + url[-1]) for i in range(1, 4)]
+    out = tmp_path / "out.pptx"
+
+    DeckAssembler().assemble(docs, out=out)
+
+    from pptx import Presentation
+
+    prs = Presentation(str(out))
+    parts = {
+        sh.part.related_part(sh._element.blip_rId).partname
+        for slide in prs.slides
+        for sh in slide.shapes
+    }
+    assert [len(s.shapes) for s in prs.slides] == [1, 1, 1]
+    assert len(parts) == 1
+
+
+def test_ref_pictures_are_read_from_asset_root(tmp_path: Path) -> None:
+    import base64
+
+    assets = tmp_path / "deck_assets"
+    assets.mkdir()
+    (assets / "a.png").write_bytes(base64.b64decode(PNG_1PX))
+    docs = [
+        _picture_doc(1, ref="deck_assets/a.png"),
+        _picture_doc(2, ref="deck_assets/a.png"),
+        _picture_doc(3, ref="deck_assets/missing.png"),
+        _picture_doc(4, ref="../outside.png"),
+    ]
+    (tmp_path.parent / "outside.png").write_bytes(base64.b64decode(PNG_1PX))
+    out = tmp_path / "out.pptx"
+
+    DeckAssembler(asset_root=tmp_path).assemble(docs, out=out)
+
+    from pptx import Presentation
+
+    prs = Presentation(str(out))
+    # missing files and refs escaping the asset root are skipped
+    assert [len(s.shapes) for s in prs.slides] == [1, 1, 0, 0]
+    parts = {
+        sh.part.related_part(sh._element.blip_rId).partname
+        for slide in prs.slides
+        for sh in slide.shapes
+    }
+    assert len(parts) == 1
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from deckdown.batch import BatchExtractor, available_cpus, collect_inputs
+from deckdown.cli import EXIT_BATCH_FAILED, EXIT_OK, main
+
+
+def _write_deck(path: Path, *, slides: int = 1) -> None:
+    from pptx import Presentation
+
+    prs = Presentation()
+    for i in range(slides):
+        s = prs.slides.add_slide(prs.slide_layouts[1])
+        s.shapes.title.text = f"Slide {i + 1}"
+        s.placeholders[1].text_frame.text = f"Body {i + 1}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(str(path))
+
+
+def test_collect_inputs_directory_glob_and_manifest(tmp_path: Path) -> None:
+    a = tmp_path / "decks" / "a.pptx"
+    b = tmp_path / "decks" / "nested" / "b.pptx"
+    c = tmp_path / "other" / "c.pptx"
+    for p in (a, b, c):
+        _write_deck(p)
+    (tmp_path / "decks" / "notes.txt").write_text("ignored", encoding="utf-8")
+    manifest = tmp_path / "list.txt"
+    manifest.write_text("# comment\nother/c.pptx\n\ndecks/a.pptx\n", encoding="utf-8")
+
+    assert collect_inputs([tmp_path / "decks"]) == [a, b]
+    assert collect_inputs([str(tmp_path / "other" / "*.pptx")]) == [c]
+    # manifest entries are relative to the manifest; duplicates are dropped
+    assert collect_inputs([manifest, a]) == [c, a]
+
+
+def test_available_cpus_honours_cgroup_quota(tmp_path: Path) -> None:
+    (tmp_path / "cpu.max").write_text("150000 100000\n", encoding="utf-8")
+    assert available_cpus(tmp_path) == min(2, available_cpus(tmp_path / "missing"))
+
+    (tmp_path / "cpu.max").write_text("max 100000\n", encoding="utf-8")
+    assert available_cpus(tmp_path) == available_cpus(tmp_path / "missing")
+
+
+def test_plan_orders_largest_first_and_rejects_collisions(tmp_path: Path) -> None:
+    small = tmp_path / "small.pptx"
+    large = tmp_path / "large.pptx"
+    _write_deck(small, slides=1)
+    _write_deck(large, slides=20)
+
+    plan = BatchExtractor(out_dir=tmp_path / "md").plan([small, large])
+    assert [j.input_path for j in plan] == [large, small]
+    assert plan[0].output_path == tmp_path / "md" / "large.md"
+
+    dup = tmp_path / "sub" / "small.pptx"
+    _write_deck(dup)
+    with pytest.raises(ValueError, match="collision"):
+        BatchExtractor(out_dir=tmp_path / "md").plan([small, dup])
+
+
+def test_extract_batch_matches_single_extract(tmp_path: Path) -> None:
+    decks = [tmp_path / "in" / f"d{i}.pptx" for i in range(3)]
+    for i, p in enumerate(decks):
+        _write_deck(p, slides=i + 1)
+
+    code = main(
+        ["extract-batch", str(tmp_path / "in"), "--out-dir", str(tmp_path / "md"), "--jobs", "2"]
+    )
+
+    assert code == EXIT_OK
+    for p in decks:
+        single = tmp_path / "single" / f"{p.stem}.md"
+        assert main(["extract", str(p), "--md-out", str(single)]) == EXIT_OK
+        assert (tmp_path / "md" / f"{p.stem}.md").read_text(encoding="utf-8") == single.read_text(
+            encoding="utf-8"
+        )
+
+
+def test_extract_batch_reports_failures(tmp_path: Path) -> None:
+    good = tmp_path / "good.pptx"
+    bad = tmp_path / "bad.pptx"
+    _write_deck(good)
+    bad.write_bytes(b"not a zip")
+
+    code = main(
+        ["extract-batch", str(good), str(bad), "--out-dir", str(tmp_path / "md"), "--jobs", "1"]
+    )
+
+    assert code == EXIT_BATCH_FAILED
+    assert (tmp_path / "md" / "good.md").exists()
+    assert not (tmp_path / "md" / "bad.md").exists()
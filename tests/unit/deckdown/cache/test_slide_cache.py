@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import base64
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from deckdown.cache import SlideCache
+from deckdown.pipeline import extract_markdown
+
+PNG_1PX = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAASUVORK5CYII="
+)
+
+
+def _make_deck(path: Path, *, titles: list[str]) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    img = path.with_suffix(".png")
+    img.write_bytes(base64.b64decode(PNG_1PX))
+    prs = Presentation()
+    for title in titles:
+        s = prs.slides.add_slide(prs.slide_layouts[5])
+        s.shapes.title.text = title
+        s.shapes.add_picture(str(img), Inches(1), Inches(2), Inches(1), Inches(1))
+    prs.save(str(path))
+
+
+def test_unchanged_slides_are_spliced_from_cache(tmp_path: Path) -> None:
+    pptx = tmp_path / "deck.pptx"
+    out = tmp_path / "deck.md"
+    _make_deck(pptx, titles=["A", "B", "C"])
+
+    first = SlideCache(tmp_path / "cache")
+    text = extract_markdown(pptx, output_path=out, cache=first)
+    assert (first.hits, first.misses) == (0, 3)
+
+    again = SlideCache(tmp_path / "cache")
+    assert extract_markdown(pptx, output_path=out, cache=again) == text
+    assert (again.hits, again.misses) == (3, 0)
+
+    # one edited slide is walked again; the others come from the cache
+    _make_deck(pptx, titles=["A", "B2", "C"])
+    edited = SlideCache(tmp_path / "cache")
+    text = extract_markdown(pptx, output_path=out, cache=edited)
+    assert (edited.hits, edited.misses) == (2, 1)
+    assert text == extract_markdown(pptx, output_path=out)
+
+
+@pytest.mark.parametrize("mode", ["shared", "refs"])
+def test_cached_media_matches_fresh_extraction(tmp_path: Path, mode: str) -> None:
+    pptx = tmp_path / "deck.pptx"
+    out = tmp_path / "md" / "deck.md"
+    _make_deck(pptx, titles=["A", "B"])
+    fresh = extract_markdown(pptx, output_path=out, media_mode=mode)
+    extract_markdown(pptx, output_path=out, media_mode=mode, cache=SlideCache(tmp_path / "c"))
+    if mode == "refs":
+        # assets removed since the entries were written: the first slide is rebuilt
+        # (rewriting the shared image) and the second one can then be reused
+        shutil.rmtree(tmp_path / "md" / "deck_assets")
+
+    cache = SlideCache(tmp_path / "c")
+    assert extract_markdown(pptx, output_path=out, media_mode=mode, cache=cache) == fresh
+    if mode == "refs":
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(list((tmp_path / "md" / "deck_assets").iterdir())) == 1
+    else:
+        assert cache.hits == 2
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = SlideCache(tmp_path, max_bytes=250)
+    for i, key in enumerate(["aa01", "bb02", "cc03"]):
+        path = tmp_path / key[:2] / f"{key}.json"
+        path.parent.mkdir()
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 + i, 1000 + i))
+
+    assert cache.prune() == 1
+    assert sorted(p.stem for p in tmp_path.glob("*/*.json")) == ["bb02", "cc03"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import json
 from pathlib import Path
 
 from deckdown.cli import EXIT_INPUT_ERROR, EXIT_OK, main
@@ -109,3 +110,125 @@ class TestCLIExtract:
         text = out.read_text(encoding="utf-8")
         assert '"ref": "deck_assets/' in text
         assert '"data_url": null' in text
+        # assemble reads the referenced file relative to the Markdown
+        pptx_out = tmp_path / "round.pptx"
+        assert main(["assemble", str(out), "-o", str(pptx_out)]) == EXIT_OK
+        from pptx import Presentation
+
+        rebuilt = Presentation(str(pptx_out))
+        assert sum(len(s.shapes) for s in rebuilt.slides) == 1
+
+    def test_embed_media_shared_emits_each_image_once(self, tmp_path: Path) -> None:
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        from deckdown.reader import MarkdownReader
+
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(base64.b64decode(self.SAMPLE_PNG))
+        prs = Presentation()
+        for _ in range(3):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_picture(str(image_path), Inches(1), Inches(1), Inches(2), Inches(2))
+        pptx = tmp_path / "logos.pptx"
+        prs.save(str(pptx))
+        out = tmp_path / "deck.md"
+
+        code = main(["extract", str(pptx), "--md-out", str(out), "--embed-media", "shared"])
+
+        assert code == EXIT_OK
+        text = out.read_text(encoding="utf-8")
+        assert text.count("```json deckdown-media") == 1
+        assert text.count("data:image/png;base64,") == 1
+        assert text.count('"ref": "media:') == 3
+        docs = MarkdownReader().load_file(out)
+        urls = {d.slide.shapes[0].image.media.data_url for d in docs}
+        assert len(urls) == 1 and urls.pop().startswith("data:image/png;base64,")
+        # preview and assemble resolve the shared entries
+        html_out = tmp_path / "p.html"
+        assert main(["preview", str(out), "-o", str(html_out)]) == EXIT_OK
+        assert html_out.read_text(encoding="utf-8").count("data:image/png;base64,") == 3
+        pptx_out = tmp_path / "round.pptx"
+        assert main(["assemble", str(out), "-o", str(pptx_out)]) == EXIT_OK
+        rebuilt = Presentation(str(pptx_out))
+        assert [len(s.shapes) for s in rebuilt.slides] == [1, 1, 1]
+
+    def test_format_jsonl_writes_indexed_lines(self, tmp_path: Path) -> None:
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        from deckdown.reader import JsonlReader
+
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(base64.b64decode(self.SAMPLE_PNG))
+        prs = Presentation()
+        for _ in range(3):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_picture(str(image_path), Inches(1), Inches(1), Inches(2), Inches(2))
+        pptx = tmp_path / "logos.pptx"
+        prs.save(str(pptx))
+
+        code = main(["extract", str(pptx), "--format", "jsonl", "--embed-media", "shared"])
+
+        assert code == EXIT_OK
+        out = tmp_path / "logos.jsonl"
+        assert (tmp_path / "logos.jsonl.idx").exists()
+        # one media-table record, then one line per slide
+        assert len(out.read_text(encoding="utf-8").splitlines()) == 4
+        with JsonlReader().open(out) as deck:
+            doc = deck.slide(3)
+        assert doc.slide.index == 3
+        assert doc.slide.shapes[0].image.media.data_url.startswith("data:image/png;base64,")
+
+    def test_trace_records_phases_and_handlers(self, tmp_path: Path) -> None:
+        pptx = tmp_path / "pic.pptx"
+        self._write_picture_pptx(pptx)
+        trace_path = tmp_path / "trace.json"
+
+        code = main(["extract", str(pptx), "--trace", str(trace_path)])
+
+        assert code == EXIT_OK
+        events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+        names = {(e.get("cat"), e["name"]) for e in events}
+        assert {("phase", "extract"), ("phase", "load"), ("phase", "walk")} <= names
+        assert ("handler", "PictureShapeHandler") in names
+
+    def test_metrics_counts_shapes_handlers_and_media(self, tmp_path: Path) -> None:
+        pptx = tmp_path / "pic.pptx"
+        self._write_picture_pptx(pptx)
+        metrics_path = tmp_path / "metrics.json"
+
+        code = main(["extract", str(pptx), "--metrics", str(metrics_path)])
+
+        assert code == EXIT_OK
+        data = json.loads(metrics_path.read_text(encoding="utf-8"))
+        assert data["format"] == "deckdown-metrics-1"
+        assert data["counts"]["extract.picture"] == 1
+        assert data["handlers"]["PictureShapeHandler"]["calls"] == 1
+        assert data["media_bytes"]["extract"] == len(base64.b64decode(self.SAMPLE_PNG))
+
+    def test_metrics_report_no_suppressed_exceptions_for_a_plain_deck(self, tmp_path: Path) -> None:
+        from pptx import Presentation
+        from pptx.chart.data import CategoryChartData
+        from pptx.enum.chart import XL_CHART_TYPE
+        from pptx.enum.shapes import MSO_SHAPE
+        from pptx.util import Inches
+
+        pptx = tmp_path / "plain.pptx"
+        prs = Presentation()
+        shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        shapes.add_textbox(Inches(1), Inches(1), Inches(3), Inches(1)).text = "no alignment"
+        shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1), Inches(2), Inches(1), Inches(1))
+        data = CategoryChartData()
+        data.categories = ["a", "b"]
+        data.add_series("share", (60, 40))
+        shapes.add_chart(XL_CHART_TYPE.PIE, Inches(5), Inches(1), Inches(3), Inches(3), data)
+        prs.save(str(pptx))
+        metrics_path = tmp_path / "metrics.json"
+
+        code = main(["extract", str(pptx), "--metrics", str(metrics_path)])
+
+        assert code == EXIT_OK
+        data_out = json.loads(metrics_path.read_text(encoding="utf-8"))
+        assert data_out["counts"]["extract.chart"] == 1
+        assert data_out["suppressed"] == {}
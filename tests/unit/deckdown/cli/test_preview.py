@@ -3,7 +3,7 @@ from __future__ import annotations
 import base64
 from pathlib import Path
 
-from deckdown.cli import EXIT_OK, main
+from deckdown.cli import EXIT_OK, EXIT_USAGE, main
 
 SAMPLE_PNG = (
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAASUVORK5CYII="
@@ -39,3 +39,22 @@ def test_preview_inlines_referenced_picture(tmp_path: Path) -> None:
     assert code == EXIT_OK
     html = out.read_text(encoding="utf-8")
     assert "data:image/png;base64" in html
+
+
+def test_preview_and_assemble_honour_slides(tmp_path: Path) -> None:
+    from pptx import Presentation
+
+    block = (
+        '```json\n{{"version": "deckdown-1", "slide": {{"index": {idx}, '
+        '"size": {{"width_emu": 9144000, "height_emu": 5143500}}, "shapes": []}}}}\n```\n'
+    )
+    md = tmp_path / "deck.md"
+    md.write_text("# t\n\n" + "".join(block.format(idx=i) for i in range(1, 7)), encoding="utf-8")
+
+    html_out = tmp_path / "preview.html"
+    assert main(["preview", str(md), "-o", str(html_out), "--slides", "2,5-6"]) == EXIT_OK
+    assert html_out.read_text(encoding="utf-8").count('class="slide"') == 3
+    pptx_out = tmp_path / "out.pptx"
+    assert main(["assemble", str(md), "-o", str(pptx_out), "--slides", "1-2"]) == EXIT_OK
+    assert len(Presentation(str(pptx_out)).slides) == 2
+    assert main(["preview", str(md), "-o", str(html_out), "--slides", "3-1"]) == EXIT_USAGE
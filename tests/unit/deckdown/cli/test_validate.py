@@ -16,3 +16,43 @@ def test_validate_ok(tmp_path: Path) -> None:
     code = main(["validate", str(md)])
     # Assert
     assert code == EXIT_OK
+
+
+def test_validate_slides_uses_index_and_skips_unselected(tmp_path: Path) -> None:
+    block = (
+        '```json\n{{"version": "deckdown-1", "slide": {{"index": {idx}, '
+        '"size": {{"width_emu": 1, "height_emu": 1}}, "shapes": {shapes}}}}}\n```\n'
+    )
+    md = tmp_path / "deck.md"
+    # slide 2 fails schema validation (shapes must be a list)
+    md.write_text(
+        "# t\n\n" + block.format(idx=1, shapes="[]") + block.format(idx=2, shapes='"x"'),
+        encoding="utf-8",
+    )
+
+    assert main(["index", str(md)]) == EXIT_OK
+    assert (tmp_path / "deck.md.idx").exists()
+    assert main(["validate", str(md), "--slides", "1"]) == EXIT_OK
+    assert main(["validate", str(md), "--slides", "2"]) != EXIT_OK
+    assert main(["validate", str(md)]) != EXIT_OK
+
+
+def test_validate_many_inputs_in_parallel_with_cache(tmp_path: Path, capsys) -> None:  # noqa: ANN001
+    block = (
+        '```json\n{{"version": "deckdown-1", "slide": {{"index": {idx}, '
+        '"size": {{"width_emu": 1, "height_emu": 1}}, "shapes": []}}}}\n```\n'
+    )
+    decks = []
+    for n in range(3):
+        md = tmp_path / f"deck{n}.md"
+        md.write_text(
+            "# t\n\n" + "".join(block.format(idx=i) for i in range(1, 5)), encoding="utf-8"
+        )
+        decks.append(str(md))
+    cache_dir = tmp_path / "vcache"
+
+    args = ["validate", *decks, "--jobs", "2", "--fail-fast", "--cache-dir", str(cache_dir)]
+    assert main(args) == EXIT_OK
+    assert len((cache_dir / "validated.txt").read_text(encoding="utf-8").split()) == 4
+    assert main(["validate", *decks, "--jobs", "0"]) != EXIT_OK
+    assert capsys.readouterr().err.strip().endswith("--jobs must be >= 1")
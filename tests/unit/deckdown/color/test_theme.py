@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from deckdown.ast import SlideSize
+from deckdown.color.theme import ThemeResolver
+from deckdown.extractors.context import ExtractContext
+from deckdown.metrics import collecting
+
+
+def _theme_xml(accent1: str) -> bytes:
+    return (
+        '<a:theme xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        '<a:themeElements><a:clrScheme name="t">'
+        '<a:dk1><a:sysClr val="windowText" lastClr="000000"/></a:dk1>'
+        f'<a:accent1><a:srgbClr val="{accent1}"/></a:accent1>'
+        "</a:clrScheme></a:themeElements></a:theme>"
+    ).encode()
+
+
+class FakeMasterPart:
+    def __init__(self, partname: str, theme_xml: bytes) -> None:
+        self.partname = partname
+        self._theme = SimpleNamespace(blob=theme_xml)
+        self.theme_reads = 0
+
+    def part_related_by(self, reltype: str) -> SimpleNamespace:
+        self.theme_reads += 1
+        return self._theme
+
+
+def _slide(master_part: FakeMasterPart) -> SimpleNamespace:
+    master = SimpleNamespace(part=master_part)
+    return SimpleNamespace(slide_layout=SimpleNamespace(slide_master=master))
+
+
+def test_theme_xml_parsed_once_per_digest() -> None:
+    a = ThemeResolver.from_theme_xml(_theme_xml("112233"))
+    b = ThemeResolver.from_theme_xml(_theme_xml("112233"))
+    assert a is b
+    assert a.scheme == {"dk1": "#000000", "accent1": "#112233"}
+    assert ThemeResolver.from_theme_xml(_theme_xml("445566")) is not a
+
+
+def test_for_slide_resolves_each_master_theme_once() -> None:
+    first = FakeMasterPart("/ppt/slideMasters/slideMaster1.xml", _theme_xml("AA0000"))
+    second = FakeMasterPart("/ppt/slideMasters/slideMaster2.xml", _theme_xml("00AA00"))
+    deck_theme = ThemeResolver.from_theme_xml(_theme_xml("AA0000"))
+    ctx = ExtractContext(size=SlideSize(width_emu=1, height_emu=1), theme=deck_theme)
+
+    assert ctx.for_slide(_slide(first)) is ctx
+    other = ctx.for_slide(_slide(second))
+    assert other.theme.scheme["accent1"] == "#00AA00"
+    assert other.media_cache is ctx.media_cache
+    ctx.for_slide(_slide(second))
+    assert (first.theme_reads, second.theme_reads) == (1, 1)
+
+
+def _clr(xml: str):  # noqa: ANN202
+    from lxml import etree
+
+    ns = ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    return etree.fromstring(xml.replace(" ", ns, 1))
+
+
+def test_scheme_color_modifiers_applied() -> None:
+    theme = ThemeResolver({"accent1": "#4F81BD", "lt1": "#FFFFFF"})
+
+    darker = theme.color_from_xml(
+        _clr('<a:schemeClr val="accent1"><a:lumMod val="75000"/></a:schemeClr>')
+    )
+    assert darker.resolved_rgb == "#376092"
+    assert darker.theme_ref.key == "accent1" and darker.theme_ref.tint == -0.25
+
+    lighter = theme.color_from_xml(
+        _clr(
+            '<a:schemeClr val="accent1"><a:lumMod val="60000"/><a:lumOff val="40000"/></a:schemeClr>'
+        )
+    )
+    assert lighter.resolved_rgb == "#95B3D7"
+
+    bg = theme.color_from_xml(_clr('<a:schemeClr val="bg1"><a:lumMod val="85000"/></a:schemeClr>'))
+    assert bg.resolved_rgb == "#D9D9D9" and bg.theme_ref.key == "lt1"
+
+    tinted = theme.color_from_xml(_clr('<a:srgbClr val="FF0000"><a:tint val="50000"/></a:srgbClr>'))
+    assert tinted.resolved_rgb == "#FF8080" and tinted.theme_ref is None
+    shaded = theme.color_from_xml(
+        _clr('<a:srgbClr val="FF0000"><a:shade val="50000"/><a:alpha val="25000"/></a:srgbClr>')
+    )
+    assert shaded.resolved_rgb == "#800000" and shaded.alpha == 0.25
+
+
+def test_system_color_resolves_from_last_color() -> None:
+    theme = ThemeResolver({"accent1": "#4F81BD"})
+
+    with collecting() as registry:
+        window = theme.color_from_xml(
+            _clr('<a:sysClr val="window" lastClr="FFFFFF"><a:lumMod val="85000"/></a:sysClr>')
+        )
+        text = theme.color_from_xml(_clr('<a:sysClr val="windowText" lastClr="000000"/>'))
+
+    assert window.resolved_rgb == "#D9D9D9" and window.theme_ref is None
+    assert text.resolved_rgb == "#000000"
+    assert registry.suppressed == {}
+
+
+def test_color_resolution_memoized_and_interned() -> None:
+    theme = ThemeResolver({"accent1": "#FF0000"})
+    scheme = theme.color_from_xml(_clr('<a:schemeClr val="accent1"/>'))
+    again = theme.color_from_xml(_clr('<a:schemeClr val="accent1"/>'))
+    srgb = theme.color_from_xml(_clr('<a:srgbClr val="FF0000"/>'))
+    same_rgb = theme.color_from_xml(_clr('<a:srgbClr val="ff0000"/>'))
+
+    assert again is scheme
+    assert same_rgb is srgb
+    assert scheme is not srgb
+    assert theme.color_from_xml(_clr('<a:schemeClr val="accent6"/>')) is None
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from deckdown.ast import GroupShape
+from deckdown.decode import decode_slide, json_error
+from deckdown.styles import StyleTable
+
+_BBOX = {
+    "x_emu": 0,
+    "y_emu": 0,
+    "w_emu": 1,
+    "h_emu": 1,
+    "x_norm": 0,
+    "y_norm": 0,
+    "w_norm": 0.1,
+    "h_norm": 0.1,
+}
+
+
+def _block(shapes: list[dict], **extra: object) -> str:
+    slide = {"index": 1, "size": {"width_emu": 10, "height_emu": 10}, "shapes": shapes, **extra}
+    return json.dumps({"version": "deckdown-1", "slide": slide})
+
+
+def test_shapes_are_validated_by_their_kind_tag() -> None:
+    shape = {"id": "g", "kind": "group", "bbox": _BBOX, "z": 0, "children": []}
+
+    doc = decode_slide(_block([shape]).encode("utf-8"))
+
+    assert isinstance(doc.slide.shapes[0], GroupShape)
+    with pytest.raises(ValidationError) as info:
+        decode_slide(_block([{**shape, "children": "x"}]))
+    # only the tagged class is tried, so the error names the group field alone
+    assert [e["loc"][-2:] for e in info.value.errors()] == [("group", "children")]
+    assert not json_error(info.value)
+
+
+def test_invalid_json_is_reported_as_such() -> None:
+    with pytest.raises(ValidationError) as info:
+        decode_slide('{"version": "deckdown-1", "slide": ')
+    assert json_error(info.value)
+
+
+def test_style_references_are_expanded_before_validation() -> None:
+    styles = StyleTable()
+    key = styles.add_font({"bold": True})
+    run = {"text": "hi", "style": key}
+    text = {"id": "t", "kind": "text_box", "bbox": _BBOX, "z": 0}
+    text["text"] = {"paras": [{"runs": [run]}]}
+
+    doc = decode_slide(_block([text]), styles=styles)
+
+    decoded = doc.slide.shapes[0].text.paras[0].runs[0]
+    assert decoded.style == key and decoded.font is not None and decoded.font.bold
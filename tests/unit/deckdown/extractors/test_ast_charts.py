@@ -46,3 +46,63 @@ def test_ast_charts_basic(tmp_path: Path) -> None:
         assert isinstance(ch.plot_area.has_legend, bool)
         if ch.plot_area.has_legend:
             assert ch.plot_area.legend_pos in {None, "right", "left", "top", "bottom"}
+
+
+def test_chart_series_read_from_xml_caches(tmp_path: Path) -> None:
+    import copy
+
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+
+    p = tmp_path / "combo.pptx"
+    prs = Presentation()
+    s = prs.slides.add_slide(prs.slide_layouts[6])
+    data = CategoryChartData()
+    data.categories = ["A", "B", "C"]
+    data.add_series("S1", (1, 2, 3))
+    ch = s.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(1), Inches(4), Inches(3), data
+    ).chart
+    pt = ch.plots[0].series[0].points[2]
+    pt.format.fill.solid()
+    pt.format.fill.fore_color.rgb = RGBColor(0xAA, 0x00, 0x00)
+    # Second plot in the same plot area, and a blank cell in the first series.
+    bar_chart = ch.plots[0]._element
+    bar_chart.addnext(copy.deepcopy(bar_chart))
+    gap = bar_chart.xpath("./c:ser/c:val//c:pt[@idx='1']")[0]
+    gap.getparent().remove(gap)
+    prs.save(str(p))
+
+    docs = AstExtractor().extract(Loader(str(p)).presentation())
+    chart = docs[1].slide.shapes[0].chart
+    assert chart.categories == ("A", "B", "C")
+    assert len(chart.series) == 2
+    assert chart.series[0].values == (1.0, None, 3.0)
+    assert chart.series[1].values == (1.0, 2.0, 3.0)
+    assert [(p.idx, p.color.resolved_rgb) for p in chart.series[0].points] == [(2, "#AA0000")]
+
+
+def test_chart_cache_sizes_are_bounded() -> None:
+    from pptx.oxml import parse_xml
+
+    from deckdown.extractors.handlers.chart_handler import _MAX_POINTS, ChartShapeHandler
+
+    val = parse_xml(
+        '<c:val xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart">'
+        "<c:numRef><c:numCache>"
+        '<c:ptCount val="4000000000"/>'
+        '<c:pt idx="0"><c:v>1</c:v></c:pt>'
+        '<c:pt idx="-1"><c:v>2</c:v></c:pt>'
+        '<c:pt idx="99999999999"><c:v>3</c:v></c:pt>'
+        "</c:numCache></c:numRef></c:val>"
+    )
+
+    values = ChartShapeHandler._cache_points(val, numeric=True)
+
+    assert values is not None
+    assert len(values) == _MAX_POINTS
+    assert values[0] == 1.0
+    assert values[1:] == (None,) * (_MAX_POINTS - 1)
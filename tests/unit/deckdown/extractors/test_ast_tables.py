@@ -79,3 +79,25 @@ def test_ast_tables(tmp_path: Path) -> None:
     # The top-left cell should have rowspan >= 2
     top_left = next(c for c in tbl2.table.cells if c.r == 0 and c.c == 0)
     assert top_left.rowspan >= 2
+
+
+def test_ast_tables_block_merge(tmp_path: Path) -> None:
+    from pptx import Presentation
+
+    p = tmp_path / "block.pptx"
+    prs = Presentation()
+    s = prs.slides.add_slide(prs.slide_layouts[6])
+    tbl = s.shapes.add_table(3, 3, 914400, 914400, 914400, 914400).table
+    for r in range(3):
+        for c in range(3):
+            tbl.cell(r, c).text = f"{r}{c}"
+    tbl.cell(1, 1).merge(tbl.cell(2, 2))
+    prs.save(str(p))
+
+    docs = AstExtractor().extract(Loader(str(p)).presentation())
+
+    t = docs[1].slide.shapes[0].table
+    assert [(c.r, c.c) for c in t.cells] == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (2, 0)]
+    merged = next(c for c in t.cells if (c.r, c.c) == (1, 1))
+    assert (merged.rowspan, merged.colspan) == (2, 2)
+    assert merged.text.paras[0].runs[0].text == "11"
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from deckdown.ast import Shape
+from deckdown.extractors import registry as registry_mod
+from deckdown.extractors.ast import AstExtractor
+from deckdown.extractors.context import ExtractContext
+from deckdown.extractors.handlers.base import ShapeHandler
+from deckdown.extractors.handlers.picture_handler import PictureShapeHandler
+from deckdown.extractors.handlers.table_handler import TableShapeHandler
+from deckdown.extractors.handlers.text_handler import TextShapeHandler
+from deckdown.extractors.registry import HandlerRegistry, plugin_handlers
+
+
+class CountingShape:
+    """Counts `shape_type` reads, which python-pptx recomputes from XML each time."""
+
+    has_chart = False
+    has_table = False
+    has_text_frame = True
+
+    def __init__(self, shape_type: MSO_SHAPE_TYPE | None) -> None:
+        self._shape_type = shape_type
+        self.reads = 0
+
+    @property
+    def shape_type(self) -> MSO_SHAPE_TYPE | None:
+        self.reads += 1
+        return self._shape_type
+
+
+class FreeformHandler(ShapeHandler):
+    shape_types = frozenset({MSO_SHAPE_TYPE.FREEFORM})
+
+    def supports(self, shape: Any) -> bool:  # noqa: ANN401
+        return getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.FREEFORM
+
+    def build(self, shape: Any, *, z: int, ctx: ExtractContext) -> Shape | None:  # noqa: ANN401
+        return None
+
+
+@dataclass
+class FakeEntryPoint:
+    name: str
+    target: Any
+
+    @property
+    def value(self) -> str:
+        return f"fake:{self.name}"
+
+    def load(self) -> Any:  # noqa: ANN401
+        if isinstance(self.target, Exception):
+            raise self.target
+        return self.target
+
+
+@pytest.fixture()
+def installed(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[FakeEntryPoint]]:
+    eps: list[FakeEntryPoint] = []
+    monkeypatch.setattr(registry_mod, "entry_points", lambda group: list(eps))
+    plugin_handlers.cache_clear()
+    yield eps
+    plugin_handlers.cache_clear()
+
+
+def test_builtin_handlers_read_shape_type_once() -> None:
+    walker = AstExtractor().walker()
+    registry = HandlerRegistry(walker.registry.handlers, plugins=False)
+    for shape_type, expected in (
+        (MSO_SHAPE_TYPE.TEXT_BOX, TextShapeHandler),
+        (MSO_SHAPE_TYPE.PICTURE, PictureShapeHandler),
+        (MSO_SHAPE_TYPE.TABLE, None),  # no table part: not a table, not text
+    ):
+        shape = CountingShape(shape_type)
+        handler = registry.handler_for(shape, shape.shape_type)
+        assert (type(handler) if handler else None) is expected
+        assert shape.reads == 1
+
+
+def test_candidates_are_filtered_by_shape_type() -> None:
+    registry = HandlerRegistry((TableShapeHandler(), TextShapeHandler()), plugins=False)
+
+    registry.handler_for(CountingShape(MSO_SHAPE_TYPE.TEXT_BOX), MSO_SHAPE_TYPE.TEXT_BOX)
+
+    assert [type(h) for h in registry._table[MSO_SHAPE_TYPE.TEXT_BOX]] == [TextShapeHandler]
+
+
+def test_plugins_load_lazily_and_take_priority(
+    installed: list[FakeEntryPoint], caplog: pytest.LogCaptureFixture
+) -> None:
+    installed += [
+        FakeEntryPoint("broken", ImportError("no module named 'x'")),
+        FakeEntryPoint("freeform", FreeformHandler),
+        FakeEntryPoint("wrong", object),
+    ]
+    registry = AstExtractor().walker().registry
+    assert registry._table == {}
+
+    with caplog.at_level(logging.WARNING):
+        freeform = CountingShape(MSO_SHAPE_TYPE.FREEFORM)
+        handler = registry.handler_for(freeform, freeform.shape_type)
+
+    assert isinstance(handler, FreeformHandler)
+    assert [type(h) for h in plugin_handlers()] == [FreeformHandler]
+    assert "handler plugin broken" in caplog.text
+    assert "handler plugin wrong" in caplog.text
+    text_box = registry.handler_for(CountingShape(None), MSO_SHAPE_TYPE.TEXT_BOX)
+    assert isinstance(text_box, TextShapeHandler)
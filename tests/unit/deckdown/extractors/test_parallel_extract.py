@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import base64
+from pathlib import Path
+
+from deckdown.cli import EXIT_OK, main
+from deckdown.extractors.parallel import partition_indices
+
+PNG_1PX = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAASUVORK5CYII="
+)
+
+
+def _make_mixed_deck(path: Path, *, slides: int) -> None:
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+
+    img = path.with_suffix(".png")
+    img.write_bytes(base64.b64decode(PNG_1PX))
+    prs = Presentation()
+    for i in range(slides):
+        s = prs.slides.add_slide(prs.slide_layouts[5])
+        s.shapes.title.text = f"Slide {i + 1}"
+        if i % 3 == 0:
+            t = s.shapes.add_table(2, 2, Inches(1), Inches(2), Inches(4), Inches(1)).table
+            t.cell(0, 0).text = f"r{i}"
+        elif i % 3 == 1:
+            data = CategoryChartData()
+            data.categories = ["A", "B"]
+            data.add_series("S", (i, i + 1))
+            s.shapes.add_chart(
+                XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(2), Inches(4), Inches(3), data
+            )
+        else:
+            s.shapes.add_picture(str(img), Inches(1), Inches(2), Inches(1), Inches(1))
+    prs.save(str(path))
+
+
+def test_partition_indices_covers_all_slides_in_order() -> None:
+    parts = partition_indices(10, 3)
+    assert parts == [(1, 2, 3, 4), (5, 6, 7), (8, 9, 10)]
+    assert partition_indices(2, 8) == [(1,), (2,)]
+    assert partition_indices(0, 4) == []
+
+
+def test_parallel_extract_matches_serial(tmp_path: Path) -> None:
+    pptx = tmp_path / "mixed.pptx"
+    _make_mixed_deck(pptx, slides=7)
+    serial = tmp_path / "serial.md"
+    parallel = tmp_path / "parallel.md"
+
+    assert main(["extract", str(pptx), "--md-out", str(serial)]) == EXIT_OK
+    assert main(["extract", str(pptx), "--md-out", str(parallel), "--jobs", "3"]) == EXIT_OK
+
+    assert parallel.read_text(encoding="utf-8") == serial.read_text(encoding="utf-8")
+
+
+def test_parallel_refs_mode_matches_serial(tmp_path: Path) -> None:
+    pptx = tmp_path / "mixed.pptx"
+    _make_mixed_deck(pptx, slides=9)
+    serial = tmp_path / "serial" / "deck.md"
+    parallel = tmp_path / "parallel" / "deck.md"
+
+    args = ["--embed-media", "refs"]
+    assert main(["extract", str(pptx), "--md-out", str(serial), *args]) == EXIT_OK
+    assert main(["extract", str(pptx), "--md-out", str(parallel), "--jobs", "2", *args]) == EXIT_OK
+
+    assert parallel.read_text(encoding="utf-8") == serial.read_text(encoding="utf-8")
+    # three picture slides share one image: a single content-addressed file
+    assert len(list((tmp_path / "parallel" / "deck_assets").iterdir())) == 1
+
+
+def test_parallel_shared_mode_matches_serial(tmp_path: Path) -> None:
+    pptx = tmp_path / "mixed.pptx"
+    _make_mixed_deck(pptx, slides=9)
+    serial = tmp_path / "serial.md"
+    parallel = tmp_path / "parallel.md"
+
+    args = ["--embed-media", "shared"]
+    assert main(["extract", str(pptx), "--md-out", str(serial), *args]) == EXIT_OK
+    assert main(["extract", str(pptx), "--md-out", str(parallel), "--jobs", "3", *args]) == EXIT_OK
+
+    text = parallel.read_text(encoding="utf-8")
+    assert text == serial.read_text(encoding="utf-8")
+    assert text.count("data:image/png;base64,") == 1
+
+
+def test_slides_selection_serial_and_parallel(tmp_path: Path) -> None:
+    from deckdown.reader import MarkdownReader
+
+    pptx = tmp_path / "mixed.pptx"
+    _make_mixed_deck(pptx, slides=9)
+    serial = tmp_path / "serial.md"
+    parallel = tmp_path / "parallel.md"
+
+    args = ["--slides", "2-3,8"]
+    assert main(["extract", str(pptx), "--md-out", str(serial), *args]) == EXIT_OK
+    assert main(["extract", str(pptx), "--md-out", str(parallel), "--jobs", "2", *args]) == EXIT_OK
+
+    assert parallel.read_text(encoding="utf-8") == serial.read_text(encoding="utf-8")
+    assert [d.slide.index for d in MarkdownReader().load_file(serial)] == [2, 3, 8]
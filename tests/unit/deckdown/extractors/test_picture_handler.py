@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import base64
+import os
+import stat
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -71,3 +73,30 @@ def test_picture_handler_refs_uses_asset_store(tmp_path: Path) -> None:
     ref_path = tmp_path / result.image.media.ref
     assert ref_path.exists()
     assert ref_path.suffix == ".png"
+
+
+def test_asset_store_dedupes_repeated_images(tmp_path: Path) -> None:
+    blob = base64.b64decode(PNG_1PX)
+    handler = PictureShapeHandler()
+    asset_store = AssetStore(tmp_path / "deck.md")
+    ctx = _context(media_mode="refs", asset_store=asset_store)
+
+    refs = {handler.build(_make_shape(blob), z=z, ctx=ctx).image.media.ref for z in range(5)}
+    other = asset_store.save_image(blob=blob + b"\x00", content_type="image/png")
+
+    assert len(refs) == 1
+    assert other not in refs
+    assert sorted(p.name for p in asset_store.assets_dir.iterdir()) == sorted(
+        Path(r).name for r in (*refs, other)
+    )
+
+
+def test_asset_store_writes_assets_with_umask_default_mode(tmp_path: Path) -> None:
+    asset_store = AssetStore(tmp_path / "deck.md")
+    old = os.umask(0o022)
+    try:
+        ref = asset_store.save_image(blob=base64.b64decode(PNG_1PX), content_type="image/png")
+    finally:
+        os.umask(old)
+
+    assert stat.S_IMODE((tmp_path / ref).stat().st_mode) == 0o644
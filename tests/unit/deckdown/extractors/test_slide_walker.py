@@ -13,6 +13,7 @@ from deckdown.extractors.handlers.chart_handler import ChartShapeHandler
 from deckdown.extractors.handlers.picture_handler import PictureShapeHandler
 from deckdown.extractors.handlers.table_handler import TableShapeHandler
 from deckdown.extractors.handlers.text_handler import TextShapeHandler
+from deckdown.extractors.registry import HandlerRegistry
 
 
 def _make_walker() -> SlideWalker:
@@ -24,7 +25,8 @@ def _make_walker() -> SlideWalker:
         BasicShapeHandler(),
         TextShapeHandler(),
     )
-    return SlideWalker(handlers=handlers, group_extractor=GroupExtractor(handlers=handlers))
+    registry = HandlerRegistry(handlers, plugins=False)
+    return SlideWalker(registry=registry, group_extractor=GroupExtractor(registry=registry))
 
 
 @pytest.fixture()
@@ -209,6 +211,9 @@ class FakeTable:
     def cell(self, r: int, c: int) -> FakeTableCell:
         return self._cells[r][c]
 
+    def iter_cells(self) -> list[FakeTableCell]:
+        return [cell for row in self._cells for cell in row]
+
 
 class FakeTableShape(FakeShapeBase):
     shape_type = MSO_SHAPE_TYPE.TABLE
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from deckdown.extractors.ast import AstExtractor
+from deckdown.extractors.summary import DeckSummarizer, title_shape_ids
+from deckdown.extractors.text import TextExtractor
+from deckdown.loader import Loader
+from deckdown.models import Table
+
+
+def _make_deck(path: Path) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    layout = prs.slide_layouts[1]
+    s1 = prs.slides.add_slide(layout)
+    s1.shapes.title.text = "Intro"
+    tf = s1.placeholders[1].text_frame
+    tf.text = "Welcome"
+    p = tf.add_paragraph()
+    p.text = "Item"
+    p = tf.add_paragraph()
+    p.text = "Sub"
+    p.level = 1
+    box = s1.shapes.add_textbox(Inches(1), Inches(0.2), Inches(2), Inches(1))
+    box.text_frame.text = "Above body"
+    dup = s1.shapes.add_textbox(Inches(1), Inches(6), Inches(2), Inches(1))
+    dup.text_frame.text = "Intro"
+
+    s2 = prs.slides.add_slide(prs.slide_layouts[5])
+    s2.shapes.title.text = "Tables"
+    t = s2.shapes.add_table(3, 2, Inches(1), Inches(2), Inches(4), Inches(2)).table
+    for r, row in enumerate((("H1", "H2"), ("A|A", "B"), ("C", ""))):
+        for c, val in enumerate(row):
+            t.cell(r, c).text = val
+
+    s3 = prs.slides.add_slide(prs.slide_layouts[6])
+    s3.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = "Closing"
+    prs.save(str(path))
+
+
+def test_summary_from_ast_matches_text_extractor(tmp_path: Path) -> None:
+    pptx = tmp_path / "deck.pptx"
+    _make_deck(pptx)
+    prs = Loader(str(pptx)).presentation()
+
+    legacy = TextExtractor().extract_deck(prs, source_path=str(pptx))
+    docs = AstExtractor().extract(prs)
+    derived = DeckSummarizer().summarize_presentation(prs, docs, source_path=str(pptx))
+
+    assert derived.title == legacy.title == "Intro"
+    for old, new in zip(legacy.slides, derived.slides):
+        assert (new.index, new.title, new.text_blocks, new.bullets) == (
+            old.index,
+            old.title,
+            old.text_blocks,
+            old.bullets,
+        )
+
+
+def test_summary_fills_tables_from_ast(tmp_path: Path) -> None:
+    pptx = tmp_path / "deck.pptx"
+    _make_deck(pptx)
+    prs = Loader(str(pptx)).presentation()
+
+    deck = DeckSummarizer().summarize_presentation(
+        prs, AstExtractor().extract(prs), source_path=str(pptx)
+    )
+
+    assert deck.slides[1].tables == (Table(rows=(("H1", "H2"), ("A|A", "B"), ("C", ""))),)
+    assert deck.slides[2].title is None
+
+
+def test_summary_keeps_soft_line_breaks(tmp_path: Path) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    pptx = tmp_path / "breaks.pptx"
+    src = Presentation()
+    slide = src.slides.add_slide(src.slide_layouts[6])
+    box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+    box.text_frame.paragraphs[0].text = "Hello\vWorld"
+    src.save(str(pptx))
+    prs = Loader(str(pptx)).presentation()
+
+    legacy = TextExtractor().extract_deck(prs, source_path=str(pptx))
+    derived = DeckSummarizer().summarize_presentation(
+        prs, AstExtractor().extract(prs), source_path=str(pptx)
+    )
+
+    assert derived.slides[0].text_blocks == legacy.slides[0].text_blocks
+    assert "Hello\vWorld" in derived.slides[0].text_blocks[0].text
+
+
+def test_slide_selection_leaves_unselected_shape_trees_untouched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pptx.slide import Slide
+
+    from deckdown.pipeline import extract_markdown
+    from deckdown.utils.slide_range import SlideRange
+
+    pptx = tmp_path / "deck.pptx"
+    _make_deck(pptx)
+    prs = Loader(str(pptx)).presentation()
+    assert title_shape_ids(prs, SlideRange.parse("2")) == {2: title_shape_ids(prs)[2]}
+
+    touched: set[int] = set()
+    shapes = Slide.__dict__["shapes"]
+
+    def spy(slide: Slide) -> object:
+        touched.add(slide.slide_id)
+        return shapes.__get__(slide, Slide)
+
+    monkeypatch.setattr(Slide, "shapes", property(spy))
+    ids = [s.slide_id for s in prs.slides]
+
+    markdown = extract_markdown(
+        pptx, output_path=tmp_path / "deck.md", slides=SlideRange.parse("2")
+    )
+
+    assert "Tables" in markdown
+    assert touched == {ids[1]}
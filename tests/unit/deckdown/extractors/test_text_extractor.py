@@ -85,6 +85,20 @@ class TestTextExtractor:
         )
         assert markdown == expected
 
+    def test_slide_selection(self, tmp_path: Path) -> None:
+        # Arrange
+        from deckdown.utils.slide_range import SlideRange
+
+        pptx = self._make_text_basic(tmp_path)
+        prs = Loader(str(pptx)).presentation()
+        # Act
+        deck = TextExtractor().extract_deck(
+            prs, source_path=str(pptx), slides=SlideRange.parse("1,3")
+        )
+        # Assert
+        assert [s.index for s in deck.slides] == [1, 3]
+        assert deck.title == "Intro"
+
     def test_skip_title_shape_only(self, tmp_path: Path) -> None:
         # Arrange: slide with only a title shape should produce no body/bullets
         from pptx import Presentation
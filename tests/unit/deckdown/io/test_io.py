@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 
 from deckdown.io import OutputManager
@@ -69,3 +71,52 @@ class TestOutputManager:
         # Assert
         assert dest.exists()
         assert dest.read_text(encoding="utf-8") == "hello"
+
+    def test_open_text_file_replaces_only_on_success(self, tmp_path: Path) -> None:
+        # Arrange
+        om = OutputManager()
+        dest = tmp_path / "nested" / "file.md"
+        om.write_text_file(dest, "old")
+        # Act
+        try:
+            with om.open_text_file(dest) as fh:
+                fh.write("partial")
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        # Assert: failed write leaves previous content and no temp files
+        assert dest.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in dest.parent.iterdir()] == ["file.md"]
+        # Act
+        with om.open_text_file(dest) as fh:
+            fh.write("new")
+        # Assert
+        assert dest.read_text(encoding="utf-8") == "new"
+
+
+class TestOpenTextFile:
+    def test_new_file_gets_umask_default_mode(self, tmp_path: Path) -> None:
+        # Arrange
+        out = tmp_path / "deck.md"
+        old = os.umask(0o022)
+        try:
+            # Act
+            with OutputManager().open_text_file(out) as fh:
+                fh.write("# deck\n")
+        finally:
+            os.umask(old)
+        # Assert
+        assert stat.S_IMODE(out.stat().st_mode) == 0o644
+        assert out.read_text(encoding="utf-8") == "# deck\n"
+
+    def test_replaced_file_keeps_its_mode(self, tmp_path: Path) -> None:
+        # Arrange
+        out = tmp_path / "deck.md"
+        out.write_text("old", encoding="utf-8")
+        out.chmod(0o640)
+        # Act
+        with OutputManager().open_text_file(out) as fh:
+            fh.write("new")
+        # Assert
+        assert stat.S_IMODE(out.stat().st_mode) == 0o640
+        assert out.read_text(encoding="utf-8") == "new"
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from deckdown import metrics
+from deckdown.metrics import (
+    HandlerStats,
+    Metrics,
+    aggregate,
+    collecting,
+    count,
+    measured,
+    merge_from_worker,
+    note_suppressed,
+    suppressing,
+    timed,
+)
+
+
+def test_helpers_are_no_ops_without_an_active_registry() -> None:
+    count("extract.text_box")
+    with timed("TextShapeHandler"), suppressing():
+        raise ValueError("swallowed")
+    assert metrics._ACTIVE is None
+
+
+def test_p95_survives_merging() -> None:
+    fast, slow = HandlerStats(), HandlerStats()
+    for _ in range(95):
+        fast.add(0.0001)
+    for _ in range(5):
+        slow.add(0.1)
+
+    fast.merge(slow)
+
+    assert fast.calls == 100
+    assert fast.max_s == pytest.approx(0.1)
+    # p95 is the upper edge of its bucket: within ~19% of the true value.
+    assert 0.0001 <= fast.p95() < 0.0001 * 2**0.25
+
+
+def test_suppressed_exceptions_are_counted_per_site() -> None:
+    def fallback() -> None:
+        try:
+            raise KeyError("x")
+        except Exception:
+            note_suppressed()
+
+    with collecting() as registry:
+        fallback()
+        fallback()
+        with suppressing():
+            raise ValueError("swallowed")
+
+    sites = registry.suppressed
+    assert sites.pop(next(s for s in sites if "fallback" in s)) == 2
+    assert list(sites.values()) == [1]
+    assert next(iter(sites)).startswith("test_metrics.test_suppressed_exceptions")
+
+
+def test_suppressing_lets_base_exceptions_through() -> None:
+    with pytest.raises(KeyboardInterrupt), suppressing():
+        raise KeyboardInterrupt
+
+
+def test_measured_and_timed_record_calls() -> None:
+    @measured
+    def work(n: int) -> int:
+        return n * 2
+
+    with collecting() as registry:
+        assert work(2) == 4
+        with timed("PictureShapeHandler"):
+            count("extract.picture")
+
+    assert registry.handlers[work.__qualname__].calls == 1
+    assert registry.handlers["PictureShapeHandler"].calls == 1
+    assert registry.counts == {"extract.picture": 1}
+
+
+def test_roundtrip_worker_merge_and_aggregate(tmp_path: Path) -> None:
+    with collecting(tmp_path / "a.json") as first:
+        count("extract.table", 2)
+        metrics.media_bytes("extract", 10)
+        with timed("TableShapeHandler"):
+            pass
+    with collecting(tmp_path / "b.json"):
+        merge_from_worker(first.to_dict())
+        merge_from_worker(None)
+
+    assert Metrics.from_dict(first.to_dict()).to_dict() == first.to_dict()
+    total = aggregate([tmp_path / "a.json", tmp_path / "b.json"])
+    assert total.counts == {"extract.table": 4}
+    assert total.media_bytes == {"extract": 20}
+    assert total.handlers["TableShapeHandler"].calls == 2
+
+
+def test_from_dict_rejects_other_formats() -> None:
+    with pytest.raises(ValueError, match="deckdown-metrics-1"):
+        Metrics.from_dict({"format": "deckdown-bench-1"})
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from deckdown.ast import SlideDoc
+from deckdown.index import SlideIndex, index_path_for
+from deckdown.reader import JsonlReader
+from deckdown.renderers.jsonl import JsonlStream
+
+
+def _doc(idx: int) -> SlideDoc:
+    return SlideDoc.model_validate(
+        {
+            "version": "deckdown-1",
+            "slide": {"index": idx, "size": {"width_emu": 100, "height_emu": 100}, "shapes": []},
+        }
+    )
+
+
+def _write_deck(path: Path, count: int) -> SlideIndex:
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        stream = JsonlStream(fh)
+        for i in range(1, count + 1):
+            stream.write_slide(_doc(i), styles={"abcd1234": {"bold": True}} if i == 2 else None)
+        index = stream.close()
+    index_path_for(path).write_text(index.to_json(), encoding="utf-8")
+    return index
+
+
+def test_jsonl_stream_writes_one_compact_doc_per_line(tmp_path: Path) -> None:
+    path = tmp_path / "deck.jsonl"
+    index = _write_deck(path, 3)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+
+    # slide 2 is preceded by its style-table record
+    assert len(lines) == 4
+    assert lines[1].startswith('{"styles"')
+    assert SlideDoc.model_validate_json(lines[0]) == _doc(1)
+    assert index.size == path.stat().st_size
+    assert sorted(index.slides) == [1, 2, 3]
+
+
+def test_open_seeks_to_one_slide_without_decoding_others(tmp_path: Path) -> None:
+    path = tmp_path / "deck.jsonl"
+    index = _write_deck(path, 3)
+    # corrupt slide 1 in place (same length): only a read of slide 1 would notice
+    raw = bytearray(path.read_bytes())
+    raw[index.slides[1].offset] = ord("[")
+    path.write_bytes(bytes(raw))
+
+    with JsonlReader().open(path) as deck:
+        assert len(deck) == 3
+        assert deck.slide(3).slide.index == 3
+        with pytest.raises(ValueError):
+            deck.slide(1)
+        with pytest.raises(KeyError):
+            deck.slide(9)
+
+
+def test_open_rebuilds_missing_index(tmp_path: Path) -> None:
+    path = tmp_path / "deck.jsonl"
+    written = _write_deck(path, 3)
+    index_path_for(path).unlink()
+
+    with JsonlReader().open(path) as deck:
+        assert deck.index.slides == written.slides
+        assert [d.slide.index for d in deck.iter_slides()] == [1, 2, 3]
+
+
+def test_iter_file_matches_random_access(tmp_path: Path) -> None:
+    path = tmp_path / "deck.jsonl"
+    _write_deck(path, 3)
+
+    streamed = list(JsonlReader().iter_file(path))
+    with JsonlReader().open(path) as deck:
+        assert streamed == [deck.slide(i) for i in (1, 2, 3)]
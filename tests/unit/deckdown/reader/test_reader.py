@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from deckdown.reader import MarkdownReader
+
+BLOCK = (
+    '```json\n{{"version": "deckdown-1", "slide": {{"index": {idx}, '
+    '"size": {{"width_emu": 100, "height_emu": 100}}, "shapes": []}}}}\n```\n'
+)
+
+
+def test_iter_blocks_accepts_text_or_file_handle() -> None:
+    text = "# t\n\n" + BLOCK.format(idx=1) + "prose\n" + BLOCK.format(idx=2)
+    reader = MarkdownReader()
+
+    from_text = list(reader.iter_blocks(text))
+    from_handle = list(reader.iter_blocks(io.StringIO(text)))
+
+    assert from_text == from_handle
+    assert len(from_text) == 2
+
+
+def test_iter_file_is_lazy(tmp_path: Path) -> None:
+    md = tmp_path / "deck.md"
+    md.write_text(BLOCK.format(idx=1) + "```json\n{not json\n```\n", encoding="utf-8")
+
+    docs = MarkdownReader().iter_file(md)
+
+    # the first slide is available before the broken second block is reached
+    assert next(docs).slide.index == 1
+    with pytest.raises(ValueError):
+        next(docs)
+
+
+def test_iter_file_skips_unselected_blocks_without_decoding(tmp_path: Path) -> None:
+    from deckdown.utils.slide_range import SlideRange
+
+    md = tmp_path / "deck.md"
+    # slide 2 is not valid JSON, but it is never decoded when it is not selected
+    broken = '```json\n{"version": "deckdown-1", "slide": {"index": 2, oops\n```\n'
+    md.write_text(BLOCK.format(idx=1) + broken + BLOCK.format(idx=3), encoding="utf-8")
+
+    docs = MarkdownReader().load_file(md, SlideRange.parse("1,3"))
+
+    assert [d.slide.index for d in docs] == [1, 3]
+
+
+def test_indexed_reads_follow_the_sidecar_and_rebuild_when_stale(tmp_path: Path) -> None:
+    import os
+
+    from deckdown.index import SlideIndex, index_path_for
+    from deckdown.utils.slide_range import SlideRange
+
+    md = tmp_path / "deck.md"
+    md.write_text("# t\n\n" + "".join(BLOCK.format(idx=i) for i in range(1, 6)), encoding="utf-8")
+    reader = MarkdownReader()
+    index = reader.write_index(md)
+
+    assert sorted(index.slides) == [1, 2, 3, 4, 5]
+    with reader.open(md) as deck:
+        assert deck.slide(4).slide.index == 4
+
+    # grow the deck: size and mtime no longer match, so the sidecar is rebuilt
+    with md.open("a", encoding="utf-8") as fh:
+        fh.write(BLOCK.format(idx=6))
+    os.utime(md, ns=(index.mtime_ns + 10**9, index.mtime_ns + 10**9))
+    docs = reader.load_file(md, SlideRange.parse("2,6"))
+
+    assert [d.slide.index for d in docs] == [2, 6]
+    refreshed = SlideIndex.load(index_path_for(md))
+    assert refreshed is not None and refreshed.is_current(md) and 6 in refreshed.slides
+
+
+def test_indexed_reads_rebuild_when_a_record_no_longer_matches(tmp_path: Path) -> None:
+    import os
+
+    from deckdown.index import SlideIndex, index_path_for
+
+    md = tmp_path / "deck.md"
+    md.write_text("".join(BLOCK.format(idx=i) for i in (1, 2, 3)), encoding="utf-8")
+    reader = MarkdownReader()
+    index = reader.write_index(md)
+
+    # same size and mtime, different bytes: the sidecar still looks current
+    md.write_text("".join(BLOCK.format(idx=i) for i in (3, 2, 1)), encoding="utf-8")
+    os.utime(md, ns=(index.mtime_ns, index.mtime_ns))
+    assert index.is_current(md)
+
+    with reader.open(md) as deck:
+        first = deck.slide(1)
+        assert deck.line_of(1) == 8
+
+    assert first.slide.index == 1
+    refreshed = SlideIndex.load(index_path_for(md))
+    assert refreshed is not None and refreshed.slides[1] != index.slides[1]
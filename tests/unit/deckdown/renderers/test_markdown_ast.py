@@ -98,3 +98,25 @@ def test_renderer_accepts_plain_dict_ast_for_compatibility() -> None:
     md = MarkdownRenderer().render(deck, ast_per_slide=ast)
 
     assert '"version": "deckdown-1"' in md
+
+
+def test_stream_writes_each_slide_identically_to_render() -> None:
+    import io
+
+    slides = (
+        Slide(index=1, title="T", text_blocks=(TextBlock(text="A"),)),
+        Slide(index=2, title=None),
+    )
+    deck = Deck(file="s.pptx", title=None, slides=slides)
+    doc = _make_slide_doc()
+    renderer = MarkdownRenderer()
+
+    buf = io.StringIO()
+    stream = renderer.stream(buf, heading="s")
+    stream.write_slide(slides[0], doc)
+    # the first slide is flushed before the second is produced
+    assert buf.getvalue().endswith("```")
+    stream.write_slide(slides[1])
+    stream.close()
+
+    assert buf.getvalue() == renderer.render(deck, ast_per_slide={1: doc})
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from deckdown.cache import SlideCache
+from deckdown.cli import EXIT_OK, main
+from deckdown.pipeline import extract_markdown
+from deckdown.reader import MarkdownReader
+from deckdown.styles import StyleTable
+
+
+def _make_styled_deck(path: Path, *, slides: int = 3, rows: int = 6) -> None:
+    from pptx import Presentation
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches, Pt
+
+    prs = Presentation()
+    for i in range(slides):
+        s = prs.slides.add_slide(prs.slide_layouts[6])
+        tbl = s.shapes.add_table(rows, 2, Inches(1), Inches(1), Inches(6), Inches(3)).table
+        for r in range(rows):
+            for c in range(2):
+                run = tbl.cell(r, c).text_frame.paragraphs[0].add_run()
+                run.text = f"{i}:{r}:{c}"
+                run.font.size = Pt(10)
+                run.font.bold = r == 0
+                run.font.color.rgb = RGBColor(0x1F, 0x4E, 0x79)
+    prs.save(str(path))
+
+
+def _runs(docs: list) -> list:  # noqa: ANN401
+    return [
+        (run.text, run.font)
+        for d in docs
+        for sh in d.slide.shapes
+        for cell in sh.table.cells
+        for p in cell.text.paras
+        for run in p.runs
+    ]
+
+
+def test_add_font_keys_by_content() -> None:
+    table = StyleTable()
+    a = table.add_font({"size_pt": 10.0, "bold": True})
+    b = table.add_font({"bold": True, "size_pt": 10.0})
+    c = table.add_font({"size_pt": 10.0})
+
+    assert a == b != c
+    assert StyleTable().add_font({"size_pt": 10.0, "bold": True}) == a
+    assert table.drain_new() == {a: {"size_pt": 10.0, "bold": True}, c: {"size_pt": 10.0}}
+    assert table.drain_new() == {}
+
+
+def test_compact_styles_resolve_to_full_fonts(tmp_path: Path) -> None:
+    pptx = tmp_path / "styled.pptx"
+    _make_styled_deck(pptx)
+    full = tmp_path / "full.md"
+    compact = tmp_path / "compact.md"
+
+    assert main(["extract", str(pptx), "--md-out", str(full)]) == EXIT_OK
+    assert main(["extract", str(pptx), "--md-out", str(compact), "--compact-styles"]) == EXIT_OK
+
+    text = compact.read_text(encoding="utf-8")
+    # two distinct fonts (header and body), each written once for the whole deck
+    assert text.count("```json deckdown-styles") == 1
+    assert text.count('"size_pt"') == 2
+    assert len(text) < len(full.read_text(encoding="utf-8"))
+
+    docs = MarkdownReader().load_file(compact)
+    expected = MarkdownReader().load_file(full)
+    run = docs[0].slide.shapes[0].table.cells[0].text.paras[0].runs[0]
+    assert run.style and run.font.bold is True
+    assert _runs(docs) == _runs(expected)
+
+    html_out = tmp_path / "p.html"
+    assert main(["preview", str(compact), "-o", str(html_out)]) == EXIT_OK
+    assert main(["assemble", str(compact), "-o", str(tmp_path / "round.pptx")]) == EXIT_OK
+
+
+def test_compact_styles_parallel_and_cached_match_serial(tmp_path: Path) -> None:
+    pptx = tmp_path / "styled.pptx"
+    _make_styled_deck(pptx, slides=5)
+    serial = tmp_path / "serial.md"
+    parallel = tmp_path / "parallel.md"
+
+    args = ["--compact-styles"]
+    assert main(["extract", str(pptx), "--md-out", str(serial), *args]) == EXIT_OK
+    assert main(["extract", str(pptx), "--md-out", str(parallel), "--jobs", "2", *args]) == EXIT_OK
+    text = serial.read_text(encoding="utf-8")
+    assert parallel.read_text(encoding="utf-8") == text
+
+    extract_markdown(
+        pptx, output_path=serial, compact_styles=True, cache=SlideCache(tmp_path / "c")
+    )
+    cache = SlideCache(tmp_path / "c")
+    assert extract_markdown(pptx, output_path=serial, compact_styles=True, cache=cache) == text
+    assert cache.hits == 5
+
+
+def test_run_serialization_omits_unset_style() -> None:
+    from deckdown.ast import FontSpec, TextRun
+
+    plain = TextRun(text="a", font=FontSpec(bold=True))
+    styled = StyleTable().run("b", {"bold": True})
+
+    assert "style" not in plain.model_dump()
+    assert json.loads(styled.model_dump_json()) == {
+        "text": "b",
+        "font": None,
+        "style": styled.style,
+    }
+    assert TextRun.model_validate_json(styled.model_dump_json()) == styled
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import pstats
+from pathlib import Path
+
+from deckdown import trace
+from deckdown.trace import phase, span, tracing
+
+
+def test_spans_are_no_ops_without_an_active_tracer() -> None:
+    with span("x", "handler"), phase("walk", slide=1):
+        pass
+    assert trace._ACTIVE is None
+
+
+def test_nested_spans_become_complete_events(tmp_path: Path) -> None:
+    out = tmp_path / "trace.json"
+
+    with tracing(out) as tracer:
+        with phase("walk", slide=2), span("TextShapeHandler", "handler"):
+            pass
+        assert trace._ACTIVE is tracer
+    assert trace._ACTIVE is None
+
+    events = json.loads(out.read_text(encoding="utf-8"))["traceEvents"]
+    inner, outer = (e for e in events if e["ph"] == "X")
+    assert (outer["name"], outer["cat"], outer["args"]) == ("walk", "phase", {"slide": 2})
+    assert (inner["name"], inner["cat"]) == ("TextShapeHandler", "handler")
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_profiles_are_dumped_per_phase(tmp_path: Path) -> None:
+    with tracing(profile_dir=tmp_path), phase("load"):
+        with phase("walk"):
+            sorted(range(1000))
+        with phase("walk"):
+            sorted(range(1000))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["load.prof", "walk.prof"]
+    stats = pstats.Stats(str(tmp_path / "walk.prof")).stats  # type: ignore[attr-defined]
+    calls = [v[1] for (_, _, fn), v in stats.items() if fn == "<built-in method builtins.sorted>"]
+    assert calls == [2]
@@ -45,3 +45,9 @@ class TestSlideRange:
         # Arrange/Act/Assert
         with pytest.raises(ValueError):
             _ = SlideRange.from_iterable([1, -1, 2])
+
+    def test_contains_matches_membership_for_sparse_ranges(self) -> None:
+        # Arrange
+        sr = SlideRange.parse("1-5,12,40-42")
+        # Act/Assert
+        assert [i for i in range(1, 50) if sr.contains(i)] == [1, 2, 3, 4, 5, 12, 40, 41, 42]
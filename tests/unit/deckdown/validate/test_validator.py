@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from deckdown.validate import Block, MarkdownValidator, ValidationCache
+
+_BBOX = (
+    '{"x_emu": 0, "y_emu": 0, "w_emu": 1, "h_emu": 1,'
+    ' "x_norm": 0, "y_norm": 0, "w_norm": 0, "h_norm": 0}'
+)
+
+
+def _block(idx: int, shape: str = "") -> str:
+    return (
+        "```json\n"
+        "{\n"
+        '  "version": "deckdown-1",\n'
+        f'  "slide": {{"index": {idx}, "size": {{"width_emu": 10, "height_emu": 10}},\n'
+        f'    "shapes": [{shape}]}}\n'
+        "}\n"
+        "```\n"
+    )
+
+
+def _group(children: str) -> str:
+    return (
+        f'\n      {{"id": "g", "kind": "group", "bbox": {_BBOX}, "z": 0, "children": {children}}}'
+    )
+
+
+def test_errors_point_at_the_offending_value(tmp_path: Path) -> None:
+    md = tmp_path / "deck.md"
+    md.write_text("# t\n\n" + _block(1) + _block(2, _group('"oops"')), encoding="utf-8")
+
+    errs = MarkdownValidator().validate_file(md)
+
+    lines = md.read_text(encoding="utf-8").splitlines()
+    line_no = next(i for i, ln in enumerate(lines, start=1) if '"oops"' in ln)
+    assert len(errs) == 1
+    assert errs[0].startswith(f"{md}:{line_no}:")
+    col = int(errs[0].split(":")[2])
+    assert lines[line_no - 1][col - 1 :].startswith('"oops"')
+    assert "block 2: schema error at slide.shapes.0.group.children" in errs[0]
+
+
+def test_invalid_json_is_located(tmp_path: Path) -> None:
+    md = tmp_path / "deck.md"
+    md.write_text('# t\n\n```json\n{\n  "version": ,\n}\n```\n', encoding="utf-8")
+
+    errs = MarkdownValidator().validate_file(md)
+
+    assert len(errs) == 1 and errs[0].startswith(f"{md}:5:") and "invalid JSON" in errs[0]
+
+
+def test_parallel_matches_serial_and_fail_fast_stops_early(tmp_path: Path) -> None:
+    decks = []
+    for n in range(2):
+        md = tmp_path / f"deck{n}.md"
+        blocks = [_block(i, _group('"x"') if i % 3 == 0 else "") for i in range(1, 10)]
+        md.write_text("# t\n\n" + "".join(blocks), encoding="utf-8")
+        decks.append(md)
+
+    serial = MarkdownValidator().validate_files(decks)
+    parallel = MarkdownValidator(jobs=2).validate_files(decks)
+    first = MarkdownValidator(jobs=2, fail_fast=True).validate_files(decks)
+
+    assert len(serial) == 6
+    assert parallel == serial
+    assert first == serial[:1]
+
+
+def test_cache_skips_blocks_that_passed(tmp_path: Path) -> None:
+    md = tmp_path / "deck.md"
+    md.write_text("# t\n\n" + _block(1) + _block(2, _group('"x"')), encoding="utf-8")
+    cache = ValidationCache(tmp_path / "cache")
+
+    assert len(MarkdownValidator(cache=cache).validate_file(md)) == 1
+
+    # only the passing block was recorded; a fresh cache object reads it back
+    reloaded = ValidationCache(tmp_path / "cache")
+    assert len(cache.path.read_text(encoding="utf-8").split()) == 1
+    validated: list[int] = []
+
+    class Counting(MarkdownValidator):
+        def check_block(self, block: Block) -> list[str]:
+            validated.append(block[1])
+            return super().check_block(block)
+
+    assert len(Counting(cache=reloaded).validate_file(md)) == 1
+    assert validated == [2]